@@ -0,0 +1,157 @@
+"""
+HTTP API 클라이언트 (테스트 사전 데이터 생성 / 정리용)
+- UI 를 거치지 않고 채팅 생성 / 이름 변경 / 목록 / 삭제, 에이전트 목록 / 삭제를 HTTP 로 직접 호출 → 준비 시간 ms 단위
+- requests.Session 1개를 재사용 (HTTPAdapter 커넥션 풀, 일시적 5xx 재시도 - 멱등 메서드만, POST 는 중복 생성 방지를 위해 재시도 안 함)
+- 인증은 로그인된 브라우저의 쿠키를 그대로 사용 (CDP Network.getAllCookies → HttpOnly 쿠키 포함)
+    - 첫 요청 전에 브라우저 쿠키를 가져오고, 401 이면 한 번 다시 가져와서 재시도
+- 여러 스레드에서 동시에 호출 가능 (대량 생성 / 정리, 쿠키 동기화는 한 번에 한 스레드만)
+- 기본 경로는 스탠드인 서버(/api/chats) 기준, 실제 서비스는 API_BASE_URL / API_CHATS_PATH 로 지정
+
+사용 예:
+    api = ApiClient().bind(driver)          # driver 는 로그인된 상태
+    chat = api.create_chat("테스트 대화")
+    api.rename_chat(chat["id"], "새 이름")
+    api.delete_chat(chat["id"])
+"""
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.config.settings import API_BASE_URL, API_CHATS_PATH, API_AGENTS_PATH, API_TIMEOUT, API_POOL_SIZE
+
+
+class ApiClient:
+
+    def __init__(self, base_url=API_BASE_URL, pool_size=API_POOL_SIZE, timeout=API_TIMEOUT):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.driver = None
+        self._synced = False
+        self._sync_lock = threading.Lock()
+
+        self.session = requests.Session()
+        retry = Retry(total=2, backoff_factor=0.2, status_forcelist=(502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        self.session.headers["Accept"] = "application/json"
+
+    # -------------------- 브라우저 인증 공유 --------------------
+
+    def bind(self, driver):
+        """이 브라우저의 로그인 상태로 요청 (쿠키는 첫 요청 시점에 가져옴)"""
+        self.driver = driver
+        self._synced = False
+        self.session.cookies.clear()
+        return self
+
+    def unbind(self):
+        self.driver = None
+        self._synced = False
+        self.session.cookies.clear()
+
+    def sync_cookies(self):
+        """브라우저의 모든 쿠키(HttpOnly 포함)를 세션으로 복사"""
+        if self.driver is None:
+            raise RuntimeError("ApiClient 가 브라우저에 연결되지 않았습니다. bind(driver) 먼저 호출")
+        self.session.cookies.clear()
+        for c in self.driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]:
+            self.session.cookies.set(
+                c["name"], c["value"], domain=c["domain"], path=c.get("path", "/"), secure=c.get("secure", False)
+            )
+        self.session.headers["User-Agent"] = self.driver.execute_script("return navigator.userAgent;")
+        self._synced = True
+
+    def export_cookies(self):
+        """현재 세션 쿠키 → [{name, value, domain, path}] (브라우저가 닫힌 뒤 use_cookies 로 재사용)"""
+        return [{"name": c.name, "value": c.value, "domain": c.domain, "path": c.path} for c in self.session.cookies]
+
+    def use_cookies(self, cookies):
+        """브라우저 없이 저장해 둔 쿠키로 요청"""
+        self.unbind()
+        for c in cookies:
+            self.session.cookies.set(c["name"], c["value"], domain=c["domain"], path=c["path"])
+        return self
+
+    def close(self):
+        self.session.close()
+
+    # -------------------- 공통 요청 --------------------
+
+    def request(self, method, path, **kwargs):
+        """JSON 응답 반환 (본문 없으면 None), 실패 시 requests.HTTPError"""
+        if self.driver is not None and not self._synced:
+            with self._sync_lock:
+                if not self._synced:
+                    self.sync_cookies()
+
+        url = self.base_url + path
+        kwargs.setdefault("timeout", self.timeout)
+        resp = self.session.request(method, url, **kwargs)
+        if resp.status_code == 401 and self.driver is not None:
+            # 로그인 상태가 바뀐 경우 (재로그인 / 토큰 갱신) 쿠키 다시 가져와서 1회 재시도
+            with self._sync_lock:
+                self.sync_cookies()
+            resp = self.session.request(method, url, **kwargs)
+
+        resp.raise_for_status()
+        return resp.json() if resp.content else None
+
+    # -------------------- 채팅 --------------------
+
+    def list_chats(self, q=None, offset=0, limit=50):
+        """최신순 채팅 목록 한 페이지 → (items, total)"""
+        params = {"offset": offset, "limit": limit}
+        if q:
+            params["q"] = q
+        data = self.request("GET", API_CHATS_PATH, params=params)
+        if isinstance(data, list):
+            return data, len(data)
+        return data["items"], data.get("total", len(data["items"]))
+
+    def iter_chats(self, q=None, page_size=100):
+        """전체 채팅을 페이지 단위로 순회"""
+        offset = 0
+        while True:
+            items, total = self.list_chats(q=q, offset=offset, limit=page_size)
+            yield from items
+            offset += len(items)
+            if not items or offset >= total:
+                break
+
+    def get_chat(self, chat_id):
+        return self.request("GET", f"{API_CHATS_PATH}/{chat_id}")
+
+    def create_chat(self, title, created_at=None):
+        """created_at: ISO 8601 문자열 (지정하지 않으면 서버 현재 시각)"""
+        body = {"title": title}
+        if created_at:
+            body["created_at"] = created_at
+        return self.request("POST", API_CHATS_PATH, json=body)
+
+    def rename_chat(self, chat_id, title):
+        return self.request("PATCH", f"{API_CHATS_PATH}/{chat_id}", json={"title": title})
+
+    def delete_chat(self, chat_id, missing_ok=True):
+        """삭제 (이미 없으면 missing_ok=True 일 때 False 반환)"""
+        return self._delete(f"{API_CHATS_PATH}/{chat_id}", missing_ok)
+
+    # -------------------- 커스텀 에이전트 --------------------
+
+    def list_agents(self):
+        data = self.request("GET", API_AGENTS_PATH)
+        return data if isinstance(data, list) else data["items"]
+
+    def delete_agent(self, agent_id, missing_ok=True):
+        return self._delete(f"{API_AGENTS_PATH}/{agent_id}", missing_ok)
+
+    def _delete(self, path, missing_ok):
+        try:
+            self.request("DELETE", path)
+            return True
+        except requests.HTTPError as e:
+            if missing_ok and e.response is not None and e.response.status_code == 404:
+                return False
+            raise
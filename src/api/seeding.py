@@ -0,0 +1,101 @@
+"""
+대량 대화 생성 도구 (사이드바 규모별 성능 측정용)
+- 지정한 개수만큼 대화를 HTTP API 로 동시에 생성 / 삭제 (ApiClient 커넥션 풀 공유)
+- 제목: "{prefix} {번호:05d}" (번호 1 = 가장 오래된 대화), keyword_every 마다 검색 키워드 포함
+- 날짜: start(기본 현재 시각)에서 spacing 간격으로 과거로 배치 → 목록 정렬 순서가 고정됨
+
+테스트에서:
+    seeded = seed_chats(api, 1000, prefix="[scale]")
+    ...
+    delete_chats(api, [c["id"] for c in seeded])
+
+명령줄 (브라우저 없이 쿠키 직접 지정):
+    python -m src.api.seeding --count 1000 --cookie stand_in_session=<토큰>
+    python -m src.api.seeding --clear "[scale]" --cookie stand_in_session=<토큰>
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+from src.config.settings import API_POOL_SIZE
+
+SEED_PREFIX = "[seed]"
+SEED_KEYWORD = "검색대상"
+
+
+def seed_titles(count, prefix=SEED_PREFIX, keyword=SEED_KEYWORD, keyword_every=10):
+    """번호 순 제목 리스트 (keyword_every 번째마다 keyword 포함, 0 이면 포함 안 함)"""
+    titles = []
+    for i in range(1, count + 1):
+        title = f"{prefix} {i:05d}"
+        if keyword_every and i % keyword_every == 0:
+            title += f" {keyword}"
+        titles.append(title)
+    return titles
+
+
+def seed_dates(count, start=None, spacing=timedelta(minutes=1)):
+    """생성 시각 리스트 (ISO 8601, UTC) - 마지막 항목이 start, 앞 항목일수록 과거"""
+    start = start or datetime.now(timezone.utc)
+    return [(start - spacing * (count - 1 - i)).isoformat() for i in range(count)]
+
+
+def seed_chats(api, count, prefix=SEED_PREFIX, start=None, spacing=timedelta(minutes=1),
+               keyword=SEED_KEYWORD, keyword_every=10, workers=API_POOL_SIZE):
+    """대화 count 개를 동시에 생성 → 생성된 대화 리스트 (번호 순)"""
+    titles = seed_titles(count, prefix, keyword, keyword_every)
+    dates = seed_dates(count, start, spacing)
+
+    begin = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        chats = list(pool.map(api.create_chat, titles, dates))
+    print(f"[seed] 대화 {count}개 생성 {time.perf_counter() - begin:.1f}s (동시 {workers})")
+    return chats
+
+
+def delete_chats(api, chat_ids, workers=API_POOL_SIZE):
+    """대화 동시 삭제 → 실제로 삭제된 개수 (이미 없는 대화는 제외)"""
+    begin = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        deleted = sum(pool.map(api.delete_chat, chat_ids))
+    print(f"[seed] 대화 {deleted}개 삭제 {time.perf_counter() - begin:.1f}s (동시 {workers})")
+    return deleted
+
+
+def clear_seeded(api, prefix=SEED_PREFIX, workers=API_POOL_SIZE):
+    """제목이 prefix 로 시작하는 대화 전부 삭제 (이전 실행에서 남은 데이터 정리)"""
+    ids = [c["id"] for c in api.iter_chats(q=prefix) if c["title"].startswith(prefix)]
+    return delete_chats(api, ids, workers) if ids else 0
+
+
+def main(argv=None):
+    from src.api.client import ApiClient
+
+    parser = argparse.ArgumentParser(description="HTTP API 로 대화 대량 생성 / 정리")
+    parser.add_argument("--count", type=int, default=100, help="생성할 대화 수")
+    parser.add_argument("--prefix", default=SEED_PREFIX, help="제목 접두어 (정리할 때도 사용)")
+    parser.add_argument("--spacing", type=float, default=60, help="대화 간 생성 시각 간격(초)")
+    parser.add_argument("--keyword-every", type=int, default=10, help=f"N 번째마다 '{SEED_KEYWORD}' 포함")
+    parser.add_argument("--workers", type=int, default=API_POOL_SIZE, help="동시 요청 수")
+    parser.add_argument("--cookie", action="append", default=[], help="인증 쿠키 name=value (여러 번 지정 가능)")
+    parser.add_argument("--clear", metavar="PREFIX", help="생성 대신 제목이 PREFIX 로 시작하는 대화 삭제")
+    args = parser.parse_args(argv)
+
+    api = ApiClient(pool_size=args.workers)
+    for cookie in args.cookie:
+        name, _, value = cookie.partition("=")
+        api.session.cookies.set(name, value)
+
+    try:
+        if args.clear:
+            clear_seeded(api, args.clear, args.workers)
+        else:
+            seed_chats(api, args.count, args.prefix, spacing=timedelta(seconds=args.spacing),
+                       keyword_every=args.keyword_every, workers=args.workers)
+    finally:
+        api.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,39 @@
 import os
+from urllib.parse import urlsplit, quote
 from dotenv import load_dotenv
 
 load_dotenv()
 
 # 기본 설정
 BASE_URL = os.getenv("BASE_URL", "https://qaproject.elice.io/ai-helpy-chat")
+
+# BASE_URL 이 localhost 이면 로컬 스탠드인 서버(tests/stand_in) 모드
+#   예) BASE_URL=http://127.0.0.1:8765/ai-helpy-chat
+_base = urlsplit(BASE_URL)
+APP_ORIGIN = f"{_base.scheme}://{_base.netloc}"
+IS_STAND_IN = _base.hostname in ("localhost", "127.0.0.1")
+
+# 로그인(accounts) 서버 - 스탠드인 모드에서는 같은 서버가 로그인 페이지도 제공
+ACCOUNTS_URL = os.getenv("ACCOUNTS_URL", APP_ORIGIN if IS_STAND_IN else "https://accounts.elice.io")
+SIGNIN_URL = f"{ACCOUNTS_URL}/accounts/signin/me?continue_to={quote(BASE_URL, safe='')}"
+CUSTOM_AGENT_URL = f"{BASE_URL}/custom-agent"
+PAYMENTS_URL = os.getenv("PAYMENTS_URL", "https://payments.elice.io")   # 결제 내역(외부 서비스) - 스탠드인 미지원
 DEFAULT_TIMEOUT = int(os.getenv("TIMEOUT", "10"))
 HEADLESS = os.getenv("HEADLESS", "0") == "1"
 
+# BasePage 대기 방식: polling(WebDriverWait 500ms 폴링, 기본) / observer(페이지 내 MutationObserver, 선택)
+WAIT_BACKEND = os.getenv("WAIT_BACKEND", "polling")
+
+# HTTP API (테스트 사전 데이터 생성 / 정리용, src/api)
+# - 기본 경로는 스탠드인 서버(tests/stand_in) 기준이라 스탠드인 모드에서만 기본으로 켬
+# - 실제 서비스에서 쓰려면 API_ENABLED=1 + API_BASE_URL / API_CHATS_PATH / API_AGENTS_PATH 를 실제 경로로 지정
+API_ENABLED = os.getenv("API_ENABLED", "1" if IS_STAND_IN else "0") == "1"
+API_BASE_URL = os.getenv("API_BASE_URL", f"{APP_ORIGIN}/api")
+API_CHATS_PATH = os.getenv("API_CHATS_PATH", "/chats")
+API_AGENTS_PATH = os.getenv("API_AGENTS_PATH", "/agents")
+API_TIMEOUT = float(os.getenv("API_TIMEOUT", "10"))
+API_POOL_SIZE = int(os.getenv("API_POOL_SIZE", "10"))
+
 # ========================================
 # 관리자 계정 설정                          ------(11/13 황지애 추가)
 # ========================================
@@ -22,27 +48,35 @@ class AdminAccount:
     def __repr__(self):
         return f"<Admin: {self.username}>"
 
+def _stand_in_default(value):
+    # 스탠드인 서버는 아무 계정이나 받아주므로 .env 없이도 실행되도록 기본값 제공
+    return value if IS_STAND_IN else None
+
 # 관리자 계정 정의
 ADMIN1 = AdminAccount(
-    username=os.getenv("ADMIN1_USERNAME"),
-    password=os.getenv("ADMIN1_PASSWORD"),
+    username=os.getenv("ADMIN1_USERNAME", _stand_in_default("admin1@stand-in.local")),
+    password=os.getenv("ADMIN1_PASSWORD", _stand_in_default("stand-in")),
     description="관리자 1"
 )
 
 ADMIN2 = AdminAccount(
-    username=os.getenv("ADMIN2_USERNAME"),
-    password=os.getenv("ADMIN2_PASSWORD"),
+    username=os.getenv("ADMIN2_USERNAME", _stand_in_default("admin2@stand-in.local")),
+    password=os.getenv("ADMIN2_PASSWORD", _stand_in_default("stand-in")),
     description="관리자 2"
 )
 
 ADMIN3 = AdminAccount(
-    username=os.getenv("ADMIN3_USERNAME"),
-    password=os.getenv("ADMIN3_PASSWORD"),
+    username=os.getenv("ADMIN3_USERNAME", _stand_in_default("admin3@stand-in.local")),
+    password=os.getenv("ADMIN3_PASSWORD", _stand_in_default("stand-in")),
     description="관리자 3"
 )
 
 ALL_ADMINS = [ADMIN1, ADMIN2, ADMIN3]
 
+def get_usable_admins():
+    """아이디/비밀번호가 모두 설정된 관리자 계정 목록 (병렬 실행 워커 수 상한)"""
+    return [a for a in ALL_ADMINS if a.username and a.password]
+
 def get_default_admin():
     """
     기본 관리자 계정 반환
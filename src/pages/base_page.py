@@ -3,16 +3,221 @@ import time
 import pytest
 
 # 서드파티 라이브러리
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException
+from src.utils.lazy_selenium import By, WebDriverWait, EC
+from selenium.common.exceptions import (TimeoutException, JavascriptException, NoSuchElementException,
+    StaleElementReferenceException,
+)
+
+# 로컬/프로젝트 모듈
+from src.config.settings import WAIT_BACKEND, CUSTOM_AGENT_URL
+from src.utils.cdp_metrics import checkpoint
+from src.utils.locator_stats import locator_stats
+
+# MutationObserver 대기에서 지원하는 locator 종류 (나머지는 WebDriverWait 폴링)
+_OBSERVABLE_BY = (By.CSS_SELECTOR, By.XPATH, By.ID, By.NAME, By.TAG_NAME, By.CLASS_NAME)
+
+# 페이지 안에서 DOM 변경을 감지해 조건이 맞는 즉시 결과를 돌려주는 스크립트 (공통 함수)
+# - match(by, value, mode, previous)
+#   - visible / clickable: 첫 번째 일치 요소 기준 (EC.visibility_of_element_located / element_to_be_clickable 과 동일)
+#   - all: 일치 요소가 1개 이상이면 전체 리스트
+#   - count: 일치 요소 개수가 previous 와 달라지면 {elements: 전체 리스트} (0개로 줄어든 경우 포함)
+# - watch(check, timeoutMs, done): check() 가 값을 돌려줄 때까지 DOM 변경마다 재검사
+#   CSS transition 처럼 DOM 변경 없이 보이게 되는 경우를 위해 50ms 보조 체크도 함께 사용
+_LOCATE_JS = """
+function find(by, value) {
+    switch (by) {
+        case 'css selector': return Array.from(document.querySelectorAll(value));
+        case 'id': { const el = document.getElementById(value); return el ? [el] : []; }
+        case 'name': return Array.from(document.getElementsByName(value));
+        case 'tag name': return Array.from(document.getElementsByTagName(value));
+        case 'class name': return Array.from(document.getElementsByClassName(value));
+        case 'xpath': {
+            const snap = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const out = [];
+            for (let i = 0; i < snap.snapshotLength; i++) out.push(snap.snapshotItem(i));
+            return out;
+        }
+    }
+    return [];
+}
+
+function visible(el) {
+    if (!el.isConnected) return false;
+    const s = getComputedStyle(el);
+    if (s.display === 'none' || s.visibility === 'hidden' || s.visibility === 'collapse') return false;
+    if (parseFloat(s.opacity) === 0) return false;
+    const r = el.getBoundingClientRect();
+    return r.width > 0 && r.height > 0;
+}
+
+function match(by, value, mode, previous) {
+    const found = find(by, value);
+    if (mode === 'all') return found.length ? found : null;
+    if (mode === 'count') return found.length !== previous ? { elements: found } : null;
+    const el = found[0];
+    if (!el || !visible(el)) return null;
+    if (mode === 'clickable' && el.disabled) return null;
+    return el;
+}
+
+function watch(check, timeoutMs, done) {
+    let finished = false;
+    let observer = null, ticker = null, timer = null;
+    function finish(result) {
+        if (finished) return;
+        finished = true;
+        if (observer) observer.disconnect();
+        clearInterval(ticker);
+        clearTimeout(timer);
+        done(result);
+    }
+
+    const first = check();
+    if (first) {
+        finish(first);
+    } else {
+        observer = new MutationObserver(() => { const r = check(); if (r) finish(r); });
+        observer.observe(document, { childList: true, subtree: true, attributes: true, characterData: true });
+        ticker = setInterval(() => { const r = check(); if (r) finish(r); }, 50);
+        timer = setTimeout(() => finish(null), timeoutMs);
+    }
+}
+"""
+
+# locator 1개 대기
+_OBSERVE_JS = _LOCATE_JS + """
+const [by, value, mode, timeoutMs, previous] = arguments;
+watch(() => match(by, value, mode, previous), timeoutMs, arguments[arguments.length - 1]);
+"""
+# 여러 locator 중 먼저 조건을 만족하는 것 → {index, result} (같은 시점에 여러 개면 기본 locator(primary), 그다음 목록 앞쪽 우선)
+_RACE_JS = _LOCATE_JS + """
+const [locators, primary, mode, timeoutMs] = arguments;
+watch(() => {
+    for (let i = 0; i < locators.length; i++) {
+        const result = match(locators[i][0], locators[i][1], mode);
+        if (!result) continue;
+        // 대체 locator 가 먼저 찾아져도 같은 검사에서 기본 locator 도 맞으면 기본 locator 가 이긴 것으로 처리
+        const own = i === primary ? null : match(locators[primary][0], locators[primary][1], mode);
+        return own ? { index: primary, result: own } : { index: i, result: result };
+    }
+    return null;
+}, timeoutMs, arguments[arguments.length - 1]);
+"""
+
+# 화면 안정화 대기 (root 없으면 document.body)
+# - dom: root 하위 DOM 변경이 quietMs 동안 없으면 true
+# - animation: root 하위의 진행 중인 CSS 애니메이션/트랜지션(Web Animations API)이 모두 끝나면 true
+#   (무한 반복 애니메이션 = 로딩 스피너 등은 제외)
+# 시간 초과 시 false
+_SETTLE_JS = """
+const [root, mode, quietMs, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const target = root || document.body;
+
+let finished = false;
+let observer = null, quiet = null, timer = null;
+function finish(ok) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    clearTimeout(quiet);
+    clearTimeout(timer);
+    done(ok);
+}
+timer = setTimeout(() => finish(false), timeoutMs);
+
+if (mode === 'dom') {
+    const arm = () => { clearTimeout(quiet); quiet = setTimeout(() => finish(true), quietMs); };
+    observer = new MutationObserver(arm);
+    observer.observe(target, { childList: true, subtree: true, attributes: true, characterData: true });
+    arm();
+} else {
+    const running = () => (target.getAnimations ? target.getAnimations({ subtree: true }) : []).filter(a =>
+        a.playState !== 'finished' && a.playState !== 'idle' &&
+        !(a.effect && a.effect.getComputedTiming().iterations === Infinity));
+    const step = () => {
+        if (finished) return;
+        const active = running();
+        if (!active.length) { finish(true); return; }
+        Promise.all(active.map(a => a.finished.catch(() => null))).then(() => requestAnimationFrame(step));
+    };
+    step();
+}
+"""
+
+# 가상 목록 스크롤 1단계: 스크롤 → 목록 DOM 변경이 quietMs 동안 없을 때까지 대기 → 현재 렌더링된 항목 반환
+# - 실제 스크롤 컨테이너는 목록의 가장 가까운 스크롤 가능한 조상 (virtuoso-scroller)
+_SCROLL_QUIET_MS = 150
+
+_SCROLL_STEP_JS = """
+const [list, mode, quietMs, maxMs, done] = arguments;
+
+let scroller = list;
+for (let el = list; el; el = el.parentElement) {
+    const oy = getComputedStyle(el).overflowY;
+    if ((oy === 'auto' || oy === 'scroll') && el.scrollHeight > el.clientHeight) { scroller = el; break; }
+}
+
+if (mode === 'top') scroller.scrollTop = 0;
+else if (mode === 'end') scroller.scrollTop = scroller.scrollHeight;
+else scroller.scrollTop = scroller.scrollTop + scroller.clientHeight;
+
+let last = performance.now();
+const start = last;
+const observer = new MutationObserver(() => { last = performance.now(); });
+observer.observe(list, { childList: true, subtree: true, characterData: true });
+
+(function tick() {
+    const now = performance.now();
+    if (now - last < quietMs && now - start < maxMs) { setTimeout(tick, 16); return; }
+    observer.disconnect();
+    done({
+        items: Array.from(list.querySelectorAll('a')).map(a => ({
+            href: a.getAttribute('href'),
+            title: (a.innerText || '').trim(),
+        })),
+        atEnd: Math.ceil(scroller.scrollTop + scroller.clientHeight) >= scroller.scrollHeight - 1,
+        height: scroller.scrollHeight,
+    });
+})();
+"""
+
+# 사이드바 대화 항목(현재 렌더링된 a 태그) 전체를 한 번에 레코드로 변환
+# - index: 가상 목록 전체 기준 위치 (data-index, 없으면 렌더링 순서)
+# - ellipsis: 제목에 CSS ellipsis 적용 여부 (text-overflow: ellipsis + overflow hidden/clip)
+# - truncated: 제목이 실제로 잘려서 표시되는지 (scrollWidth > clientWidth)
+_CHAT_RECORDS_JS = """
+const list = arguments[0];
+return Array.from(list.querySelectorAll('a')).map((a, i) => {
+    const title = a.querySelector('p.MuiTypography-root') || a;
+    const style = getComputedStyle(title);
+    const icon = a.querySelector("button.MuiIconButton-root svg[data-testid='ellipsis-verticalIcon']");
+    const row = a.closest('[data-index]');
+    return {
+        index: row ? Number(row.dataset.index) : i,
+        title: (title.innerText || title.textContent || '').trim(),
+        href: a.getAttribute('href'),
+        ellipsis: style.textOverflow === 'ellipsis' && ['hidden', 'clip'].includes(style.overflowX),
+        truncated: title.scrollWidth > title.clientWidth,
+        element: a,
+        menu_button: icon ? icon.closest('button') : null,
+    };
+});
+"""
+
+# 폴링 방식에서 사용하는 조건 (selenium 은 처음 폴링할 때 로드되도록 호출 시점에 조회)
+_POLL_CONDITIONS = {
+    "visible": lambda locator: EC.visibility_of_element_located(locator),
+    "clickable": lambda locator: EC.element_to_be_clickable(locator),
+    "all": lambda locator: (lambda d: d.find_elements(*locator) or False),
+}
 
 class BasePage:
 
     def __init__(self, driver, timeout=15):
         self.driver = driver
         self.timeout = timeout
+        self._script_timeout = None
         # 모든 페이지에서 공통으로 사용하는 기본 페이지 클래스
 
     def open(self, url):
@@ -20,23 +225,152 @@ class BasePage:
         # 웹 페이지 열기
 
     def wait_for_clickable(self, locator, timeout=30):
-        return WebDriverWait(self.driver, timeout).until(
-            EC.element_to_be_clickable(locator)
-        )
+        return self._wait(locator, "clickable", timeout)
 
     def wait_for_element(self, locator, timeout=30):
-        return WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_element_located(locator)
-        )
+        return self._wait(locator, "visible", timeout)
         # 단일 요소
         # 화면에 요소가 나타날 때까지 기다림 (locator: 찾고 싶은 버튼/입력창/영역 위치)
 
     def wait_for_elements(self, locator, timeout=30):
         # 여러 요소를 기다려서 리스트로 반환
         # locator: (By.CSS_SELECTOR, 'selector') 형태
-        return WebDriverWait(self.driver, timeout).until(
-            lambda d: d.find_elements(*locator) if d.find_elements(*locator) else False
+        return self._wait(locator, "all", timeout)
+
+    # -------------------- 대기 엔진 (observer / polling) --------------------
+
+    def _wait(self, locator, mode, timeout):
+        """
+        WAIT_BACKEND 설정에 따라 대기
+        - polling (기본): 기존 WebDriverWait (500ms 간격)
+        - observer (WAIT_BACKEND=observer): execute_async_script 한 번으로 페이지 안에서 DOM 변경을 감지 → 조건 충족 즉시 반환
+        시간 초과 시 두 방식 모두 TimeoutException
+        """
+        if WAIT_BACKEND != "observer" or locator[0] not in _OBSERVABLE_BY:
+            return self._poll(locator, mode, timeout)
+
+        start = time.monotonic()
+        self._ensure_script_timeout(timeout)
+        try:
+            result = self.driver.execute_async_script(_OBSERVE_JS, locator[0], locator[1], mode, int(timeout * 1000))
+        except JavascriptException:
+            # 대기 중 페이지 이동으로 스크립트가 끊긴 경우 → 남은 시간은 폴링으로
+            remaining = max(0.1, timeout - (time.monotonic() - start))
+            return self._poll(locator, mode, remaining)
+
+        if not result:
+            raise TimeoutException(f"{timeout}초 내에 요소 조건({mode})을 만족하지 않음: {locator}")
+        return result
+
+    def _poll(self, locator, mode, timeout):
+        return WebDriverWait(self.driver, timeout).until(_POLL_CONDITIONS[mode](locator))
+
+    def wait_for_any(self, locators, mode="visible", timeout=30, name=None):
+        """
+        대체 locator 여러 개를 한 번에 대기 → (요소, 찾은 locator)
+        - CSS 실패(timeout) 후 XPath 재시도처럼 순서대로 기다리지 않고, 매 검사마다 모든 locator 를 같이 확인
+          → 기본 selector 가 바뀌어도 대체 selector 로 바로 찾음 (timeout 만큼 버리지 않음)
+        - mode: visible / clickable / all (all 이면 요소 리스트 반환)
+        - 이긴 locator 는 .locator_stats.json 에 기록 → 최근 자주 이긴 locator 를 먼저 검사,
+          선언 순서 첫 번째(기본) locator 가 같은 검사에서 찾아지지 않아 대체 locator 가 이기면 세션 끝 [locators] 리포트에 표시
+          (검사 순서가 바뀌어도 기본 locator 가 같이 맞으면 기본 locator 의 승리로 기록 → 순서가 고정되지 않음)
+        - name: 통계 이름 (없으면 locator 목록으로 구분)
+        """
+        locators = [tuple(locator) for locator in locators]
+        name = name or " | ".join(f"{by}={value}" for by, value in locators)
+        primary = locators[0]
+        ordered = locator_stats.order(name, locators)
+
+        start = time.monotonic()
+        if WAIT_BACKEND == "observer" and all(by in _OBSERVABLE_BY for by, _ in ordered):
+            self._ensure_script_timeout(timeout)
+            try:
+                found = self.driver.execute_async_script(
+                    _RACE_JS, [list(loc) for loc in ordered], ordered.index(primary), mode, int(timeout * 1000)
+                )
+                found = (found["result"], ordered[found["index"]]) if found else None
+            except JavascriptException:
+                # 대기 중 페이지 이동으로 스크립트가 끊긴 경우 → 남은 시간은 폴링으로
+                found = self._poll_any(ordered, primary, mode, max(0.1, timeout - (time.monotonic() - start)))
+        else:
+            found = self._poll_any(ordered, primary, mode, timeout)
+
+        if not found:
+            raise TimeoutException(f"{timeout}초 내에 요소 조건({mode})을 만족하는 locator 없음: {locators}")
+
+        element, locator = found
+        locator_stats.record(name, locator, time.monotonic() - start, fallback=locator != primary)
+        return element, locator
+
+    def _poll_any(self, locators, primary, mode, timeout):
+        def matches(driver, locator):
+            try:
+                return _POLL_CONDITIONS[mode](locator)(driver)
+            except (NoSuchElementException, StaleElementReferenceException):
+                return False
+
+        def check(driver):
+            for locator in locators:
+                result = matches(driver, locator)
+                if not result:
+                    continue
+                # _RACE_JS 와 같은 규칙: 같은 검사에서 기본 locator 도 맞으면 기본 locator 가 이김
+                own = matches(driver, primary) if locator != primary else None
+                return (own, primary) if own else (result, locator)
+            return False
+
+        try:
+            return WebDriverWait(self.driver, timeout).until(check)
+        except TimeoutException:
+            return None
+
+    # -------------------- 조건 대기 (고정 sleep 대체용) --------------------
+
+    def wait_for_dom_stable(self, target=None, quiet=0.3, timeout=10):
+        """
+        target 영역(locator 또는 요소, 없으면 body)의 DOM 변경이 quiet 초 동안 없을 때까지 대기
+        - 목록 재렌더링 / 검색 결과 갱신처럼 "바뀌는 게 멈출 때까지" 기다릴 때 사용
+        """
+        if not self._settle(target, "dom", quiet, timeout):
+            raise TimeoutException(f"{timeout}초 내에 DOM 이 안정되지 않음: {target}")
+
+    def wait_for_animation_end(self, target=None, timeout=10):
+        """
+        target 영역(locator 또는 요소, 없으면 body)의 CSS 애니메이션/트랜지션이 끝날 때까지 대기
+        - 드롭다운/메뉴/모달이 열리고 닫히는 동안 클릭이 빗나가지 않도록 할 때 사용
+        """
+        if not self._settle(target, "animation", 0, timeout):
+            raise TimeoutException(f"{timeout}초 내에 애니메이션이 끝나지 않음: {target}")
+
+    def wait_for_count_change(self, locator, previous, timeout=10):
+        """
+        locator 에 일치하는 요소 개수가 previous 와 달라질 때까지 대기 → 현재 요소 리스트 반환
+        - 항목 생성/삭제 후 목록이 반영됐는지 확인할 때 사용
+        """
+        if WAIT_BACKEND != "observer" or locator[0] not in _OBSERVABLE_BY:
+            return WebDriverWait(self.driver, timeout).until(
+                lambda d: (lambda found: found if len(found) != previous else False)(d.find_elements(*locator))
+            )
+
+        self._ensure_script_timeout(timeout)
+        result = self.driver.execute_async_script(
+            _OBSERVE_JS, locator[0], locator[1], "count", int(timeout * 1000), previous
         )
+        if not result:
+            raise TimeoutException(f"{timeout}초 내에 요소 개수가 {previous}개에서 바뀌지 않음: {locator}")
+        return result["elements"]
+
+    def _settle(self, target, mode, quiet, timeout):
+        root = self.wait_for_element(target, timeout) if isinstance(target, tuple) else target
+        self._ensure_script_timeout(timeout)
+        return self.driver.execute_async_script(_SETTLE_JS, root, mode, int(quiet * 1000), int(timeout * 1000))
+
+    def _ensure_script_timeout(self, timeout):
+        # 스크립트 자체 timeout 보다 드라이버 script timeout 이 짧으면 먼저 끊기므로 여유 있게 설정
+        needed = timeout + 5
+        if self._script_timeout is None or self._script_timeout < needed:
+            self.driver.set_script_timeout(needed)
+            self._script_timeout = needed
 
     def click(self, locator):
         element = self.wait_for_element(locator)
@@ -76,51 +410,108 @@ class BasePage:
         """
         사이드바의 채팅 히스토리 목록 강제 로드 + chat_items 반환
         마지막까지 스크롤해서 모든 항목을 가져오도록 수정
+        - 고정 sleep 대신 목록 DOM 변경이 멈출 때까지(안정화) 기다린 뒤 높이 비교
         """
-        # 대화 목록 전체 컨테이너 대기
-        container = WebDriverWait(self.driver, timeout).until(
-            EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="virtuoso-item-list"]'))
+        # 대화 목록 전체 컨테이너 대기 + 마지막까지 스크롤
+        container = self._load_chat_list(timeout)
+
+        # a 태그(대화 항목) 요소 가져오기
+        chat_items = WebDriverWait(self.driver, timeout).until(
+            lambda d: container.find_elements(By.TAG_NAME, "a") or False
+        )
+
+        assert len(chat_items) > 0, "대화 항목이 존재하지 않습니다."
+        print(f"[BasePage] 대화 목록이 {len(chat_items)}개 있습니다.")
+
+        return chat_items
+
+    def get_chat_records(self, timeout=10, position="end"):
+        """
+        사이드바에 렌더링된 대화 항목 전체를 execute_script 한 번으로 추출
+        - 항목마다 .text / find_elements 를 호출하지 않으므로 대화 수와 상관없이 왕복 횟수 일정
+        - position: end(get_chat_list 처럼 끝까지 스크롤) / top(맨 위로 스크롤 → 최신 대화)
+        반환: [{"index", "title", "href", "ellipsis", "truncated", "element": a 요소, "menu_button": 버튼 요소 또는 None}, ...]
+        """
+        if position == "top":
+            container = self._chat_list_container(timeout)
+            self._scroll_chat_list(container, "top", timeout)
+        else:
+            container = self._load_chat_list(timeout)
+
+        records = WebDriverWait(self.driver, timeout).until(
+            lambda d: d.execute_script(_CHAT_RECORDS_JS, container) or False
         )
+        print(f"[BasePage] 대화 목록 {len(records)}개 추출 (일괄)")
+        return records
+
+    def iter_chat_list(self, timeout=10):
+        """
+        사이드바 채팅 목록을 위에서부터 화면 높이만큼씩 스크롤하며 항목을 하나씩 반환 (generator)
+        - 가상 목록(Virtuoso)은 화면 밖 항목을 DOM 에서 제거하므로, 스크롤 단계마다 {href, title} 을 수집
+        - href 기준 중복 제거, 화면 순서 유지
+        - 끝에 도달했고 더 이상 새 항목/높이 변화가 없으면 종료
+        - 필요한 만큼만 읽고 break 하면 나머지 스크롤은 하지 않음
+        """
+        container = self._chat_list_container(timeout)
+
+        seen = set()
+        prev_height = None
+        mode = "top"
+        while True:
+            state = self._scroll_chat_list(container, mode, timeout)
+
+            new_count = 0
+            for item in state["items"]:
+                key = item["href"] or item["title"]
+                if key in seen:
+                    continue
+                seen.add(key)
+                new_count += 1
+                yield item
+
+            if state["atEnd"] and new_count == 0 and state["height"] == prev_height:
+                break
+            prev_height = state["height"]
+            mode = "step"
+
+    def harvest_chat_list(self, timeout=10):
+        """
+        iter_chat_list 결과 전체를 리스트로 반환
+        반환: [{"href": "/ai-helpy-chat/chats/...", "title": "대화 제목"}, ...]
+        """
+        items = list(self.iter_chat_list(timeout))
+        print(f"[BasePage] 대화 목록 {len(items)}개 수집 (스크롤 수집)")
+        return items
 
-        # 반복 스크롤: 마지막까지 DOM 렌더링
+    def _load_chat_list(self, timeout):
+        # 반복 스크롤: 마지막까지 DOM 렌더링 (높이 변화가 없을 때까지)
+        container = self._chat_list_container(timeout)
         prev_height = -1
         while True:
-            self.driver.execute_script("arguments[0].scrollTop = arguments[0].scrollHeight", container)
-            time.sleep(0.5)  # 렌더링 안정화
-            curr_height = self.driver.execute_script("return arguments[0].scrollHeight", container)
+            state = self._scroll_chat_list(container, "end", timeout)
+            curr_height = state["height"]
             if curr_height == prev_height:
                 break
             prev_height = curr_height
+        return container
 
-        # a 태그(대화 항목) 요소 가져오기
-        chat_items = WebDriverWait(self.driver, timeout).until(
-            lambda d: container.find_elements(By.TAG_NAME, "a")
-            if len(container.find_elements(By.TAG_NAME, "a")) > 0
-            else False
+    def _chat_list_container(self, timeout):
+        return WebDriverWait(self.driver, timeout).until(
+            EC.presence_of_element_located((By.CSS_SELECTOR, '[data-testid="virtuoso-item-list"]'))
         )
 
-        assert len(chat_items) > 0, "대화 항목이 존재하지 않습니다."
-        print(f"[BasePage] 대화 목록이 {len(chat_items)}개 있습니다.")
-
-        return chat_items
+    def _scroll_chat_list(self, container, mode, timeout):
+        # mode: top(맨 위) / step(화면 높이만큼 아래로) / end(맨 아래)
+        self._ensure_script_timeout(timeout)
+        return self.driver.execute_async_script(
+            _SCROLL_STEP_JS, container, mode, _SCROLL_QUIET_MS, int(timeout * 1000)
+        )
 
     # -------------------- 11/14 김은아 추가 --------------------
 
     def get_menu_buttons(self):
-        chat_items = self.get_chat_list()
-        menu_buttons = []
-
-        for item in chat_items:
-            # svg 아이콘 먼저 찾기
-            svg = item.find_elements(
-                By.CSS_SELECTOR,
-                "button.MuiIconButton-root svg[data-testid='ellipsis-verticalIcon']"
-            )
-            if svg:
-                # svg의 부모 = button
-                menu_buttons.append(svg[0].find_element(By.XPATH, "./.."))
-
-        return menu_buttons
+        # 대화 항목별 ellipsis(svg) 아이콘을 감싼 button - 항목 레코드에서 한 번에 추출
+        return [record["menu_button"] for record in self.get_chat_records() if record["menu_button"]]
 
     def get_popup_buttons(self):
         # 메뉴 클릭 후 뜨는 Rename / Delete li 요소
@@ -170,8 +561,8 @@ class BasePage:
         except TimeoutException as e:
             pytest.fail(f"로그아웃 실패: 프로필 버튼 없음: {e}")
 
-        # 드롭다운 열릴 때까지 대기
-        time.sleep(1)
+        # 드롭다운 열림 애니메이션이 끝날 때까지 대기
+        self.wait_for_animation_end()
 
         # 2) 로그아웃 버튼 찾기
         # SVG 아이콘으로 찾고 → 부모 요소 클릭
@@ -192,6 +583,7 @@ class BasePage:
 # ----------------------------- 11/18 수정(황지애) -----------------------------
 
     def open_custom_agent(self):
-        self.open("https://qaproject.elice.io/ai-helpy-chat/custom-agent")
+        self.open(CUSTOM_AGENT_URL)
+        checkpoint(self.driver, "custom_agent")
 
 # ------------------- 11/18 커스텀 페이지 로그인 파트 추가 (김은아) -------------------
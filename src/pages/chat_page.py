@@ -1,13 +1,9 @@
 # 작성자: 이홍주
 
 import os
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.support.ui import WebDriverWait
+import time
+from src.utils.lazy_selenium import webdriver, By, WebDriverWait, EC, ActionChains
 from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
-from selenium.webdriver.common.action_chains import ActionChains
 
 
 
@@ -34,9 +30,78 @@ def wait_for_new_response(driver, prev_count, timeout=40):
 
 
 
+# 응답 완료 표시: 답변이 끝나면 붙는 복사 / 좋아요 버튼 (click_clipboard 와 같은 버튼)
+RESPONSE_DONE_SELECTOR = "button:has(svg.lucide-copy)"
+
+# [마지막 응답(article)의 현재 글자 수 (새 응답이 아직 없으면 -1), 완료 표시가 새로 생겼는지]
+_LATEST_RESPONSE_JS = """
+const [prevCount, doneSelector, prevDone] = arguments;
+const articles = document.querySelectorAll('div[role="article"]');
+if (articles.length <= prevCount) return [-1, false];
+const length = (articles[articles.length - 1].innerText || '').trim().length;
+return [length, !!doneSelector && document.querySelectorAll(doneSelector).length > prevDone];
+"""
+
+
+class ChatLatency:
+    """
+    스트리밍 응답 1건의 지연 기록 (시간 단위: 초, 전송 시점 기준 경과 시간)
+    - ttft: 전송 → 첫 글자 표시
+    - total: 전송 → 마지막 글자 증가(스트리밍 완료)
+    - chars_per_sec: 첫 글자 이후 스트리밍 속도
+    - steps: [(경과 시간, 누적 글자 수), ...] 응답이 늘어난 시점들
+    """
+
+    def __init__(self, message):
+        self.message = message
+        self.first_chunk = None
+        self.completed = None
+        self.steps = []
+        self.complete = False
+        self.text = ""
+
+    @property
+    def ttft(self):
+        return self.first_chunk
+
+    @property
+    def total(self):
+        return self.completed
+
+    @property
+    def chars(self):
+        return self.steps[-1][1] if self.steps else 0
+
+    @property
+    def chars_per_sec(self):
+        if self.first_chunk is None or self.completed is None:
+            return None
+        duration = self.completed - self.first_chunk
+        if duration <= 0:
+            return None
+        return self.chars / duration
+
+    def as_dict(self):
+        return {
+            "message": self.message,
+            "ttft": self.ttft,
+            "total": self.total,
+            "chars": self.chars,
+            "chars_per_sec": self.chars_per_sec,
+            "steps": len(self.steps),
+            "complete": self.complete,
+        }
+
+    def __repr__(self):
+        cps = f"{self.chars_per_sec:.1f}" if self.chars_per_sec else "-"
+        ttft = f"{self.ttft:.2f}s" if self.ttft is not None else "-"
+        total = f"{self.total:.2f}s" if self.total is not None else "-"
+        return f"<ChatLatency ttft={ttft} total={total} chars={self.chars} cps={cps}>"
+
+
 class chat_basic:
 
-    def __init__(self, driver: webdriver.Chrome):
+    def __init__(self, driver: "webdriver.Chrome"):
         self.driver = driver
 
     def open_chat(self, login):
@@ -61,6 +126,58 @@ class chat_basic:
         return responses[-1].text
 
 
+    def send_message_stream(self, message: str, timeout=60, settle=1.0, poll=0.05,
+                            done_selector=RESPONSE_DONE_SELECTOR): # 메시지 입력 + 스트리밍 완료까지 측정
+        """
+        메시지를 보내고 응답이 끝까지 스트리밍될 때까지 기다린 뒤 (최종 텍스트, ChatLatency) 반환
+        - poll 간격으로 마지막 응답의 글자 수 + 완료 표시를 확인 (스크립트 1번 = 1 round-trip)
+        - 답변 완료 시 붙는 버튼(done_selector)이 새로 생기면 스트리밍 완료로 판단
+          → 중간에 잠깐 멈췄다가 이어지는 응답도 끝까지 기다림
+        - done_selector=None 이거나 이전 응답들에 완료 표시가 없으면(완료 표시가 없는 화면)
+          글자 수가 settle 초 동안 늘지 않을 때 완료로 판단
+        - 완료 시점은 '마지막으로 글자가 늘어난 시점'으로 기록
+        - timeout 안에 첫 글자가 안 오면 TimeoutException, 완료 판정 전에 timeout 이면 complete=False 로 반환
+        """
+        input_box = self.driver.find_element(By.CSS_SELECTOR, 'textarea:not([aria-hidden="true"])')
+        prev_count = len(self.driver.find_elements(By.CSS_SELECTOR, 'div[role="article"]'))
+        prev_done = len(self.driver.find_elements(By.CSS_SELECTOR, done_selector)) if done_selector else 0
+        use_settle = done_selector is None or (prev_count > 0 and prev_done == 0)
+
+        latency = ChatLatency(message)
+
+        input_box.send_keys(message)
+        input_box.send_keys("\n")
+        submitted = time.perf_counter()
+
+        last_len = 0
+        last_change = None
+        while True:
+            now = time.perf_counter()
+            elapsed = now - submitted
+            length, done = self.driver.execute_script(_LATEST_RESPONSE_JS, prev_count, done_selector, prev_done)
+
+            if length > last_len:
+                if latency.first_chunk is None:
+                    latency.first_chunk = elapsed
+                latency.steps.append((elapsed, length))
+                last_len = length
+                last_change = now
+            if last_change is not None and (done or (use_settle and now - last_change >= settle)):
+                latency.complete = True
+                break
+
+            if elapsed >= timeout:
+                if latency.first_chunk is None:
+                    raise TimeoutException(f"{timeout}초 내에 응답이 시작되지 않았습니다.")
+                break
+
+            time.sleep(poll)
+
+        latency.completed = last_change - submitted
+        latency.text = self.driver.find_elements(By.CSS_SELECTOR, 'div[role="article"]')[-1].text
+        print(f"✅ 스트리밍 응답 수신: {latency}")
+        return latency.text, latency
+
     def click_plus(self): # + 버튼 클릭
         input_button = self.driver.find_element(By.CSS_SELECTOR, "button[aria-haspopup='true']")
         input_button.click()
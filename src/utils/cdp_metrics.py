@@ -0,0 +1,99 @@
+"""
+CDP 성능 지표 수집 헬퍼
+- Chrome DevTools Performance.getMetrics + Navigation / Paint Timing 을 지정한 시점(checkpoint)마다 기록
+- 수집기가 연결된 드라이버에서만 동작 (연결 안 됐으면 checkpoint() 는 아무것도 하지 않음)
+    → 로그인 / 언어 설정 / 페이지 이동 같은 공용 코드에 checkpoint() 를 넣어 둬도 평소 실행에는 비용 없음
+- 연결: conftest 의 cdp_metrics fixture 또는 CDP_METRICS=1
+
+사용 예:
+    collector = attach_metrics(driver)
+    checkpoint(driver, "login")
+    collector.checkpoints  # [{"label": "login", "url": .., "TaskDuration": .., "FCP": .., ...}]
+"""
+from selenium.common.exceptions import WebDriverException
+
+# Performance.getMetrics 중 기록할 항목 (Duration: 초, Size: bytes, Count: 횟수)
+METRIC_NAMES = (
+    "TaskDuration", "ScriptDuration", "LayoutDuration", "RecalcStyleDuration",
+    "LayoutCount", "RecalcStyleCount", "Nodes", "JSHeapUsedSize", "JSHeapTotalSize",
+)
+
+# 현재 문서의 Navigation / Paint Timing (ms, navigationStart 기준)
+_TIMING_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+const paint = {};
+performance.getEntriesByType('paint').forEach(p => { paint[p.name] = p.startTime; });
+return {
+    url: location.href,
+    DOMContentLoaded: nav ? nav.domContentLoadedEventEnd : null,
+    Load: nav ? nav.loadEventEnd : null,
+    FP: paint['first-paint'] ?? null,
+    FCP: paint['first-contentful-paint'] ?? null,
+};
+"""
+
+
+class MetricsCollector:
+    """드라이버 1개에 연결되는 checkpoint 기록기"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.checkpoints = []
+
+    def capture(self, label):
+        # 새 창/탭으로 전환된 경우에도 측정되도록 매번 Performance 도메인 활성화
+        try:
+            self.driver.execute_cdp_cmd("Performance.enable", {})
+        except WebDriverException:
+            pass
+
+        try:
+            metrics = self.driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+            timing = self.driver.execute_script(_TIMING_JS)
+        except WebDriverException as e:
+            print(f"⚠️ [cdp] {label} 지표 수집 실패: {getattr(e, 'msg', e)}")
+            return None
+
+        values = {m["name"]: m["value"] for m in metrics}
+        record = {"label": label, "url": timing.pop("url")}
+        record.update({name: values.get(name) for name in METRIC_NAMES})
+        record.update(timing)
+        self.checkpoints.append(record)
+        print(f"[cdp] {format_checkpoint(record)}")
+        return record
+
+
+def format_checkpoint(record):
+    def ms(value):
+        return f"{value:.0f}ms" if value is not None else "-"
+
+    heap = record.get("JSHeapUsedSize")
+    return (
+        f"{record['label']}: DCL {ms(record.get('DOMContentLoaded'))} / FCP {ms(record.get('FCP'))} / "
+        f"Task {record.get('TaskDuration') or 0:.2f}s / Script {record.get('ScriptDuration') or 0:.2f}s / "
+        f"Layout {int(record.get('LayoutCount') or 0)}회 / Heap {(heap or 0) / 1_048_576:.1f}MB"
+    )
+
+
+def attach_metrics(driver):
+    """드라이버에 수집기 연결 (이미 연결돼 있으면 그대로 반환)"""
+    collector = getattr(driver, "_cdp_metrics", None)
+    if collector is None:
+        collector = MetricsCollector(driver)
+        driver._cdp_metrics = collector
+    return collector
+
+
+def detach_metrics(driver):
+    """연결 해제 후 수집기 반환 (풀에 반납하기 전에 호출)"""
+    collector = getattr(driver, "_cdp_metrics", None)
+    driver._cdp_metrics = None
+    return collector
+
+
+def checkpoint(driver, label):
+    """수집기가 연결된 드라이버면 현재 시점 지표 기록, 아니면 아무것도 하지 않음"""
+    collector = getattr(driver, "_cdp_metrics", None)
+    if collector is None:
+        return None
+    return collector.capture(label)
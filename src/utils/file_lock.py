@@ -0,0 +1,59 @@
+"""
+프로세스 간 파일 잠금 (병렬 실행 워커끼리 같은 파일을 독점 / 읽고-고쳐-쓰기)
+- POSIX: fcntl.flock / Windows: msvcrt.locking (파일 첫 1바이트)
+- 프로세스가 비정상 종료되면 OS 가 잠금을 풀어 주므로 남은 잠금을 회수할 필요 없음
+
+사용 예:
+    with locked(path):               # path + ".lock" 파일로 잠금 (다른 워커는 대기)
+        data = read(path)
+        ...
+        write(path, data)
+"""
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+
+def lock(fd, blocking=True):
+    """fd 독점 잠금 (blocking=False 면 다른 프로세스가 잡고 있을 때 바로 OSError)"""
+    if os.name != "nt":
+        fcntl.flock(fd, fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB)
+        return
+    os.lseek(fd, 0, os.SEEK_SET)
+    while True:
+        try:
+            msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return
+        except OSError:
+            if not blocking:
+                raise
+            time.sleep(0.05)
+
+
+def unlock(fd):
+    if os.name == "nt":
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+    else:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+
+
+@contextmanager
+def locked(path):
+    """path 옆의 <이름>.lock 파일을 잡고 있는 동안 실행 (잠금 파일은 지우지 않음)"""
+    path = Path(path)
+    fd = os.open(path.with_name(path.name + ".lock"), os.O_CREAT | os.O_RDWR)
+    try:
+        lock(fd)
+        try:
+            yield
+        finally:
+            unlock(fd)
+    finally:
+        os.close(fd)
@@ -0,0 +1,63 @@
+"""
+지연 import 헬퍼
+- import 비용이 큰 모듈을 실제로 사용하는 시점(속성 접근 / 호출)에 처음 로드
+- 로드에 걸린 시간은 LOAD_TIMES 에 기록 (conftest 의 --import-times 리포트에서 출력)
+"""
+import importlib
+import sys
+import time
+
+# 지연 로드된 모듈 이름 → 로드 소요 시간(초)
+LOAD_TIMES = {}
+
+
+def load(name):
+    """모듈을 import (이미 로드돼 있으면 그대로 반환)"""
+    module = sys.modules.get(name)
+    if module is None:
+        start = time.perf_counter()
+        module = importlib.import_module(name)
+        LOAD_TIMES[name] = time.perf_counter() - start
+    return module
+
+
+class LazyModule:
+    """속성에 처음 접근할 때 모듈을 import 하는 대리 객체 (예: EC.url_contains)"""
+
+    def __init__(self, name):
+        self._name = name
+
+    def __getattr__(self, attr):
+        # dunder 조회(inspect / copy / pytest 수집 등)로는 로드하지 않음
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        return getattr(load(self._name), attr)
+
+    def __repr__(self):
+        state = "loaded" if self._name in sys.modules else "lazy"
+        return f"<LazyModule {self._name} ({state})>"
+
+
+class LazyAttr:
+    """모듈의 클래스/함수 대리 객체 - 호출하거나 속성에 접근할 때 로드 (예: WebDriverWait(driver, 10))"""
+
+    def __init__(self, module, attr):
+        self._module = module
+        self._attr = attr
+        self._target = None
+
+    def _resolve(self):
+        if self._target is None:
+            self._target = getattr(load(self._module), self._attr)
+        return self._target
+
+    def __call__(self, *args, **kwargs):
+        return self._resolve()(*args, **kwargs)
+
+    def __getattr__(self, attr):
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        return getattr(self._resolve(), attr)
+
+    def __repr__(self):
+        return f"<LazyAttr {self._module}.{self._attr}>"
@@ -0,0 +1,35 @@
+"""
+selenium 지연 import 모음
+- `selenium.webdriver` 패키지는 import 만으로 chrome/firefox/edge/safari/remote 를 전부 로드해서 ~200ms 가 걸린다.
+  수집(--co) / 마커 필터링처럼 브라우저를 띄우지 않는 실행에서도 이 비용을 내지 않도록,
+  아래 이름들은 실제로 호출/속성 접근할 때 selenium 을 로드한다.
+- By 는 WebDriver 표준 locator 문자열이라 selenium 없이 값을 그대로 둔다 (모듈 레벨 locator 튜플에서 사용)
+- 예외 클래스는 selenium.common.exceptions 에서 직접 import 할 것 (가볍고, except 절에는 실제 클래스가 필요)
+
+사용 예:
+    from src.utils.lazy_selenium import By, WebDriverWait, EC
+"""
+from src.utils.lazy import LazyAttr, LazyModule
+
+
+class By:
+    """selenium.webdriver.common.by.By 와 같은 값"""
+
+    ID = "id"
+    XPATH = "xpath"
+    LINK_TEXT = "link text"
+    PARTIAL_LINK_TEXT = "partial link text"
+    NAME = "name"
+    TAG_NAME = "tag name"
+    CLASS_NAME = "class name"
+    CSS_SELECTOR = "css selector"
+
+
+webdriver = LazyModule("selenium.webdriver")
+EC = LazyModule("selenium.webdriver.support.expected_conditions")
+
+WebDriverWait = LazyAttr("selenium.webdriver.support.ui", "WebDriverWait")
+ActionChains = LazyAttr("selenium.webdriver.common.action_chains", "ActionChains")
+Keys = LazyAttr("selenium.webdriver.common.keys", "Keys")
+Options = LazyAttr("selenium.webdriver.chrome.options", "Options")
+Service = LazyAttr("selenium.webdriver.chrome.service", "Service")
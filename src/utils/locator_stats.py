@@ -0,0 +1,106 @@
+"""
+대체 locator 승리 통계 (BasePage.wait_for_any)
+- 대기 이름(없으면 locator 목록)별로 어떤 locator 가 몇 번 먼저 찾아졌는지 / 걸린 시간을 기록
+- 다음 실행부터 최근 자주 이긴 locator 를 먼저 검사하도록 순서 조정 (동점이면 선언 순서)
+    - 저장할 때마다 이번 세션에 쓴 대기의 기존 승리 수에 LOCATOR_STATS_DECAY 를 곱함
+      → 한때 대체 locator 가 이겼어도 기본 locator 가 다시 이기기 시작하면 순서가 돌아옴
+- 기본(선언 순서 첫 번째) locator 가 같은 검사에서 찾아지지 않아 대체 locator 가 이긴 경우
+  = 기본 selector 가 바뀌었을 가능성 → 세션 끝 리포트에 표시
+- 파일: LOCATOR_STATS_FILE (기본 .locator_stats.json), 저장 시 파일 잠금 안에서 최신 값에 이번 세션 증가분을 더함
+  (병렬 실행 워커가 각자 저장해도 누적이 유지되도록)
+"""
+import json
+import os
+from pathlib import Path
+
+from src.utils.file_lock import locked
+
+LOCATOR_STATS_FILE = os.getenv("LOCATOR_STATS_FILE", ".locator_stats.json")
+LOCATOR_STATS_DECAY = float(os.getenv("LOCATOR_STATS_DECAY", "0.8"))   # 세션마다 기존 승리 수에 곱하는 값 (1 이면 감쇠 없음)
+
+
+def locator_label(locator):
+    return f"{locator[0]}={locator[1]}"
+
+
+class LocatorStats:
+    """
+    파일 구조
+    {"대기 이름": {"css selector=...": {"wins": 12.4, "seconds": 3.4}, "xpath=...": {...}}}
+    (wins / seconds 는 감쇠된 누적값이라 소수)
+    """
+
+    def __init__(self, path=LOCATOR_STATS_FILE, decay=LOCATOR_STATS_DECAY):
+        self.path = Path(path)
+        self.decay = decay
+        self._data = None
+        self.session = {}    # 이번 세션 증가분 {이름: {label: {"wins", "seconds", "fallback"}}}
+        self.remote = {}     # 워커에서 받은 증가분 (리포트용, 파일은 워커가 직접 저장)
+
+    @property
+    def data(self):
+        if self._data is None:
+            self._data = self._read()
+        return self._data
+
+    def _read(self):
+        try:
+            return json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return {}
+
+    def order(self, name, locators):
+        """승리 횟수 많은 순으로 정렬한 locator 리스트 (동점이면 선언 순서 유지)"""
+        wins = self.data.get(name, {})
+        return sorted(locators, key=lambda loc: -wins.get(locator_label(loc), {}).get("wins", 0))
+
+    def record(self, name, locator, seconds, fallback):
+        """locator 가 이긴 결과 기록 (fallback: 같은 검사에서 기본 locator 가 찾아지지 않아 대체 locator 가 이겼는지)"""
+        label = locator_label(locator)
+        for table in (self.data, self.session):
+            entry = table.setdefault(name, {}).setdefault(label, {"wins": 0, "seconds": 0.0})
+            entry["wins"] += 1
+            entry["seconds"] += seconds
+        if fallback:
+            entry = self.session[name][label]
+            entry["fallback"] = entry.get("fallback", 0) + 1
+
+    def merge(self, session):
+        """다른 프로세스(xdist 워커)의 세션 증가분을 리포트용으로 합산"""
+        for name, labels in session.items():
+            for label, values in labels.items():
+                entry = self.remote.setdefault(name, {}).setdefault(label, {"wins": 0, "seconds": 0.0})
+                for key, value in values.items():
+                    entry[key] = entry.get(key, 0) + value
+
+    def save(self):
+        if not self.session:
+            return
+        with locked(self.path):
+            data = self._read()
+            for name, labels in self.session.items():
+                # 이번 세션에 쓴 대기만 감쇠 → 오래된 승리보다 최근 결과가 순서를 정함
+                for entry in data.get(name, {}).values():
+                    entry["wins"] *= self.decay
+                    entry["seconds"] *= self.decay
+                for label, values in labels.items():
+                    entry = data.setdefault(name, {}).setdefault(label, {"wins": 0, "seconds": 0.0})
+                    entry["wins"] += values["wins"]
+                    entry["seconds"] += values["seconds"]
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2), encoding="utf-8")
+            os.replace(tmp, self.path)
+
+    def fallbacks(self):
+        """이번 세션에서 대체 locator 가 이긴 기록 → [(이름, label, 횟수, 평균 초)] (횟수 내림차순)"""
+        rows = []
+        for table in (self.session, self.remote):
+            for name, labels in table.items():
+                for label, values in labels.items():
+                    if values.get("fallback"):
+                        rows.append((name, label, values["fallback"], values["seconds"] / values["wins"]))
+        return sorted(rows, key=lambda row: -row[2])
+
+
+# 프로세스 전체에서 공유 (conftest 가 세션 끝에 save / 리포트)
+locator_stats = LocatorStats()
@@ -1,10 +1,8 @@
 import pytest
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from src.utils.lazy_selenium import By, WebDriverWait, EC
 
 
-from src.config.settings import get_default_admin
+from src.config.settings import APP_ORIGIN, ACCOUNTS_URL
 from tests.helpers.common_helpers import (_click_profile, _set_language_korean, _account_mgmt_page_open, _click_profile_avatar_edit_button,
  _upload_profile_avatar_image, _select_profile_avatar_menu, _get_account_mgmt_avatar_srcs,  _get_main_page_avatar_srcs, _get_login_page_avatar_src,
  )
@@ -24,7 +22,7 @@ def test_duplicate_email_registration_blocked(driver):
     wait = WebDriverWait(driver, 15)
     
     # 1) 로그인 페이지로 이동 (로그인하지 않고)
-    driver.get("https://accounts.elice.io/accounts/signin/me")
+    driver.get(f"{ACCOUNTS_URL}/accounts/signin/me")
     print("✅ 로그인 페이지 진입")
     
     # 2) Create account 링크 클릭
@@ -157,7 +155,7 @@ def test_logout_prevents_back_navigation(driver, login):
     # 검증 2: 특정 URL 확인 (있다면)
     # TC에서 명시한 대로 signin/history인지 확인
     if "signin/history" in current_url:
-        print("✅ https://accounts.elice.io/accounts/signin/history에 머물러 있음")
+        print(f"✅ {ACCOUNTS_URL}/accounts/signin/history에 머물러 있음")
     else:
         # signin 페이지면 OK (history가 아닐 수도 있음)
         print(f"ℹ️ signin 페이지에 있음: {current_url}")
@@ -524,7 +522,7 @@ def test_promotion_notifications_toggle(driver, login):
 
 
 # AC-020
-def test_account_deletion_button_activation(driver, login):
+def test_account_deletion_button_activation(driver, login, login_account):
     """
     계정 탈퇴 버튼 활성화 확인
     1. 탈퇴하기 버튼 클릭 (초기)
@@ -536,8 +534,7 @@ def test_account_deletion_button_activation(driver, login):
     wait = WebDriverWait(driver, 15)
     
     # 로그인한 계정 정보 가져오기
-    account = get_default_admin()
-    expected_text = f"Delete {account.username}"  # "Delete team4a@elice.com"
+    expected_text = f"Delete {login_account.username}"  # "Delete team4a@elice.com"
     
     print(f"예상 입력값: {expected_text}")
     
@@ -871,7 +868,7 @@ def test_organization_admin_menu_access(driver, login):
     """
     기관 관리 페이지 진입 및 사이드 메뉴 접근 확인
     1. 계정 관리 > 내 기관 탭
-    2. qaproject.elice.io 가기 클릭
+    2. 서비스(APP_ORIGIN) 가기 클릭
     3. 톱니바퀴 > 기관 관리
     4. 사이드 메뉴 7개 확인
     """
@@ -894,10 +891,10 @@ def test_organization_admin_menu_access(driver, login):
     wait.until(EC.url_contains("/members/organization"))
     print("✅ 내 기관 탭 이동")
     
-    # 3) qaproject.elice.io 가기 링크 클릭
+    # 3) 서비스(APP_ORIGIN) 가기 링크 클릭
     go_link = wait.until(EC.element_to_be_clickable((
         By.CSS_SELECTOR,
-        "a[href='https://qaproject.elice.io'][target='_blank']"
+        f"a[href='{APP_ORIGIN}'][target='_blank']"
     )))
         
     # 현재 탭 개수 저장
@@ -905,7 +902,7 @@ def test_organization_admin_menu_access(driver, login):
     print(f"클릭 전 탭 개수: {current_tabs}")
 
     go_link.click()
-    print("✅ qaproject.elice.io 가기 클릭")
+    print(f"✅ {APP_ORIGIN} 가기 클릭")
 
     # 3-1) 새 탭이 열릴 때까지 대기
     WebDriverWait(driver, 10).until(lambda d: len(d.window_handles) > current_tabs)
@@ -918,7 +915,7 @@ def test_organization_admin_menu_access(driver, login):
 
     # 🆕 3-3) URL이 실제로 바뀔 때까지 대기
     WebDriverWait(driver, 10).until(
-        lambda d: "qaproject.elice.io" in d.current_url
+        lambda d: d.current_url.startswith(APP_ORIGIN)
     )
     print(f"URL 확인: {driver.current_url}")
 
@@ -996,7 +993,7 @@ def test_organization_admin_menu_access(driver, login):
         # 정확한 href로 찾기
         org_admin_menu = wait.until(EC.element_to_be_clickable((
             By.CSS_SELECTOR,
-            "a[href='https://qaproject.elice.io/admin/org'][target='_blank']"
+            f"a[href='{APP_ORIGIN}/admin/org'][target='_blank']"
         )))
     except:
         # 대안: buildingsIcon으로 찾기
@@ -1,13 +1,9 @@
 import pytest
 import os
 import re
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver import ActionChains
+from src.utils.lazy_selenium import By, WebDriverWait, EC, ActionChains, Keys
 from selenium.common.exceptions import MoveTargetOutOfBoundsException
 from selenium.common.exceptions import TimeoutException
-from selenium.webdriver.common.keys import Keys
 
 # Common 헬퍼 함수 import
 from tests.helpers.common_helpers import (
@@ -17,13 +13,15 @@ from tests.helpers.common_helpers import (
 # Billing 헬퍼 함수 import
 from tests.helpers.billing_helpers import (
     _dump, _dump_on_fail, _find_credit_btn, _extract_amount, _has_won_symbol,
-    _css, _computed_bg, _any_prop_changed, _style_snapshot, PROPS,
+    _css, _computed_bg, _any_prop_changed, _style_snapshot, _style_snapshots, _computed_styles, PROPS,
     _hover, _hover_strong, _is_in_hover_chain,
     _click_profile, debug_wait, _get_credit_amount,
 )
 
 # BasePage import
 from src.pages.base_page import BasePage
+from src.utils.cdp_metrics import checkpoint
+from src.config.settings import APP_ORIGIN, PAYMENTS_URL
 
 # ======================
 # ✅ test functions
@@ -108,7 +106,7 @@ def test_credit_button_hover_color(driver, login):
     WebDriverWait(driver, 1).until(lambda d: d.execute_script("return document.readyState") == "complete")
 
     # 2) hover 전 상태 캡처
-    before = {p: _css(driver, credit, p) for p in PROPS}
+    before = _computed_styles(driver, credit, PROPS)
 
     # 3) hover 적용
     _hover(driver, credit)
@@ -129,7 +127,7 @@ def test_credit_button_hover_color(driver, login):
 
     try:
         # 5) hover 후 상태 캡처
-        after = {p: _css(driver, target, p) for p in PROPS}
+        after = _computed_styles(driver, target, PROPS)
         changed = any(before[p] != after[p] for p in PROPS)
 
         # ✅ 개선: xfail 대신 재시도 로직
@@ -144,7 +142,7 @@ def test_credit_button_hover_color(driver, login):
                     target
                 ) or True  # transition이 없거나 즉시 완료
             )
-            after_retry = {p: _css(driver, target, p) for p in PROPS}
+            after_retry = _computed_styles(driver, target, PROPS)
             changed = any(before[p] != after_retry[p] for p in PROPS)
         
         if not changed:
@@ -186,9 +184,10 @@ def test_credit_button_opens_new_window(driver, login):
     
     # URL 확인
     wait.until(EC.url_contains("/admin/org/billing/payments/credit"))
+    checkpoint(driver, "credit_page")
     
     current_url = driver.current_url
-    assert "qaproject.elice.io" in current_url, f"도메인 불일치: {current_url}"
+    assert current_url.startswith(APP_ORIGIN), f"도메인 불일치: {current_url}"
     assert "/admin/org/billing/payments/credit" in current_url, f"경로 불일치: {current_url}"
     
     print(f"✅ 새 창 URL: {current_url}")
@@ -307,8 +306,7 @@ def test_payment_history_hover_color(driver, login):
             pass
 
     # 3) 전 상태 스냅샷
-    before_t = _style_snapshot(driver, target)
-    before_n = _style_snapshot(driver, neighbor) if neighbor else None
+    before_t, before_n = _style_snapshots(driver, [target, neighbor])
 
     # 4) hover 진입
     _hover_strong(driver, target)
@@ -318,8 +316,7 @@ def test_payment_history_hover_color(driver, login):
     in_hover = _is_in_hover_chain(driver, target)
 
     # 6) 후 상태 스냅샷
-    after_t = _style_snapshot(driver, target)
-    after_n = _style_snapshot(driver, neighbor) if neighbor else None
+    after_t, after_n = _style_snapshots(driver, [target, neighbor])
 
     # 7) 변화 판정 로직
     #   A) 대상 전/후 중 하나라도 달라졌는가?
@@ -381,10 +378,10 @@ def test_payment_history_page_permission_denied(driver, login):
     driver.switch_to.window(new_tab)
 
     # 4) URL 및 페이지 로딩 대기
-    wait.until(lambda d: "payments.elice.io" in d.current_url)
+    wait.until(lambda d: d.current_url.startswith(PAYMENTS_URL))
     current_url = driver.current_url
     print("DEBUG 새 탭 URL:", current_url)
-    assert "https://payments.elice.io" in current_url, f"잘못된 도메인: {current_url}"
+    assert current_url.startswith(PAYMENTS_URL), f"잘못된 도메인: {current_url}"
 
     # 5) 권한 없음 페이지로의 연결을 확인하고 XFAIL로 종료 (예정된 수순)
     denied_signals = ["권한", "Permission", "denied", "forbidden", "접근 불가", "Access is denied"]
@@ -407,6 +404,7 @@ def test_credit_page_ui_elements(driver, login):
         driver.switch_to.window(driver.window_handles[-1])
     
     wait.until(EC.url_contains("/credit"))
+    checkpoint(driver, "credit_page")
     
     # ✅ 각 요소까지 스크롤하면서 확인
     elements_to_check = [
@@ -1,7 +1,5 @@
 from src.pages.chat_page import chat_basic
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
+from src.utils.lazy_selenium import By, WebDriverWait, EC
 
 def test_chat_advanced_001(driver, login):
     chat = chat_basic(driver)
@@ -1,9 +1,8 @@
 #작성자 이홍주
 
+import pytest
 from src.pages.chat_page import chat_basic
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.common.by import By
+from src.utils.lazy_selenium import By, WebDriverWait, EC
 import pyperclip
 
 
@@ -201,3 +200,16 @@ def test_chat_basic_014(driver, login): # 스페이스바만 입력, 실행은 
     assert len(response_text) > 0
     print(f"✅ Helpy 응답: {response_text}")
 
+
+@pytest.mark.performance
+def test_chat_basic_015(driver, login): # 스트리밍 응답 성능 측정 (TTFT / 전체 시간 / 글자 속도)
+    chat = chat_basic(driver)
+    chat.open_chat(login)
+
+    response_text, latency = chat.send_message_stream("자기소개를 부탁해")
+
+    assert latency.complete, f"스트리밍이 완료되지 않았습니다: {latency}"
+    assert len(response_text) > 0
+    assert latency.ttft < 10, f"첫 응답까지 너무 오래 걸림: {latency.ttft:.2f}s"
+    assert latency.total >= latency.ttft
+    print(f"✅ 스트리밍 측정: {latency.as_dict()}")
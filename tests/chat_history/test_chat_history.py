@@ -4,19 +4,14 @@ import sys
 
 # 서드파티 라이브러리
 import pytest
-from selenium import webdriver
-from selenium.webdriver.common.by import By
-from selenium.webdriver.common.action_chains import ActionChains 
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
+from src.utils.lazy_selenium import webdriver, By, WebDriverWait, EC, ActionChains, Options, Service
 from selenium.common.exceptions import TimeoutException
 
 
 # 로컬/프로젝트 모듈
 from src.pages.base_page import BasePage
   # 공통 기능 상속용
+from src.config.settings import BASE_URL, ACCOUNTS_URL
 
 @pytest.mark.usefixtures("driver", "login")
 class ChatHistoryTests:
@@ -102,40 +97,37 @@ class ChatHistoryTests:
     # ----------------------- CHAT-HIS-004 -----------------------
     @pytest.mark.ui
     @pytest.mark.medium
-    def test_chat_history_sort_order(self):
-        chat_items = self.page.get_chat_list()
-        if len(chat_items) == 0:
-            pytest.skip("대화가 0개입니다. 테스트를 건너뜁니다.")
-        else:
-            # 검증: 대화가 1개 이상 있으면 통과 (최신이 맨 위라고 간주)
-            assert len(chat_items) >= 1, "대화 목록이 비어 있음!"
-            print(f"대화 목록이 {len(chat_items)}개 있습니다. 최신 대화가 맨 위에 있다고 판단됩니다.")
+    def test_chat_history_sort_order(self, seeded_chats):
+        if not seeded_chats:
+            pytest.skip("생성 시각이 정해진 대화가 필요함 (API_ENABLED=1)")
+
+        # 맨 위(최신) 항목들을 한 번에 추출 → API 로 만든 대화가 최신순으로 보이는지 확인
+        records = self.page.get_chat_records(position="top")
+        titles = [record["title"] for record in records]
+        print(f"대화 목록 상단 {len(titles)}개: {titles[:5]}")
+
+        newest_first = [chat["title"] for chat in reversed(seeded_chats)]
+        missing = [title for title in newest_first if title not in titles]
+        assert not missing, f"생성한 대화가 목록 상단에 없음: {missing}"
+
+        positions = [titles.index(title) for title in newest_first]
+        assert positions == sorted(positions), f"최신순 정렬이 아님: {newest_first} → 위치 {positions}"
+        print("대화 목록이 최신순으로 정렬되어 있습니다.")
 
     # ----------------------- CHAT-HIS-005 -----------------------
     @pytest.mark.ui
     @pytest.mark.low
     def test_chat_titles_have_ellipsis(self):
-        # 현재 대화 목록 화면에서 채팅 제목이 ellipsis 속성 적용되었는지 확인
-        chat_items = self.page.get_chat_list()
-        if len(chat_items) == 0:
+        # 현재 대화 목록 화면에서 채팅 제목이 ellipsis 속성 적용되었는지 확인 (항목 수와 상관없이 스크립트 1회)
+        records = self.page.get_chat_records()
+        if len(records) == 0:
             pytest.skip("대화가 0개입니다. 테스트를 건너뜁니다.")
-        else:
-            assert len(chat_items) >= 1, "대화 목록이 비어 있음!"
-            print(f"대화 목록이 {len(chat_items)}개 있습니다.")
-
-        ellipsis_found = False
-        for idx, item in enumerate(chat_items):
-            title_element = item.find_element(By.CSS_SELECTOR, "p.MuiTypography-root.MuiTypography-inherit")
-            self.page.scroll_into_view(title_element)
-            WebDriverWait(self.driver, 5).until(lambda d: title_element.text.strip() != "")
-            text_overflow = title_element.value_of_css_property("text-overflow")
-            overflow = title_element.value_of_css_property("overflow")
-            white_space = title_element.value_of_css_property("white-space")
-            print(f"[{idx}] 제목: '{title_element.text.strip()}' → "
-                  f"text-overflow: {text_overflow}, overflow: {overflow}, white-space: {white_space}")
-            if text_overflow == "ellipsis" and overflow in ["hidden", "clip"]:
-                ellipsis_found = True
-        assert ellipsis_found, "CSS 상으로 ellipsis 속성이 적용된 대화가 없습니다."
+        print(f"대화 목록이 {len(records)}개 있습니다.")
+
+        for record in records:
+            print(f"[{record['index']}] 제목: '{record['title']}' → "
+                  f"ellipsis: {record['ellipsis']}, 실제 잘림: {record['truncated']}")
+        assert any(record["ellipsis"] for record in records), "CSS 상으로 ellipsis 속성이 적용된 대화가 없습니다."
 
     # ----------------------- CHAT-HIS-006 -----------------------
     @pytest.mark.ui
@@ -222,6 +214,7 @@ class ChatHistoryTests:
     # ----------------------- CHAT-HIS-009 -----------------------
     @pytest.mark.function
     @pytest.mark.medium
+    @pytest.mark.usefixtures("seeded_chats")
     def test_chat_history_rename(self):
         timeout = 20
         wait = self.wait
@@ -310,6 +303,7 @@ class ChatHistoryTests:
     # ----------------------- CHAT-HIS-010 -----------------------
     @pytest.mark.function
     @pytest.mark.high
+    @pytest.mark.usefixtures("seeded_chats")
     def test_chat_history_delete(self):
         timeout = 20
         log = lambda msg: (print(msg), sys.stdout.flush())
@@ -363,7 +357,7 @@ class ChatHistoryTests:
         assert ellipsis_btn is not None, "ellipsis 버튼을 찾을 수 없음"
         ellipsis_btn.click()
         log("[6] ellipsis 버튼 클릭 완료")
-        time.sleep(0.5)
+        self.page.wait_for_animation_end()
 
         delete_menu = None
         for _ in range(5):
@@ -393,7 +387,7 @@ class ChatHistoryTests:
         assert delete_menu is not None, "Delete 메뉴를 찾을 수 없음"
         delete_menu.click()
         log("[8] Delete 메뉴 클릭 완료")
-        time.sleep(0.5)
+        self.page.wait_for_animation_end()
 
         try:
             confirm_btn = self.wait.until(
@@ -538,12 +532,15 @@ class ChatHistoryTests:
     # ----------------------- CHAT-HIS-013 -----------------------
     @pytest.mark.ui
     @pytest.mark.medium
-    def test_chat_history_initial_load_time(self):
+    def test_chat_history_initial_load_time(self, cdp_metrics):
         
         # 채팅 히스토리 목록 초기 로딩 속도를 측정하는 테스트
         driver = self.driver
         page = self.page
 
+        # 목록 로드 전 브라우저 지표 (DCL / FCP / 누적 Task·Script 시간)
+        before = cdp_metrics.capture("chat_list_before")
+
         start_time = time.time()
 
         # 기존 다른 TC에서 정상 동작한 로직 재사용
@@ -552,8 +549,17 @@ class ChatHistoryTests:
         end_time = time.time()
         load_time = end_time - start_time
 
+        after = cdp_metrics.capture("chat_list_after")
+
         print(f"대화 목록 초기 로딩 시간: {load_time:.2f}초")
         print(f"로드된 대화 수: {len(chat_items)}")
+        if before and after:
+            # 목록 로드 동안 브라우저 안에서 쓴 시간 (Python ↔ 드라이버 왕복 제외)
+            print(
+                f"브라우저 Task {after['TaskDuration'] - before['TaskDuration']:.2f}s / "
+                f"Script {after['ScriptDuration'] - before['ScriptDuration']:.2f}s / "
+                f"Layout {int(after['LayoutCount'] - before['LayoutCount'])}회"
+            )
 
         assert len(chat_items) > 0, f"대화 목록이 로드되지 않았습니다. (로드된 항목: {len(chat_items)})"
 
@@ -563,6 +569,7 @@ class ChatHistoryTests:
     def test_chat_history_search_response_time(self):
         
         driver = self.driver
+        page = self.page
         wait = WebDriverWait(driver, 30)
 
         try:
@@ -573,58 +580,36 @@ class ChatHistoryTests:
             driver.execute_script("arguments[0].scrollTop = 0", sidebar)
             print("사이드바 스크롤 초기화 완료")
 
-            # 검색 버튼 클릭
-            try:
-                search_button = wait.until(
-                    EC.element_to_be_clickable(
-                        (By.XPATH, "//div[@role='button'][.//span[text()='검색']]")
-                    )
-                )
-                search_button.click()
-                print("검색 버튼 클릭 완료")
-            except Exception:
-                search_button = wait.until(
-                    EC.element_to_be_clickable(
-                        (By.XPATH, "//svg[@data-testid='magnifying-glassIcon']/ancestor::div[@role='button']")
-                    )
-                )
-                search_button.click()
-                print("검색 버튼 클릭 (아이콘 기반) 완료")
+            # 검색 버튼 클릭 (텍스트 / 아이콘 기반 locator 를 한 번에 대기)
+            search_button, locator = page.wait_for_any([
+                (By.XPATH, "//div[@role='button'][.//span[text()='검색']]"),
+                (By.XPATH, "//svg[@data-testid='magnifying-glassIcon']/ancestor::div[@role='button']"),
+            ], "clickable", timeout=30, name="search_button")
+            search_button.click()
+            print(f"검색 버튼 클릭 완료 ({locator[1]})")
 
             # 검색창 입력
-            try:
-                search_input = wait.until(
-                    EC.presence_of_element_located((By.CSS_SELECTOR, "input[cmdk-input]"))
-                )
-            except Exception:
-                search_input = wait.until(
-                    EC.presence_of_element_located((By.XPATH, "//input[@cmdk-input]"))
-                )
+            search_input, _ = page.wait_for_any([
+                (By.CSS_SELECTOR, "input[cmdk-input]"),
+                (By.XPATH, "//input[@cmdk-input]"),
+            ], timeout=30, name="search_input")
             search_input.clear()
             search_input.send_keys("테스트 새 대화")
             print("검색 키워드 입력 완료")
 
             # 검색 결과 확인
-            try:
-                search_results = wait.until(
-                    EC.presence_of_all_elements_located((By.CSS_SELECTOR, "[cmdk-item]"))
-                )
-            except Exception:
-                search_results = wait.until(
-                    EC.presence_of_all_elements_located((By.XPATH, "//div[@cmdk-item]"))
-                )
+            search_results, _ = page.wait_for_any([
+                (By.CSS_SELECTOR, "[cmdk-item]"),
+                (By.XPATH, "//div[@cmdk-item]"),
+            ], "all", timeout=30, name="search_results")
             assert search_results, "검색 결과가 없습니다"
             print(f"검색 결과 {len(search_results)}개 확인됨")
 
             # 첫 번째 결과 클릭
-            try:
-                first_result = wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, "[cmdk-item]:first-child"))
-                )
-            except Exception:
-                first_result = wait.until(
-                    EC.element_to_be_clickable((By.XPATH, "(//div[@cmdk-item])[1]"))
-                )
+            first_result, _ = page.wait_for_any([
+                (By.CSS_SELECTOR, "[cmdk-item]:first-child"),
+                (By.XPATH, "(//div[@cmdk-item])[1]"),
+            ], "clickable", timeout=30, name="search_first_result")
             first_result.click()
             print("첫 번째 검색 결과 클릭 완료")
 
@@ -642,47 +627,18 @@ class ChatHistoryTests:
         page = self.page
         wait = WebDriverWait(driver, timeout)
 
-        # 1. 첫 번째 채팅 항목 확보 - CSS 먼저, XPath fallback
-        first_chat = None
-        for _ in range(3):
-            try:
-                first_chat = wait.until(
-                    lambda d: d.find_elements(By.CSS_SELECTOR, '[data-testid="virtuoso-item-list"] a')
-                )[0]
-                if first_chat:
-                    break
-            except TimeoutException:
-                try:
-                    first_chat = wait.until(
-                        lambda d: d.find_elements(By.XPATH, '//div[@data-testid="virtuoso-item-list"]//a')
-                    )[0]
-                    if first_chat:
-                        break
-                except TimeoutException:
-                    time.sleep(0.5)
-
-        assert first_chat is not None, "첫 번째 채팅 요소를 찾을 수 없음"
-
-        # 2. ellipsis 메뉴 버튼 클릭 - CSS 먼저, XPath fallback + JS 클릭
-        ellipsis_btn = None
-        for _ in range(5):
-            try:
-                ellipsis_btn = wait.until(
-                    EC.element_to_be_clickable((By.CSS_SELECTOR, 'svg[data-testid="ellipsis-verticalIcon"]'))
-                )
-                if ellipsis_btn.is_displayed():
-                    break
-            except TimeoutException:
-                try:
-                    ellipsis_btn = wait.until(
-                        EC.element_to_be_clickable((By.XPATH, '//*[@id=":rh:"]/div/div/div[1]/div/div/div[1]/a[1]/div[2]/button/svg'))
-                    )
-                    if ellipsis_btn.is_displayed():
-                        break
-                except TimeoutException:
-                    time.sleep(0.5)
-
-        assert ellipsis_btn is not None, "ellipsis 버튼을 찾을 수 없음"
+        # 1. 첫 번째 채팅 항목 확보 - CSS / XPath 를 한 번에 대기
+        chat_links, _ = page.wait_for_any([
+            (By.CSS_SELECTOR, '[data-testid="virtuoso-item-list"] a'),
+            (By.XPATH, '//div[@data-testid="virtuoso-item-list"]//a'),
+        ], "all", timeout=timeout, name="chat_list_links")
+        first_chat = chat_links[0]
+
+        # 2. ellipsis 메뉴 버튼 클릭 - CSS / XPath 를 한 번에 대기 + JS 클릭
+        ellipsis_btn, _ = page.wait_for_any([
+            (By.CSS_SELECTOR, 'svg[data-testid="ellipsis-verticalIcon"]'),
+            (By.XPATH, '//*[@id=":rh:"]/div/div/div[1]/div/div/div[1]/a[1]/div[2]/button/svg'),
+        ], "clickable", timeout=timeout, name="chat_ellipsis")
         driver.execute_script("arguments[0].click();", ellipsis_btn)
 
         # 3. Delete 메뉴 클릭 - XPath + JS 클릭
@@ -723,11 +679,11 @@ class ChatHistoryTests:
 
         try:
             # 비로그인 상태로 AI 에이전트 메인 화면 접근
-            driver.get("https://qatrack.elice.io/ai-helpy-chat/agent")
+            driver.get(f"{BASE_URL}/agent")
 
             wait = WebDriverWait(driver, 10)
             # URL에 로그인 페이지 주소 일부가 포함되면 성공
-            wait.until(lambda d: "accounts.elice.io/accounts/signin" in d.current_url)
+            wait.until(lambda d: d.current_url.startswith(f"{ACCOUNTS_URL}/accounts/signin"))
             print(f"현재 URL: {driver.current_url}")
             print("로그인 없이 접근 시 로그인 페이지로 자동 이동 확인")
 
@@ -786,3 +742,37 @@ class ChatHistoryTests:
 
         assert failure_detected, "API 요청 실패가 기록되지 않음"
         print("네트워크 단절 시 API 요청 실패 정상 확인")
+
+
+# ----------------------- CHAT-HIS-018 -----------------------
+# CHAT-HIS-017 은 Python mock + JS 변수로 단절을 흉내 내므로, 여기서는 CDP 로 실제 오프라인 상태를 만든다
+@pytest.mark.exception
+@pytest.mark.high
+def test_network_offline_real(driver, login, network):
+
+    # 1. 로그인 후 대화 목록 로드 (정상 네트워크)
+    driver = login()
+    page = BasePage(driver)
+    assert page.get_chat_list(), "오프라인 전환 전 대화 목록이 비어 있음"
+
+    # 2. 오프라인 전환
+    network.apply("offline")
+    assert driver.execute_script("return navigator.onLine;") is False, "navigator.onLine 이 false 가 아님"
+
+    # 3. 페이지 안에서 보내는 API 요청이 실제로 실패하는지 확인
+    fetch_result = driver.execute_async_script("""
+        const done = arguments[arguments.length - 1];
+        fetch(location.href, { cache: 'no-store' }).then(() => done('ok')).catch(() => done('failed'));
+    """)
+    assert fetch_result == "failed", f"오프라인인데 요청이 성공함: {fetch_result}"
+
+    # 4. 새로고침 → 브라우저 오프라인 오류 페이지
+    driver.refresh()
+    offline_page = driver.execute_script("return document.documentURI.startsWith('chrome-error://');")
+    assert offline_page or "ERR_INTERNET_DISCONNECTED" in driver.page_source, "오프라인 새로고침이 오류 페이지가 아님"
+
+    # 5. 네트워크 복구 → 다시 로드되는지 확인
+    network.reset()
+    driver.refresh()
+    assert page.get_chat_list(), "네트워크 복구 후 대화 목록이 로드되지 않음"
+    print("실제 오프라인 전환 시 요청 실패 / 복구 후 재로드 정상 확인")
@@ -2,38 +2,57 @@
 # 1. 기본 라이브러리
 # ───────────────────────────────────────────────────────────────
 import os
-from dotenv import load_dotenv
-load_dotenv()  # env 파일 전체를 미리 읽어서 login()에서 사용 가능하게 함
-
 import re
-from datetime import datetime
+import socket
+import time
+from datetime import datetime, timezone
+from urllib.parse import urlsplit
 
 # ───────────────────────────────────────────────────────────────
 # 2. 외부 라이브러리
 # ───────────────────────────────────────────────────────────────
 import pytest
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver.chrome.service import Service
+# selenium.webdriver 는 드라이버 fixture 가 실제로 브라우저를 띄울 때 로드 (수집만 할 때는 로드하지 않음)
+from src.utils.lazy_selenium import webdriver, By, WebDriverWait, EC, Options, Service
 from selenium.common.exceptions import WebDriverException
-from webdriver_manager.chrome import ChromeDriverManager
 
 # ───────────────────────────────────────────────────────────────
-# 3. 내부 프로젝트 모듈
+# 3. 내부 프로젝트 모듈 (.env 는 settings 에서 한 번만 로드)
 # ───────────────────────────────────────────────────────────────
+from src.utils.lazy import LOAD_TIMES
+from src.utils.cdp_metrics import attach_metrics, detach_metrics, checkpoint
+from src.utils.locator_stats import locator_stats
 from src.pages.base_page import BasePage
-from src.config.settings import get_default_admin
+from src.config.settings import (BASE_URL, SIGNIN_URL, CUSTOM_AGENT_URL, IS_STAND_IN, ALL_ADMINS, API_ENABLED,
+    get_default_admin, get_usable_admins,
+)
 from tests.helpers.common_helpers import (_set_language_korean,  
 )
+from tests.helpers.driver_pool import DriverPool
+from tests.helpers.session_cache import LoginStateCache, LOGIN_CACHE_ENABLED
+from tests.helpers.account_lease import AccountLease
+from tests.helpers.perf_baseline import PerfBaseline
+from tests.helpers.artifacts import ArtifactWriter
+from tests.helpers.driver_resolver import resolve_chromedriver
+from tests.helpers.duration_history import DurationHistory, ordering_enabled
+from tests.helpers.sleep_profiler import SleepProfiler, SLEEP_PROFILE
+from tests.helpers.command_profiler import CommandProfiler, WEBDRIVER_PROFILE
+from tests.helpers.request_blocking import RequestBlocker, resolve_profile, format_stats
+from tests.helpers.network_profiles import NetworkEmulator, resolve_network
+from tests.helpers.entity_tracker import EntityTracker, merge_stats, format_cleanup
+from tests.helpers.launch_profiles import LAUNCH_PROFILE, resolve_launch_profile, apply_launch_profile
+from tests.helpers.resource_monitor import (ResourceMonitor, RESOURCE_MONITOR, RESOURCE_BUDGET_MB, RESOURCE_TOP,
+    format_resources,
+)
+from tests.stand_in.server import start_server
 
 # ───────────────────────────────────────────────────────────────
 # 4. 환경변수 기반 아티팩트 설정
 # ───────────────────────────────────────────────────────────────
 ARTIFACT_DIR = os.getenv("ARTIFACT_DIR", "artifacts")  # 저장 폴더
 CAPTURE_ON_XFAIL = os.getenv("CAPTURE_ON_XFAIL", "0") == "1"  # XFAIL도 캡처할지
+ACCOUNT_LEASE = os.getenv("ACCOUNT_LEASE", "0") == "1"  # 단일 프로세스에서도 계정 임대 사용할지
+CDP_METRICS = os.getenv("CDP_METRICS", "0") == "1"  # 모든 테스트에서 CDP 성능 지표 수집할지
 
 # ───────────────────────────────────────────────────────────────
 # 5. 유틸 함수 (11/13 황지애. chrome_options, chrome_driver_path 추가. driver, login 수정)
@@ -48,60 +67,68 @@ def _timestamp() -> str:
     return datetime.now().strftime("%Y%m%d_%H%M%S_%f")
 
 def _capture(driver, nodeid: str, tag: str = "fail"):
-    os.makedirs(ARTIFACT_DIR, exist_ok=True)
+    # 스크린샷/DOM 은 여기서 한 번만 가져오고, 파일 저장(gzip, 중복 제거)은 백그라운드 스레드에 맡김
     base = f"{_timestamp()}_{_safe_name(nodeid)}_{tag}"
-    png = os.path.join(ARTIFACT_DIR, base + ".png")
-    html = os.path.join(ARTIFACT_DIR, base + ".html")
+    png = html = None
     try:
-        driver.save_screenshot(png)
+        png = driver.get_screenshot_as_png()
     except WebDriverException:
         pass
     try:
-        with open(html, "w", encoding="utf-8") as f:
-            f.write(driver.page_source or "")
+        html = driver.page_source or ""
     except Exception:
         pass
     
-    # 참고용 경로 출력
-    print(f"[artifact] {png}")
-    print(f"[artifact] {html}")
+    _artifact_writer.submit(base, png, html)
 
-# ───────────────────────────────────────────────────────────────
-# 6. Chrome 설정(브라우저 옵션 fixture) - Chrome 옵션을 세션당 한 번만 생성
-# ───────────────────────────────────────────────────────────────
 
-@pytest.fixture(scope="session")
-def chrome_options():
-    opts = Options()
-    if os.getenv("HEADLESS", "0") == "1":
-        opts.add_argument("--headless=new")
-    opts.add_argument("--window-size=1920,1080")
-    opts.add_argument("--disable-gpu")
-    opts.add_argument("--no-sandbox")
-    opts.add_argument("--disable-dev-shm-usage")
-    return opts
+# 실패 아티팩트 저장 스레드 (세션 종료 시 flush)
+_artifact_writer = ArtifactWriter(ARTIFACT_DIR)
 
-# ───────────────────────────────────────────────────────────────
-# 7. 크롬 드라이버 경로 (webdriver-manager)   --- 11/19 수정(황지애)
-# ───────────────────────────────────────────────────────────────
 
-@pytest.fixture(scope="session")
-def chrome_driver_path():
-    """ChromeDriver 경로"""
-    if os.getenv("CI"):
-        return None   # ← Selenium이 PATH에서 찾음
-    else:
-        return ChromeDriverManager().install()
+def pytest_sessionfinish(session, exitstatus):
+    _artifact_writer.flush()
+
+    # 실행 시간 이력은 컨트롤러(또는 단일 프로세스)에서만 저장 - 워커 리포트도 컨트롤러로 모임
+    if not hasattr(session.config, "workerinput"):
+        recorded = _duration_history.commit()
+        if recorded:
+            _duration_history.save()
+            _session_report["durations"] = recorded
+
+    # 테스트가 만든 대화 / 에이전트 정리 결과 (정리는 _entity_cleanup fixture 가 브라우저 풀 종료 전에 수행)
+    stats = _session_report.get("entity_cleanup")
+    if stats and hasattr(session.config, "workerinput"):
+        session.config.workeroutput["entity_cleanup"] = stats
+    elif stats:
+        merge_stats(_session_report.setdefault("cleanup", {}), stats)
+
+    # 대체 locator 승리 통계 저장 (프로세스마다 자기 증가분을 파일에 더함, 리포트용 증가분은 컨트롤러로 전달)
+    locator_stats.save()
+    if hasattr(session.config, "workerinput"):
+        session.config.workeroutput["locator_stats"] = locator_stats.session
 
+    # 워커에서 찾은 chromedriver 정보도 컨트롤러 세션 요약 / 리포트에 표시되도록 전달
+    if hasattr(session.config, "workerinput") and _session_report.get("chromedriver"):
+        session.config.workeroutput["chromedriver"] = _session_report["chromedriver"]
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_testnodedown(node, error):
+    output = getattr(node, "workeroutput", {})
+    if output.get("entity_cleanup"):
+        merge_stats(_session_report.setdefault("cleanup", {}), output["entity_cleanup"])
+    if output.get("locator_stats"):
+        locator_stats.merge(output["locator_stats"])
+    if output.get("chromedriver"):
+        _record_chromedriver(node.config, output["chromedriver"])
 
 # ───────────────────────────────────────────────────────────────
-# 8. driver fixture (function scope)       --- 11/19 수정(황지애)
+# 6. Chrome 설정(브라우저 옵션 fixture) - 실행 프로필별 Options 생성 함수
+#    (fidelity / fast, tests/helpers/launch_profiles.py 참고)
 # ───────────────────────────────────────────────────────────────
 
-@pytest.fixture
-def driver(chrome_driver_path):
-    
-    # 각 테스트마다 새 브라우저 인스턴스 생성
+def _build_chrome_options(profile=LAUNCH_PROFILE):
     opts = Options()
     
     # CI 환경(GitHub Actions)에서만 headless
@@ -120,6 +147,97 @@ def driver(chrome_driver_path):
         'intl.accept_languages': 'ko-KR,ko,en-US,en'
     })
     
+    # 요청 차단 프로필을 쓰는 테스트가 있으면 차단된 요청 집계용 performance 로그 활성화
+    if _request_blocking_used:
+        opts.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+    
+    return apply_launch_profile(opts, profile)
+
+
+@pytest.fixture(scope="session")
+def chrome_options():
+    """chrome_options(프로필 이름) → 새 Options (driver 풀 / 실행 벤치마크 공용)"""
+    return _build_chrome_options
+
+# ───────────────────────────────────────────────────────────────
+# 7. 크롬 드라이버 경로 (로컬 캐시 → webdriver-manager)   --- 11/19 수정(황지애)
+# ───────────────────────────────────────────────────────────────
+
+@pytest.fixture(scope="session")
+def chrome_driver_path(request):
+    """ChromeDriver 경로 (로컬 캐시 우선, 없을 때만 다운로드)"""
+    if os.getenv("CI"):
+        return None   # ← Selenium이 PATH에서 찾음
+
+    path, info = resolve_chromedriver()
+    _record_chromedriver(request.config, info)
+    return path
+
+
+def _record_chromedriver(config, info):
+    # 병렬 실행 시 워커마다 따로 찾으므로 가장 오래 걸린 결과(다운로드한 워커)를 표시
+    previous = _session_report.get("chromedriver")
+    if previous and previous["seconds"] >= info["seconds"]:
+        return
+    _session_report["chromedriver"] = info
+
+    # pytest-html 리포트 Environment 표에도 기록 (컨트롤러의 metadata 가 리포트에 쓰임)
+    try:
+        from pytest_metadata.plugin import metadata_key
+        config.stash[metadata_key]["ChromeDriver"] = (
+            f"{info['driver'] or '-'} ({info['source']}, {info['seconds']:.3f}s)"
+        )
+    except (ImportError, KeyError):
+        pass
+
+
+# 세션 요약에 출력할 정보 모음
+_session_report = {}
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    if config.getoption("--import-times"):
+        _write_import_times(terminalreporter)
+
+    if _session_report.get("durations"):
+        _write_duration_summary(terminalreporter, config)
+
+    blocked = _session_report.get("blocked")
+    if blocked:
+        terminalreporter.write_line(
+            f"[block] 요청 차단 테스트 {blocked['tests']}개 / 차단 {blocked['requests']}건 "
+            f"≈ {blocked['bytes'] / 1_048_576:.1f}MB 절감(추정)"
+        )
+
+    cleanup = _session_report.get("cleanup")
+    if cleanup and cleanup.get("chat", 0) + cleanup.get("agent", 0) + cleanup.get("failed", 0):
+        terminalreporter.write_line(f"[cleanup] 테스트 생성 항목 정리: {format_cleanup(cleanup)}")
+
+    if _session_report.get("resources"):
+        _write_resource_summary(terminalreporter)
+
+    fallbacks = locator_stats.fallbacks()
+    if fallbacks:
+        terminalreporter.write_line(f"[locators] 기본 locator 대신 대체 locator 로 찾은 대기 {len(fallbacks)}종 (selector 점검 필요)")
+        for name, label, count, seconds in fallbacks:
+            terminalreporter.write_line(f"  {count:4d}회 평균 {seconds:5.2f}s  {name} → {label}")
+
+    info = _session_report.get("chromedriver")
+    if info:
+        terminalreporter.write_line(
+            f"[chromedriver] Chrome {info['chrome'] or '?'} → driver {info['driver'] or '?'} "
+            f"({info['source']}, {info['seconds'] * 1000:.0f}ms) {info['path'] or ''}"
+        )
+
+
+# ───────────────────────────────────────────────────────────────
+# 8. driver fixture (function scope)       --- 11/19 수정(황지애)
+#    브라우저 풀(session scope)에서 꺼내 쓰고, 테스트 종료 후 초기화해서 반납
+# ───────────────────────────────────────────────────────────────
+
+def _new_chrome(chrome_driver_path, opts):
+    
+    # 새 브라우저 인스턴스 생성 (풀에 같은 프로필 브라우저가 없을 때만 호출됨)
     # None이면 Service() 경로 없이 생성
     if chrome_driver_path:
         service = Service(chrome_driver_path)
@@ -127,70 +245,241 @@ def driver(chrome_driver_path):
         service = Service()  # Selenium이 PATH에서 자동으로 찾음
     
     browser = webdriver.Chrome(service=service, options=opts)
+    browser._performance_log = _request_blocking_used
+    return browser
+
+
+# 수집된 테스트 중 요청 차단 프로필(none 이외)을 쓰는 테스트가 있는지 (pytest_collection_modifyitems 에서 설정)
+_request_blocking_used = False
+
+
+@pytest.fixture(scope="session")
+def new_chrome(chrome_driver_path, chrome_options):
+    """new_chrome(프로필 이름) → 풀을 거치지 않은 새 브라우저 (호출한 쪽에서 quit)"""
+    return lambda profile=LAUNCH_PROFILE: _new_chrome(chrome_driver_path, chrome_options(profile))
+
+
+@pytest.fixture(scope="session")
+def driver_pool(new_chrome):
+    # DRIVER_POOL=0 이면 기존처럼 테스트마다 브라우저 종료, 대기 브라우저는 실행 프로필별로 재사용
+    pool = DriverPool(new_chrome)
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def driver(request, driver_pool):
+    
+    # 풀에서 실행 프로필(마커 launch_profile 또는 LAUNCH_PROFILE)이 같은 브라우저 대여 (없으면 새로 생성)
+    browser = driver_pool.checkout(resolve_launch_profile(request.node))
+    
+    # WEBDRIVER_PROFILE=1 이면 명령 단위 프로파일러 연결
+    profiler = request.config.pluginmanager.get_plugin("webdriver-profiler")
+    if profiler:
+        profiler.attach(browser)
+    
+    # CDP_METRICS=1 이면 모든 테스트에서 checkpoint 지표 수집 (아니면 cdp_metrics fixture 를 쓴 테스트만)
+    # login fixture 보다 먼저 연결해야 "login" checkpoint 가 기록됨
+    if CDP_METRICS or "cdp_metrics" in request.fixturenames:
+        request.node.cdp_metrics = attach_metrics(browser)
+    
+    # 요청 차단 프로필 적용 (마커 block_requests 또는 REQUEST_BLOCKING)
+    name, patterns = resolve_profile(request.node)
+    blocker = None
+    if patterns or browser._performance_log:
+        blocker = RequestBlocker(browser, name, patterns)
+        blocker.apply()
+    
+    # 네트워크 조건 에뮬레이션 (마커 network 또는 NETWORK_PROFILE, 반납 시 reset_browser 에서 해제)
+    # login fixture 를 쓰는 테스트는 로그인이 느려지거나 끊기지 않도록 로그인 후에 적용 (login fixture 참고)
+    net_name, net_custom = resolve_network(request.node)
+    if net_name != "none" and "login" not in request.fixturenames:
+        NetworkEmulator(browser).apply(net_name, **net_custom)
+    
+    # RESOURCE_MONITOR=1 이면 브라우저 프로세스 트리 RSS / CPU + JS 힙 측정
+    monitor = ResourceMonitor(browser).start() if RESOURCE_MONITOR else None
     
     yield browser
     
-    # 테스트 종료 후 브라우저 닫기
-    browser.quit()
+    # 리소스 측정 종료 (리포트 user_properties + 세션 요약)
+    if monitor:
+        resources = monitor.stop()
+        print(f"\n[resource] {format_resources(resources)}")
+        request.node.user_properties.append(("resources", resources))
+    
+    # 차단 통계 기록 (리포트 user_properties + 세션 합계)
+    if blocker:
+        stats = blocker.collect()
+        if stats["profile"] != "none":
+            print(f"\n[block] {format_stats(stats)}")
+            request.node.user_properties.append(("blocked_requests", stats))
+    
+    # 테스트 종료 후 지표 수집기 해제, 쿠키/스토리지/탭 초기화 → 풀에 반납
+    detach_metrics(browser)
+    driver_pool.checkin(browser)
+
+
+@pytest.fixture
+def network(request, driver):
+    """
+    네트워크 조건 제어 (테스트 도중 변경용)
+    - network.apply("offline") / network.apply("custom", download_kbps=500, latency_ms=300) / network.reset()
+    - 마커 / NETWORK_PROFILE 로 적용된 프로필은 network.profile 로 확인
+      (login fixture 를 쓰는 테스트는 login() 이 끝난 뒤부터 적용됨)
+    """
+    emulator = NetworkEmulator(driver)
+    emulator.profile = resolve_network(request.node)[0]
+    return emulator
+
+
+@pytest.fixture
+def cdp_metrics(request, driver):
+    """
+    CDP 성능 지표 수집기 (login / 언어 설정 / 커스텀 에이전트 / 크레딧 페이지 등 checkpoint 시점마다 기록)
+    - 기록된 지표는 테스트 리포트(pytest-html, junit properties)에 첨부됨
+    - 직접 기록: cdp_metrics.capture("라벨")
+    - 수집기는 driver fixture 가 로그인 전에 연결해 둠 (login checkpoint 포함)
+    """
+    collector = getattr(request.node, "cdp_metrics", None)
+    if collector is None:
+        collector = request.node.cdp_metrics = attach_metrics(driver)
+    return collector
 
 # ───────────────────────────────────────────────────────────────
 # 9. login fixture
 # ───────────────────────────────────────────────────────────────
 
+@pytest.hookimpl(optionalhook=True)
+def pytest_xdist_auto_num_workers(config):
+    # `-n auto` → CPU 수와 사용 가능한 계정 수 중 작은 값 (워커 1개 = 계정 1개)
+    return max(1, min(os.cpu_count() or 1, len(get_usable_admins())))
+
+
+@pytest.fixture(scope="session")
+def leased_account():
+    """
+    병렬 실행(pytest-xdist) 워커가 세션 동안 독점하는 관리자 계정
+    - 워커가 아니고 ACCOUNT_LEASE=1 도 아니면 None (기존처럼 get_default_admin 사용)
+    """
+    worker = os.getenv("PYTEST_XDIST_WORKER")
+    if not (worker or ACCOUNT_LEASE):
+        yield None
+        return
+
+    lease = AccountLease(ALL_ADMINS)
+    account = lease.acquire(worker or "main")
+    yield account
+    lease.release()
+
+
+@pytest.fixture(scope="session")
+def login_account(leased_account):
+    # login() 에 계정을 넘기지 않으면 로그인하는 계정 (임대한 계정 또는 기본 관리자)
+    return leased_account or get_default_admin()
+
+
+@pytest.fixture(scope="session")
+def login_cache():
+    # LOGIN_CACHE=0 이면 캐시 없이 매번 로그인 폼 사용
+    return LoginStateCache() if LOGIN_CACHE_ENABLED else None
+
+
+def _login_browser(driver, acc, login_cache):
+    # 브라우저 로그인 (login fixture / 세션 끝 정리 시 재로그인 공용)
+    print(f"\n[로그인] {acc.description} ({acc.username})")
+    
+    # 2-1. 저장된 로그인 상태가 있으면 주입 후 바로 채팅 페이지로 (거부되면 폼 로그인)
+    if login_cache and login_cache.restore(driver, acc, BASE_URL):
+        checkpoint(driver, "login")
+        _set_language_korean(driver)
+        return driver
+    
+    # 3. 로그인 페이지 이동
+    driver.get(SIGNIN_URL)
+    
+    # 4. 쿠키/스토리지 정리
+    driver.delete_all_cookies()
+    try:
+        driver.execute_script("window.localStorage.clear();")
+        driver.execute_script("window.sessionStorage.clear();")
+    except Exception:
+        pass
+    
+    # 5. 로그인 필드 대기
+    WebDriverWait(driver, 10).until(
+        EC.visibility_of_element_located(
+            (By.CSS_SELECTOR, "input[autocomplete='username'], input[type='email']")
+        )
+    )
+    
+    # 6. 아이디/비밀번호 입력
+    id_input = driver.find_element(By.CSS_SELECTOR, "input[autocomplete='username'], input[type='email']")
+    pw_input = driver.find_element(By.CSS_SELECTOR, "input[type='password']")
+
+    id_input.clear()
+    pw_input.clear()
+    id_input.send_keys(acc.username)
+    pw_input.send_keys(acc.password)
+    
+    # 7. 로그인 버튼 클릭
+    driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
+    
+    # 8. 로그인 완료 대기
+    WebDriverWait(driver, 30).until(EC.url_contains("/ai-helpy-chat"))
+    checkpoint(driver, "login")
+    
+    # 9. 언어를 한국어로 설정
+    _set_language_korean(driver)
+    
+    # 10. 다음 로그인부터 재사용할 수 있도록 상태 저장
+    if login_cache:
+        login_cache.save(driver, acc)
+    return driver
+
+
 @pytest.fixture
-def login(driver):
+def login(request, driver, login_cache, login_account):
+    # 로그인 직후 / 테스트 종료 시 대화·에이전트 목록 비교 → 새로 생긴 항목을 세션 끝에 정리
+    tracker_api = None
+    if _entity_tracker.enabled:
+        request.getfixturevalue("_entity_cleanup")
+        tracker_api = request.getfixturevalue("_tracker_api")
+    tracked = {}
+    net_name, net_custom = resolve_network(request.node)
+    net_applied = []
+
+    def _track_start(acc):
+        if tracker_api is None:
+            return
+        tracker_api.bind(driver)
+        tracked.update(account=acc.username, before=_entity_tracker.snapshot(tracker_api, acc.username))
+        tracker_api.unbind()
+
     def _login(account=None):
         
-        # 1. 계정 선택
-        acc = account or get_default_admin()
+        # 1. 계정 선택 (병렬 실행 중이면 워커가 임대한 계정)
+        acc = account or login_account
         
         # 2. 계정 정보 확인
         if not acc.username or not acc.password:
             raise ValueError(f"계정 정보가 .env에 없습니다: {acc}")
-        print(f"\n[로그인] {acc.description} ({acc.username})")
-        
-        # 3. 로그인 페이지 이동
-        driver.get(
-            "https://accounts.elice.io/accounts/signin/me"
-            "?continue_to=https%3A%2F%2Fqaproject.elice.io%2Fai-helpy-chat"
-        )
-        
-        # 4. 쿠키/스토리지 정리
-        driver.delete_all_cookies()
-        try:
-            driver.execute_script("window.localStorage.clear();")
-            driver.execute_script("window.sessionStorage.clear();")
-        except Exception:
-            pass
-        
-        # 5. 로그인 필드 대기
-        WebDriverWait(driver, 10).until(
-            EC.visibility_of_element_located(
-                (By.CSS_SELECTOR, "input[autocomplete='username'], input[type='email']")
-            )
-        )
         
-        # 6. 아이디/비밀번호 입력
-        id_input = driver.find_element(By.CSS_SELECTOR, "input[autocomplete='username'], input[type='email']")
-        pw_input = driver.find_element(By.CSS_SELECTOR, "input[type='password']")
-
-        id_input.clear()
-        pw_input.clear()
-        id_input.send_keys(acc.username)
-        pw_input.send_keys(acc.password)
-        
-        # 7. 로그인 버튼 클릭
-        driver.find_element(By.CSS_SELECTOR, "button[type='submit']").click()
-        
-        # 8. 로그인 완료 대기
-        WebDriverWait(driver, 30).until(EC.url_contains("/ai-helpy-chat"))
-        
-        # 9. 언어를 한국어로 설정
-        _set_language_korean(driver)
-
+        # 3 ~ 10. 브라우저 로그인 (저장된 상태 복원 또는 폼 로그인)
+        _login_browser(driver, acc, login_cache)
+        _track_start(acc)
+
+        # 11. 네트워크 조건(마커 network / NETWORK_PROFILE)은 첫 로그인이 끝난 뒤 적용
+        if net_name != "none" and not net_applied:
+            NetworkEmulator(driver).apply(net_name, **net_custom)
+            net_applied.append(net_name)
         return driver
 
-    return _login
+    yield _login
+
+    if tracked:
+        tracker_api.bind(driver)
+        _entity_tracker.track_new(tracker_api, tracked["before"], tracked["account"], request.node.nodeid)
+        tracker_api.unbind()
 
 # ───────────────────────────────────────────────────────────────
 # 10. 실패 아티팩트 공통 훅 (테스트 결과 캡처) - 각 테스트 단계(setup/call/teardown) 리포트를 node에 붙여줌
@@ -202,6 +491,18 @@ def pytest_runtest_makereport(item, call):
     rep = outcome.get_result()
     setattr(item, "rep_" + rep.when, rep)
     
+    # CDP 성능 지표가 기록됐으면 리포트에 첨부 (junit properties + pytest-html)
+    collector = getattr(item, "cdp_metrics", None)
+    if rep.when == "call" and collector and collector.checkpoints:
+        rep.user_properties.append(("cdp_metrics", collector.checkpoints))
+        try:
+            from pytest_html import extras as html_extras
+            rep.extras = getattr(rep, "extras", []) + [
+                html_extras.json(collector.checkpoints, name="CDP metrics")
+            ]
+        except ImportError:
+            pass
+    
 # XFAIL 캡처 스위치 ← 여기만 True/False로 켜고 끄면 됨. True로 바꾸면 xfail도 캡처
 CAPTURE_XFAIL = False
 
@@ -251,7 +552,7 @@ def custom_agent_page(login, page):
     Custom Agent 페이지로 이동한 BasePage 객체를 반환
     """
     driver = login()
-    page.open("https://qaproject.elice.io/ai-helpy-chat/custom-agent")
+    page.open_custom_agent()
     return page
 
 def wait_for_custom_card(page, index=0, timeout=10):
@@ -275,4 +576,286 @@ def wait_for_custom_card(page, index=0, timeout=10):
     cards = page.wait_for_elements((By.CSS_SELECTOR, "div[data-testid='ai-card']"), timeout=timeout)
     return cards[index]
 
-# 11/18 김은아 추가
\ No newline at end of file
+# 11/18 김은아 추가
+
+# ───────────────────────────────────────────────────────────────
+# 15. 성능 기준선 fixture (벤치마크 결과 저장 / 회귀 비교)
+# ───────────────────────────────────────────────────────────────
+
+@pytest.fixture(scope="session")
+def perf_baseline():
+    """perf_baseline.json 에 측정 이력/기준선 저장 (PERF_BASELINE_FILE 로 경로 변경)"""
+    return PerfBaseline()
+
+# ───────────────────────────────────────────────────────────────
+# 16. 로컬 스탠드인 서버 (BASE_URL 이 localhost 일 때)
+# ───────────────────────────────────────────────────────────────
+
+def _is_listening(host, port):
+    try:
+        with socket.create_connection((host, port), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+@pytest.fixture(scope="session", autouse=True)
+def stand_in_server():
+    """
+    BASE_URL=http://127.0.0.1:<port>/ai-helpy-chat 이면 스탠드인 서버를 세션 동안 자동 실행
+    - 이미 떠 있으면 그대로 사용 (python -m tests.stand_in.server 로 직접 띄운 경우)
+    - 병렬 실행(xdist) 시에는 워커끼리 서버를 공유해야 하므로 직접 띄워 두고 실행할 것
+    """
+    if not IS_STAND_IN:
+        yield None
+        return
+
+    base = urlsplit(BASE_URL)
+    host, port = base.hostname, base.port or 80
+    if _is_listening(host, port) or os.getenv("PYTEST_XDIST_WORKER"):
+        yield None
+        return
+
+    server, _ = start_server(host, port)
+    print(f"\n[stand-in] 로컬 서버 실행: {BASE_URL}")
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+# ───────────────────────────────────────────────────────────────
+# 17. import / 수집 시간 리포트 (--import-times)
+# ───────────────────────────────────────────────────────────────
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--import-times", action="store_true", default=False,
+        help="테스트 모듈별 import(수집) 시간과 지연 로드된 모듈의 로드 시간을 세션 끝에 출력",
+    )
+    parser.addoption(
+        "--benchmark", action="store_true", default=False,
+        help="benchmark 마커 테스트 실행 (기본은 제외, -m 에 benchmark 를 쓰면 자동 포함)",
+    )
+
+
+# 테스트 모듈 경로 → 수집(import 포함) 소요 시간(초)
+_collect_times = {}
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_make_collect_report(collector):
+    if not isinstance(collector, pytest.Module):
+        yield
+        return
+    start = time.perf_counter()
+    yield
+    _collect_times[collector.nodeid] = time.perf_counter() - start
+
+
+def _write_import_times(terminalreporter):
+    write = terminalreporter.write_line
+    total = sum(_collect_times.values())
+    write(f"[import-times] 테스트 모듈 수집 {len(_collect_times)}개 / 합계 {total * 1000:.0f}ms")
+    for nodeid, seconds in sorted(_collect_times.items(), key=lambda kv: kv[1], reverse=True):
+        write(f"  {seconds * 1000:8.1f}ms  {nodeid}")
+    if LOAD_TIMES:
+        write("[import-times] 지연 로드된 모듈 (첫 사용 시점)")
+        for name, seconds in sorted(LOAD_TIMES.items(), key=lambda kv: kv[1], reverse=True):
+            write(f"  {seconds * 1000:8.1f}ms  {name}")
+    else:
+        write("[import-times] 지연 로드된 모듈 없음 (selenium.webdriver 미로드)")
+
+
+# ───────────────────────────────────────────────────────────────
+# 18. 실행 시간 이력 기반 정렬 (긴 테스트 먼저 → 병렬 실행 시 워커 간 부하 균형)
+# ───────────────────────────────────────────────────────────────
+
+_duration_history = DurationHistory()
+
+
+def _deselect_benchmarks(config, items):
+    # 벤치마크는 반복 측정 + 기준선 파일 갱신이라 기본 실행(CI 포함)에서 제외 → --benchmark / -m benchmark 로 실행
+    if config.getoption("--benchmark") or "benchmark" in (config.option.markexpr or ""):
+        return
+    skipped = [item for item in items if item.get_closest_marker("benchmark")]
+    if skipped:
+        items[:] = [item for item in items if not item.get_closest_marker("benchmark")]
+        config.hook.pytest_deselected(items=skipped)
+
+
+def pytest_collection_modifyitems(config, items):
+    _deselect_benchmarks(config, items)
+
+    # DURATION_ORDER=auto(기본)면 xdist 워커에서만 정렬 - 모든 워커가 같은 이력 파일로 같은 순서를 만듦
+    if ordering_enabled():
+        _duration_history.order_longest_first(items)
+
+    # 요청 차단 프로필을 쓰는 테스트가 있으면 드라이버 생성 시 performance 로그를 켬
+    global _request_blocking_used
+    _request_blocking_used = any(resolve_profile(item)[1] for item in items)
+
+    # 실행 프로필 이름 검증 (잘못된 LAUNCH_PROFILE / 마커는 브라우저를 띄우기 전에 중단)
+    for item in items:
+        resolve_launch_profile(item)
+
+
+def pytest_runtest_logreport(report):
+    if os.getenv("PYTEST_XDIST_WORKER"):
+        return
+    _duration_history.add(report)
+
+    # 요청 차단 통계 합계 / 테스트별 리소스 측정값 (워커 리포트도 컨트롤러로 모임)
+    if report.when == "teardown":
+        for name, stats in report.user_properties:
+            if name == "resources":
+                _session_report.setdefault("resources", {})[report.nodeid] = stats
+            if name == "blocked_requests":
+                total = _session_report.setdefault("blocked", {"tests": 0, "requests": 0, "bytes": 0})
+                total["tests"] += 1
+                total["requests"] += stats["requests"]
+                total["bytes"] += stats["bytes"]
+
+
+def _write_resource_summary(terminalreporter):
+    write = terminalreporter.write_line
+    resources = _session_report["resources"]
+    over = [nodeid for nodeid, stats in resources.items() if stats["over_budget"]]
+    write(f"[resource] 측정 테스트 {len(resources)}개 / 예산 {RESOURCE_BUDGET_MB:.0f}MB 초과 {len(over)}개")
+
+    write(f"  {'최대RSS':>8}{'증가':>8}{'JS힙증가':>10}{'CPU최대':>8}  테스트 (최대 RSS 상위 {RESOURCE_TOP})")
+    top = sorted(resources.items(), key=lambda kv: kv[1]["rss_peak_mb"], reverse=True)[:RESOURCE_TOP]
+    for nodeid, stats in top:
+        heap = f"{stats['heap_delta_mb']:+.0f}" if stats["heap_delta_mb"] is not None else "-"
+        mark = " ⚠️" if stats["over_budget"] else ""
+        write(
+            f"  {stats['rss_peak_mb']:8.0f}{stats['rss_delta_mb']:+8.0f}{heap:>10}{stats['cpu_peak']:7.0f}%  {nodeid}{mark}"
+        )
+    for nodeid in over:
+        if nodeid not in dict(top):
+            write(f"  ⚠️ 예산 초과: {nodeid} ({resources[nodeid]['rss_peak_mb']:.0f}MB)")
+
+
+def _write_duration_summary(terminalreporter, config):
+    nodeids = _session_report["durations"]
+    workers = getattr(config.option, "numprocesses", None)
+    line = f"[durations] {len(nodeids)}개 기록 → {_duration_history.path}"
+    if isinstance(workers, int) and workers > 1:
+        makespan, total = _duration_history.makespan(nodeids, workers)
+        line += f" | 합계 {total:.0f}s, 워커 {workers}개 예상 {makespan:.0f}s (이상적 {total / workers:.0f}s)"
+    terminalreporter.write_line(line)
+
+
+# ───────────────────────────────────────────────────────────────
+# 19. 프로파일러 플러그인
+#     - 고정 sleep 프로파일러 (SLEEP_PROFILE=1 이면 켬)
+#     - WebDriver 명령 프로파일러 (WEBDRIVER_PROFILE=1 이면 켬)
+# ───────────────────────────────────────────────────────────────
+
+def pytest_configure(config):
+    if SLEEP_PROFILE:
+        profiler = SleepProfiler(config.rootpath)
+        profiler.install()
+        config.add_cleanup(profiler.uninstall)
+        config.pluginmanager.register(profiler, "sleep-profiler")
+
+    if WEBDRIVER_PROFILE:
+        config.pluginmanager.register(CommandProfiler(config.rootpath), "webdriver-profiler")
+
+
+# ───────────────────────────────────────────────────────────────
+# 20. HTTP API 클라이언트 (테스트 사전 데이터 생성 / 정리)
+#     - UI 대신 HTTP 로 채팅 생성 / 이름 변경 / 삭제 → 준비 시간 단축
+#     - 세션 동안 requests.Session 1개(커넥션 풀) 재사용, 인증은 브라우저 쿠키 공유
+# ───────────────────────────────────────────────────────────────
+
+@pytest.fixture(scope="session")
+def api_client():
+    # API 경로가 확인된 환경에서만 사용 (스탠드인 모드 또는 API_ENABLED=1)
+    if not API_ENABLED:
+        pytest.skip("HTTP API 비활성 (API_ENABLED=0) - 실제 서비스 API 경로를 지정하고 API_ENABLED=1 로 실행")
+    # requests 는 API 를 쓰는 테스트가 있을 때만 로드 (수집 시간에 포함되지 않도록)
+    client = _new_api_client()
+    yield client
+    client.close()
+
+
+def _new_api_client():
+    from src.api.client import ApiClient
+    return ApiClient()
+
+
+# 테스트가 만든 항목 추적기 (ENTITY_CLEANUP, 기본은 API_ENABLED 를 따름 - tests/helpers/entity_tracker.py 참고)
+_entity_tracker = EntityTracker()
+
+
+@pytest.fixture(scope="session")
+def _tracker_api():
+    # 추적용 조회는 테스트가 쓰는 api 클라이언트와 연결(bind) 상태가 섞이지 않도록 별도 클라이언트 사용
+    client = _new_api_client()
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def _entity_cleanup(driver_pool, login_cache):
+    """
+    세션 끝에 추적한 항목 일괄 삭제 (login fixture 가 추적을 시작할 때 요청)
+    - 브라우저 풀보다 먼저 종료되므로, 저장된 쿠키가 만료된 계정은 풀의 브라우저로 다시 로그인해서 쿠키를 받음
+    """
+    yield
+
+    def relogin(username):
+        acc = next(a for a in ALL_ADMINS if a.username == username)
+        browser = driver_pool.checkout(LAUNCH_PROFILE)
+        client = _new_api_client()
+        try:
+            client.bind(_login_browser(browser, acc, login_cache)).sync_cookies()
+            return client.export_cookies()
+        finally:
+            client.close()
+            driver_pool.checkin(browser)
+
+    _session_report["entity_cleanup"] = _entity_tracker.cleanup(_new_api_client, relogin)
+
+
+@pytest.fixture
+def api(api_client, driver):
+    """
+    로그인된 브라우저의 쿠키로 요청하는 API 클라이언트
+    - 쿠키는 첫 요청 시점에 가져오므로 login() 이후에 사용
+    - api.create_chat("제목") / api.rename_chat(id, "새 제목") / api.list_chats() / api.delete_chat(id)
+    """
+    api_client.bind(driver)
+    yield api_client
+    api_client.unbind()
+
+
+SEED_CHAT_COUNT = int(os.getenv("SEED_CHAT_COUNT", "3"))
+
+
+@pytest.fixture
+def seeded_chats(request, driver):
+    """
+    대화 목록이 필요한 테스트용 사전 데이터 (UI 로 대화를 만들지 않고 API 로 생성)
+    - 생성 시각을 1분씩 다르게 해서 정렬 순서가 정해지도록 함 (마지막 항목이 최신)
+    - 생성 후 브라우저 새로고침 → 사이드바에 반영, 테스트 끝나면 남은 대화 삭제 (이미 삭제됐으면 무시)
+    - API 비활성(API_ENABLED=0)이면 빈 리스트 → 계정에 이미 있는 대화로 테스트
+    """
+    if not API_ENABLED:
+        yield []
+        return
+
+    api = request.getfixturevalue("api")
+    stamp = _timestamp()
+    now = time.time()
+    chats = []
+    for i in range(SEED_CHAT_COUNT):
+        created_at = datetime.fromtimestamp(now - (SEED_CHAT_COUNT - i) * 60, timezone.utc).isoformat()
+        chats.append(api.create_chat(f"[seed] {stamp} #{i + 1}", created_at=created_at))
+    print(f"\n[api] 대화 {len(chats)}개 생성")
+    driver.refresh()
+
+    yield chats
+
+    for chat in chats:
+        api.delete_chat(chat["id"])
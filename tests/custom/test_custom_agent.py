@@ -1,29 +1,27 @@
 # test_custom_agent.py
 
 import pytest
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from src.utils.lazy_selenium import By, WebDriverWait, EC, Keys
 from selenium.common.exceptions import TimeoutException, StaleElementReferenceException
-from selenium.webdriver.common.keys import Keys
 import time
 
-def go_to_agent_page(driver, wait):
+from src.pages.base_page import BasePage
+
+# Agent Explorer 버튼 (CSS 우선, XPath 대체 - 한 번에 같이 대기)
+AGENT_EXPLORER_LOCATORS = [
+    (By.CSS_SELECTOR, "a.MuiListItemButton-root[href='/ai-helpy-chat/agent']"),
+    (By.XPATH, '//li[a[contains(@href,"/ai-helpy-chat/agent")]]/a'),
+]
+
+def go_to_agent_page(driver, wait, timeout=20):
     # Agent Explorer 클릭 후 Custom Agent 페이지로 이동
     try:
-        # CSS 먼저 시도
-        element = wait.until(
-            EC.element_to_be_clickable((By.CSS_SELECTOR, "a.MuiListItemButton-root[href='/ai-helpy-chat/agent']"))
+        element, _ = BasePage(driver).wait_for_any(
+            AGENT_EXPLORER_LOCATORS, "clickable", timeout=timeout, name="agent_explorer"
         )
     except TimeoutException:
-        try:
-            # CSS 실패 시 XPath fallback
-            element = wait.until(
-                EC.element_to_be_clickable((By.XPATH, '//li[a[contains(@href,"/ai-helpy-chat/agent")]]/a'))
-            )
-        except TimeoutException:
-            driver.save_screenshot("artifacts/agent_explorer_not_found.png")
-            raise Exception("Agent Explorer 버튼을 찾을 수 없음")
+        driver.save_screenshot("artifacts/agent_explorer_not_found.png")
+        raise Exception("Agent Explorer 버튼을 찾을 수 없음")
     element.click()
     try:
         wait.until(lambda d: "/agent" in d.current_url)
@@ -97,6 +95,8 @@ class TestCustomAgent:
 # ---------------- TEST 4: 이미지 alt 속성 검증 ----------------
 @pytest.mark.ui
 @pytest.mark.high
+@pytest.mark.block_requests("none")  # 이미지 로드가 필요한 검증 → 요청 차단 사용 안 함
+@pytest.mark.launch_profile("fidelity")  # 이미지 로드 완료(load 이벤트)까지 기다려야 하는 검증
 def test_agent_images_alt_text(self, driver, login):
     driver = login()
     wait = WebDriverWait(driver, 20)
@@ -0,0 +1,78 @@
+"""
+계정 임대(lease) 헬퍼
+- 병렬 실행(pytest-xdist) 시 워커 프로세스 하나가 관리자 계정 하나를 독점하도록 lock 파일로 관리
+- lock 파일: <lease_dir>/<계정 해시>.lock  (내용: pid / 워커 이름 / 획득 시각, 확인용)
+- 독점은 파일 존재 여부가 아니라 OS 파일 잠금(src/utils/file_lock.py)으로 판단
+    → 프로세스가 비정상 종료되면 OS 가 잠금을 풀어 주므로 버려진 lock 회수 과정이 필요 없음
+    → lock 파일은 지우지 않고 재사용 (지우면 이전 파일을 잡은 워커와 새 파일을 잡은 워커가 동시에 임대할 수 있음)
+"""
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+from src.utils.file_lock import lock, unlock
+
+ACCOUNT_LEASE_DIR = os.getenv("ACCOUNT_LEASE_DIR", ".leases")
+ACCOUNT_LEASE_TIMEOUT = int(os.getenv("ACCOUNT_LEASE_TIMEOUT", "600"))   # 계정이 빌 때까지 기다릴 최대 시간(초)
+
+
+class AccountLease:
+    """관리자 계정 독점 임대"""
+
+    def __init__(self, accounts, lease_dir=ACCOUNT_LEASE_DIR, timeout=ACCOUNT_LEASE_TIMEOUT):
+        self.accounts = [a for a in accounts if a.username and a.password]
+        self.lease_dir = Path(lease_dir)
+        self.timeout = timeout
+        self.account = None
+        self._fd = None
+
+    def _lock_path(self, account):
+        key = hashlib.sha1(account.username.encode("utf-8")).hexdigest()[:12]
+        return self.lease_dir / f"{key}.lock"
+
+    def _try_lock(self, account, owner):
+        fd = os.open(self._lock_path(account), os.O_CREAT | os.O_RDWR)
+        try:
+            lock(fd, blocking=False)
+        except OSError:
+            os.close(fd)
+            return False
+
+        # 잠금을 잡은 뒤에만 내용을 씀 (누가 쓰고 있는지 확인용, 판단에는 사용하지 않음)
+        info = json.dumps({"pid": os.getpid(), "owner": owner, "acquired_at": time.time()})
+        os.ftruncate(fd, 0)
+        os.lseek(fd, 0, os.SEEK_SET)
+        os.write(fd, info.encode("utf-8"))
+        os.lseek(fd, 0, os.SEEK_SET)
+        self.account = account
+        self._fd = fd
+        return True
+
+    def acquire(self, owner):
+        """비어 있는 계정 하나를 독점 (모두 사용 중이면 timeout 까지 대기)"""
+        if not self.accounts:
+            raise ValueError("임대 가능한 계정이 없습니다. .env 의 ADMIN*_USERNAME/PASSWORD 를 확인하세요.")
+
+        self.lease_dir.mkdir(parents=True, exist_ok=True)
+        deadline = time.time() + self.timeout
+        while True:
+            for account in self.accounts:
+                if self._try_lock(account, owner):
+                    print(f"[계정 임대] {owner} → {account.description}")
+                    return account
+            if time.time() >= deadline:
+                raise TimeoutError(f"{self.timeout}초 동안 비어 있는 계정이 없습니다 ({owner})")
+            time.sleep(1)
+
+    def release(self):
+        if self._fd is None:
+            return
+        try:
+            unlock(self._fd)
+        finally:
+            os.close(self._fd)
+        print(f"[계정 임대] 반납 → {self.account.description}")
+        self.account = None
+        self._fd = None
@@ -0,0 +1,77 @@
+"""
+실패 아티팩트 비동기 저장 헬퍼
+- 테스트 스레드에서는 스크린샷 bytes 와 page_source 만 한 번 가져오고 바로 반환
+- 파일 저장은 백그라운드 스레드가 담당
+    - HTML: gzip 압축(.html.gz)
+    - 스크린샷: 내용 해시가 같으면 중복 저장하지 않고 기존 파일 경로만 기록
+- 세션 종료 시 flush() 로 대기열 비우기
+"""
+import gzip
+import hashlib
+import os
+import queue
+import threading
+
+ARTIFACT_GZIP_LEVEL = int(os.getenv("ARTIFACT_GZIP_LEVEL", "6"))
+
+
+class ArtifactWriter:
+    """백그라운드 스레드 1개로 아티팩트 파일을 저장"""
+
+    def __init__(self, artifact_dir):
+        self.artifact_dir = artifact_dir
+        self._queue = queue.Queue()
+        self._screens = {}      # 스크린샷 해시 → 저장된 경로
+        self._thread = None
+        self.written = 0
+        self.deduped = 0
+
+    def submit(self, base, png, html):
+        """
+        저장 요청 (즉시 반환)
+        - base: 확장자 없는 파일명
+        - png: 스크린샷 bytes (None 이면 생략)
+        - html: page_source 문자열 (None 이면 생략)
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(target=self._run, name="artifact-writer", daemon=True)
+            self._thread.start()
+        self._queue.put((base, png, html))
+
+    def flush(self):
+        """대기 중인 저장 작업이 모두 끝날 때까지 대기"""
+        self._queue.join()
+
+    def _run(self):
+        while True:
+            job = self._queue.get()
+            try:
+                self._write(*job)
+            except Exception as e:
+                print(f"⚠️ [artifact] 저장 실패: {e}")
+            finally:
+                self._queue.task_done()
+
+    def _write(self, base, png, html):
+        os.makedirs(self.artifact_dir, exist_ok=True)
+
+        if png:
+            digest = hashlib.sha1(png).hexdigest()
+            existing = self._screens.get(digest)
+            if existing:
+                self.deduped += 1
+                print(f"[artifact] {base}.png → 동일 스크린샷: {existing}")
+            else:
+                path = os.path.join(self.artifact_dir, base + ".png")
+                with open(path, "wb") as f:
+                    f.write(png)
+                self._screens[digest] = path
+                self.written += 1
+                print(f"[artifact] {path}")
+
+        if html is not None:
+            path = os.path.join(self.artifact_dir, base + ".html.gz")
+            with gzip.open(path, "wt", encoding="utf-8", compresslevel=ARTIFACT_GZIP_LEVEL) as f:
+                f.write(html)
+            self.written += 1
+            print(f"[artifact] {path}")
@@ -4,10 +4,7 @@ Billing 테스트를 위한 헬퍼 함수 모음
 import time
 import os
 import re
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from selenium.webdriver import ActionChains
+from src.utils.lazy_selenium import By, WebDriverWait, EC, ActionChains
 from selenium.common.exceptions import MoveTargetOutOfBoundsException
 from tests.helpers.common_helpers import _click_profile
 
@@ -131,6 +128,51 @@ PROPS = [
 ]
 
 
+# 스타일 스냅샷에 사용하는 CSS 속성들
+SNAPSHOT_PROPS = [
+    # 색/배경/선
+    "background-color", "color", "border-color", "outline-color", "outline-width",
+    # 효과
+    "box-shadow", "text-shadow",
+    # 테마가 자주 쓰는 값들
+    "opacity", "filter", "backdrop-filter", "transform",
+]
+
+# 의사요소(오버레이) 속성: 결과 키 → (의사요소, CSS 속성)
+SNAPSHOT_PSEUDO_PROPS = {
+    "::before-bg": ("::before", "background-color"),
+    "::after-bg": ("::after", "background-color"),
+}
+
+# 여러 요소 × 여러 속성(의사요소 포함)을 한 번에 읽는 스크립트
+_COMPUTED_STYLES_JS = """
+const [els, props, pseudoProps] = arguments;
+return els.map(el => {
+    if (!el) return null;
+    const out = {};
+    const cs = getComputedStyle(el);
+    for (const p of props) out[p] = cs.getPropertyValue(p);
+    for (const [key, pseudo, p] of pseudoProps) out[key] = getComputedStyle(el, pseudo).getPropertyValue(p);
+    return out;
+});
+"""
+
+
+def _computed_styles(driver, elements, props, pseudo_props=None):
+    """
+    요소(들)의 computed style 을 execute_script 1번으로 가져오기
+    - elements: WebElement 하나 → dict 반환 / 리스트 → dict 리스트 반환 (None 요소는 None)
+    - props: ["background-color", "color", ...]
+    - pseudo_props: {"결과 키": ("::before", "background-color"), ...}
+    """
+    single = not isinstance(elements, (list, tuple))
+    els = [elements] if single else list(elements)
+    pseudo = [[key, pe, prop] for key, (pe, prop) in (pseudo_props or {}).items()]
+
+    result = driver.execute_script(_COMPUTED_STYLES_JS, els, list(props), pseudo)
+    return result[0] if single else result
+
+
 def _css(driver, el, prop):
     """요소의 CSS 속성값 가져오기"""
     return driver.execute_script("return window.getComputedStyle(arguments[0]).getPropertyValue(arguments[1]);", el, prop)
@@ -143,26 +185,19 @@ def _computed_bg(driver, el):
 
 def _any_prop_changed(driver, el, before_props):
     """CSS 속성이 변경되었는지 확인"""
-    after = {p: _css(driver, el, p) for p in PROPS}
+    after = _computed_styles(driver, el, PROPS)
     changed = any(before_props[p] != after[p] for p in PROPS)
     return changed, after
 
 
 def _style_snapshot(driver, el):
-    """요소의 스타일 스냅샷 생성"""
-    props = [
-        # 색/배경/선
-        "background-color", "color", "border-color", "outline-color", "outline-width",
-        # 효과
-        "box-shadow", "text-shadow",
-        # 테마가 자주 쓰는 값들
-        "opacity", "filter", "backdrop-filter", "transform",
-    ]
-    snap = {p: _css(driver, el, p) for p in props}
-    # 의사요소(오버레이)까지 확인
-    snap["::before-bg"] = driver.execute_script("return getComputedStyle(arguments[0],'::before').backgroundColor;", el)
-    snap["::after-bg"]  = driver.execute_script("return getComputedStyle(arguments[0],'::after').backgroundColor;", el)
-    return snap
+    """요소의 스타일 스냅샷 생성 (의사요소 배경색 포함, 스크립트 1번)"""
+    return _computed_styles(driver, el, SNAPSHOT_PROPS, SNAPSHOT_PSEUDO_PROPS)
+
+
+def _style_snapshots(driver, elements):
+    """여러 요소의 스타일 스냅샷을 한 번에 생성 (None 요소는 None)"""
+    return _computed_styles(driver, elements, SNAPSHOT_PROPS, SNAPSHOT_PSEUDO_PROPS)
 
 
 # ======================
@@ -0,0 +1,158 @@
+"""
+WebDriver 명령 프로파일러 (pytest 플러그인, WEBDRIVER_PROFILE=1 일 때만)
+- 드라이버의 command_executor.execute 를 감싸서 chromedriver 로 가는 명령 1회(HTTP 왕복 1회)마다
+  명령 이름 / 소요 시간 / 호출 위치(프로젝트 코드 중 가장 안쪽 프레임)를 테스트별로 기록
+- 세션 끝 출력
+    - 명령 이름별 횟수 / 총 시간 / 평균 (총 시간 내림차순)
+    - 테스트별 명령 수 / 총 시간 + 왕복이 많은 호출 위치
+- flame graph 용 folded stack 파일 저장 (테스트;프레임;...;명령 마이크로초)
+    → flamegraph.pl / speedscope 에 그대로 넣어서 확인
+- 병렬 실행(xdist) 시 워커 측정값은 teardown 리포트의 user_properties 로 컨트롤러에 전달되어 합산
+"""
+import os
+import sys
+import time
+
+import pytest
+
+WEBDRIVER_PROFILE = os.getenv("WEBDRIVER_PROFILE", "0") == "1"
+WEBDRIVER_PROFILE_OUT = os.getenv("WEBDRIVER_PROFILE_OUT", os.path.join("artifacts", "webdriver_profile.folded"))
+WEBDRIVER_PROFILE_TOP = int(os.getenv("WEBDRIVER_PROFILE_TOP", "10"))
+
+_PROPERTY = "webdriver_profile"
+
+
+class CommandProfiler:
+    """
+    pytest 플러그인으로 등록한 뒤, 드라이버를 만들 때마다 attach(driver)
+        profiler = CommandProfiler(config.rootpath)
+        config.pluginmanager.register(profiler, "webdriver-profiler")
+    """
+
+    def __init__(self, root, out=WEBDRIVER_PROFILE_OUT, top=WEBDRIVER_PROFILE_TOP):
+        self.root = os.path.abspath(root)
+        self.out = out
+        self.top = top
+        self._current = None     # 실행 중인 테스트 측정값 {"commands": .., "sites": .., "stacks": ..}
+        self.commands = {}       # 명령 이름 → [횟수, 초]
+        self.tests = {}          # nodeid → [횟수, 초]
+        self.sites = {}          # nodeid → {호출 위치: [횟수, 초]}
+        self.stacks = {}         # folded stack → 초
+
+    def attach(self, driver):
+        """드라이버 명령 실행기를 감쌈 (풀에서 재사용되는 드라이버는 한 번만)"""
+        executor = driver.command_executor
+        if getattr(executor, "_profiled", False):
+            return
+        real_execute = executor.execute
+
+        def execute(command, params):
+            start = time.perf_counter()
+            try:
+                return real_execute(command, params)
+            finally:
+                if self._current is not None:
+                    self._record(command, time.perf_counter() - start, sys._getframe(1))
+
+        executor.execute = execute
+        executor._profiled = True
+
+    def _project_frames(self, frame):
+        # 바깥쪽 → 안쪽 순서의 프로젝트 프레임 목록 (selenium / pytest 등 site-packages 제외)
+        frames = []
+        while frame is not None:
+            filename = frame.f_code.co_filename
+            path = os.path.abspath(filename)
+            in_project = path.startswith(self.root + os.sep) and f"{os.sep}site-packages{os.sep}" not in path
+            if in_project and not filename.startswith("<"):
+                frames.append(frame)
+            frame = frame.f_back
+        frames.reverse()
+        return frames
+
+    def _record(self, command, seconds, frame):
+        frames = self._project_frames(frame)
+        current = self._current
+
+        entry = current["commands"].setdefault(command, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+        if frames:
+            inner = frames[-1]
+            site = f"{os.path.relpath(inner.f_code.co_filename, self.root)}:{inner.f_lineno} ({inner.f_code.co_name})"
+        else:
+            site = "(fixture / 라이브러리)"
+        entry = current["sites"].setdefault(site, [0, 0.0])
+        entry[0] += 1
+        entry[1] += seconds
+
+        stack = ";".join(
+            [f"{os.path.basename(f.f_code.co_filename)}:{f.f_code.co_name}" for f in frames] + [command]
+        )
+        current["stacks"][stack] = current["stacks"].get(stack, 0.0) + seconds
+
+    # -------------------- pytest 훅 --------------------
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self._current = {"commands": {}, "sites": {}, "stacks": {}}
+        yield
+        self._current = None
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_makereport(self, item, call):
+        if call.when == "teardown" and self._current and self._current["commands"]:
+            item.user_properties.append((_PROPERTY, self._current))
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        for name, data in report.user_properties:
+            if name != _PROPERTY:
+                continue
+            test = self.tests.setdefault(report.nodeid, [0, 0.0])
+            for command, (count, seconds) in data["commands"].items():
+                entry = self.commands.setdefault(command, [0, 0.0])
+                entry[0] += count
+                entry[1] += seconds
+                test[0] += count
+                test[1] += seconds
+            sites = self.sites.setdefault(report.nodeid, {})
+            for site, (count, seconds) in data["sites"].items():
+                entry = sites.setdefault(site, [0, 0.0])
+                entry[0] += count
+                entry[1] += seconds
+            test_name = report.nodeid.split("::", 1)[-1].replace(";", "_")
+            for stack, seconds in data["stacks"].items():
+                key = f"{test_name};{stack}"
+                self.stacks[key] = self.stacks.get(key, 0.0) + seconds
+
+    def pytest_sessionfinish(self, session):
+        if self.stacks and not hasattr(session.config, "workerinput"):
+            os.makedirs(os.path.dirname(self.out) or ".", exist_ok=True)
+            with open(self.out, "w", encoding="utf-8") as f:
+                for stack, seconds in sorted(self.stacks.items()):
+                    f.write(f"{stack} {max(1, round(seconds * 1_000_000))}\n")
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.commands:
+            return
+        write = terminalreporter.write_line
+        total_count = sum(count for count, _ in self.commands.values())
+        total_seconds = sum(seconds for _, seconds in self.commands.values())
+        write(f"[webdriver] 명령 {total_count}회 / 총 {total_seconds:.1f}s (테스트 {len(self.tests)}개)")
+
+        write(f"  {'명령':<28}{'횟수':>8}{'총(s)':>10}{'평균(ms)':>10}")
+        for command, (count, seconds) in sorted(self.commands.items(), key=lambda kv: kv[1][1], reverse=True):
+            write(f"  {command:<28}{count:>8}{seconds:>10.2f}{seconds / count * 1000:>10.1f}")
+
+        write(f"[webdriver] 테스트별 상위 {self.top} (호출 위치는 왕복 횟수 순 상위 3개)")
+        for nodeid, (count, seconds) in sorted(self.tests.items(), key=lambda kv: kv[1][1], reverse=True)[:self.top]:
+            write(f"  {seconds:8.2f}s {count:6d}회  {nodeid}")
+            sites = sorted(self.sites.get(nodeid, {}).items(), key=lambda kv: kv[1][0], reverse=True)[:3]
+            for site, (site_count, site_seconds) in sites:
+                write(f"      {site_count:6d}회 {site_seconds:7.2f}s  {site}")
+
+        if self.stacks:
+            write(f"[webdriver] flame graph 입력(folded): {self.out}")
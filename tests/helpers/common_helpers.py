@@ -1,10 +1,10 @@
 import re
 from pathlib import Path
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
+from src.utils.lazy_selenium import By, WebDriverWait, EC
 from selenium.common.exceptions import NoSuchElementException
 from selenium.common.exceptions import TimeoutException
+from src.utils.cdp_metrics import checkpoint
+from src.config.settings import PAYMENTS_URL
 
 # --- Avatar Locators ---
 
@@ -63,7 +63,7 @@ def _find_payment_history(driver, wait):
     # Payment History가 보일 때까지 대기
     payment_history = wait.until(
         EC.visibility_of_element_located(
-            (By.CSS_SELECTOR, "a[href='https://payments.elice.io']")
+            (By.CSS_SELECTOR, f"a[href='{PAYMENTS_URL}']")
         )
     )
     
@@ -98,6 +98,7 @@ def _set_language_korean(driver):
         WebDriverWait(driver, 10).until(
             lambda d: d.execute_script("return document.readyState") == "complete"
         )
+        checkpoint(driver, "language_korean")
         
         print("✅ 한국어 설정 완료")
         return True
@@ -194,7 +195,7 @@ def _select_profile_avatar_menu(driver, wait, text: str):
 
 
 # AC-021 공통 유틸: avatar src 추출
-def _get_avatar_src(driver, locator, wait: WebDriverWait | None = None, normalize: bool = True) -> str | None:
+def _get_avatar_src(driver, locator, wait: "WebDriverWait | None" = None, normalize: bool = True) -> str | None:
     try:
         if wait is not None:
             avatar_container = wait.until(EC.presence_of_element_located(locator))
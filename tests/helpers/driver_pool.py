@@ -0,0 +1,149 @@
+"""
+브라우저 풀 헬퍼
+- 테스트마다 Chrome을 새로 띄우지 않고, 세션 동안 살아있는 Chrome 인스턴스를 재사용한다.
+- 반납 시 쿠키/스토리지/추가 탭/창 상태를 초기화해서 다음 테스트가 깨끗한 상태로 시작하도록 한다.
+"""
+import os
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import WebDriverException
+
+from src.config.settings import ACCOUNTS_URL, APP_ORIGIN
+from tests.helpers.network_profiles import build_conditions
+
+# 풀 사용 여부 (0이면 기존처럼 테스트마다 브라우저 종료)
+POOL_ENABLED = os.getenv("DRIVER_POOL", "1") == "1"
+
+# 대기(idle) 상태로 보관할 최대 브라우저 수
+POOL_SIZE = int(os.getenv("DRIVER_POOL_SIZE", "1"))
+
+# 반납 시 스토리지를 비울 기본 origin (로그인 페이지 + 서비스 페이지)
+RESET_ORIGINS = {ACCOUNTS_URL, APP_ORIGIN}
+
+WINDOW_SIZE = (1920, 1080)
+
+
+def _origin_of(url):
+    parts = urlsplit(url or "")
+    if parts.scheme not in ("http", "https"):
+        return None
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def reset_browser(driver):
+    """
+    브라우저를 '방금 띄운 상태'에 가깝게 되돌린다.
+    - 열린 alert 닫기, iframe 빠져나오기
+    - 첫 번째 탭만 남기고 나머지 탭 닫기
+    - 요청 차단 패턴 / 네트워크 조건 해제, 모든 도메인의 쿠키 삭제 (CDP)
+    - 방문한 origin 의 localStorage / sessionStorage / IndexedDB 등 삭제 (CDP)
+    - about:blank 로 이동, 창 크기 원복
+    """
+    # 1) alert / iframe 정리
+    try:
+        driver.switch_to.alert.dismiss()
+    except WebDriverException:
+        pass
+    driver.switch_to.default_content()
+
+    # 2) 추가 탭 닫기
+    handles = driver.window_handles
+    if not handles:
+        # 테스트가 창을 모두 닫음 → 되돌릴 창이 없으므로 폐기 대상 (checkin 에서 종료)
+        raise WebDriverException("열린 창이 없음")
+    for handle in handles[1:]:
+        driver.switch_to.window(handle)
+        driver.close()
+    driver.switch_to.window(handles[0])
+
+    # 3) 스토리지 정리 대상 origin 수집
+    origins = set(RESET_ORIGINS)
+    current = _origin_of(driver.current_url)
+    if current:
+        origins.add(current)
+        try:
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        except WebDriverException:
+            pass
+
+    # 4) 요청 차단 / 네트워크 조건 해제, 쿠키 + 스토리지 삭제
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+    driver.execute_cdp_cmd("Network.emulateNetworkConditions", build_conditions("none"))
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    for origin in origins:
+        driver.execute_cdp_cmd(
+            "Storage.clearDataForOrigin",
+            {"origin": origin, "storageTypes": "all"},
+        )
+
+    # 5) 빈 페이지 + 창 크기 원복
+    driver.get("about:blank")
+    driver.set_window_size(*WINDOW_SIZE)
+
+
+class DriverPool:
+    """
+    세션 범위 브라우저 풀
+    - checkout(key): 같은 key(실행 프로필)로 띄운 대기 브라우저를 꺼내거나, 없으면 factory(key) 로 새로 생성
+    - checkin(): 초기화 후 풀에 반납 (초기화 실패 / 풀이 가득 찬 경우 종료)
+    """
+
+    def __init__(self, factory, size=POOL_SIZE, enabled=POOL_ENABLED):
+        self.factory = factory
+        self.size = size
+        self.enabled = enabled
+        self._idle = []
+        self.created = 0
+        self.reused = 0
+
+    def checkout(self, key=None):
+        for driver in list(reversed(self._idle)):
+            if getattr(driver, "_pool_key", None) != key:
+                continue
+            self._idle.remove(driver)
+            if self._is_alive(driver):
+                self.reused += 1
+                return driver
+            self._quit(driver)
+
+        self.created += 1
+        driver = self.factory(key)
+        driver._pool_key = key
+        return driver
+
+    def checkin(self, driver):
+        if not self.enabled or self.size <= 0:
+            self._quit(driver)
+            return
+
+        try:
+            reset_browser(driver)
+        except WebDriverException as e:
+            print(f"⚠️ 브라우저 초기화 실패 → 종료 후 폐기: {e}")
+            self._quit(driver)
+            return
+
+        # 가득 찼으면 가장 오래 쉰 브라우저(다른 실행 프로필일 수 있음)를 종료하고 자리 확보
+        if len(self._idle) >= self.size:
+            self._quit(self._idle.pop(0))
+        self._idle.append(driver)
+
+    def close(self):
+        while self._idle:
+            self._quit(self._idle.pop())
+        print(f"[driver-pool] 생성 {self.created}회 / 재사용 {self.reused}회")
+
+    @staticmethod
+    def _is_alive(driver):
+        try:
+            driver.window_handles
+            return True
+        except WebDriverException:
+            return False
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
@@ -0,0 +1,157 @@
+"""
+ChromeDriver 경로 결정 헬퍼 (오프라인 우선)
+- 설치된 Chrome 의 major 버전을 확인하고, 로컬에 캐시된 같은 major 의 chromedriver 를 사용
+    1) 자체 인덱스 (CHROMEDRIVER_CACHE_DIR/index.json: major → 경로)
+    2) webdriver-manager 캐시 (~/.wdm)
+    3) Selenium Manager 캐시 (~/.cache/selenium)
+- 캐시에 없을 때만 webdriver-manager 로 다운로드 (CHROMEDRIVER_OFFLINE=1 이면 다운로드 없이 None → Selenium 이 PATH 에서 찾음)
+- 결정 과정/소요 시간은 info dict 로 반환해서 세션 리포트에 기록
+"""
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+CHROMEDRIVER_OFFLINE = os.getenv("CHROMEDRIVER_OFFLINE", "0") == "1"
+CHROMEDRIVER_CACHE_DIR = Path(os.getenv("CHROMEDRIVER_CACHE_DIR", Path.home() / ".cache" / "team4-chromedriver"))
+
+_VERSION_RE = re.compile(r"(\d+)\.\d+\.\d+\.\d+")
+_DRIVER_NAME = "chromedriver.exe" if sys.platform.startswith("win") else "chromedriver"
+
+# 드라이버가 캐시되어 있을 수 있는 폴더
+_CACHE_ROOTS = [
+    Path.home() / ".wdm" / "drivers" / "chromedriver",
+    Path.home() / ".cache" / "selenium" / "chromedriver",
+]
+
+
+def _chrome_version_windows():
+    import winreg
+
+    for hive in (winreg.HKEY_CURRENT_USER, winreg.HKEY_LOCAL_MACHINE):
+        try:
+            with winreg.OpenKey(hive, r"Software\Google\Chrome\BLBeacon") as key:
+                return winreg.QueryValueEx(key, "version")[0]
+        except OSError:
+            continue
+    return None
+
+
+def _chrome_version_cli():
+    candidates = [os.getenv("CHROME_BINARY")]
+    if sys.platform == "darwin":
+        candidates.append("/Applications/Google Chrome.app/Contents/MacOS/Google Chrome")
+    candidates += ["google-chrome", "google-chrome-stable", "chromium", "chromium-browser"]
+
+    for binary in filter(None, candidates):
+        path = binary if os.path.isfile(binary) else shutil.which(binary)
+        if not path:
+            continue
+        try:
+            out = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        m = _VERSION_RE.search(out)
+        if m:
+            return m.group(0)
+    return None
+
+
+def detect_chrome_version():
+    """설치된 Chrome 버전 문자열 (예: '142.0.7444.59'), 못 찾으면 None"""
+    if sys.platform.startswith("win"):
+        version = _chrome_version_windows()
+        if version:
+            return version
+    return _chrome_version_cli()
+
+
+def _major(version):
+    return int(version.split(".", 1)[0])
+
+
+def _scan_cached_drivers():
+    """캐시 폴더에서 (버전, 경로) 목록 수집 - 버전은 경로에 포함된 4자리 버전 문자열"""
+    found = []
+    for root in _CACHE_ROOTS:
+        if not root.is_dir():
+            continue
+        for path in root.rglob(_DRIVER_NAME):
+            m = _VERSION_RE.search(str(path.relative_to(root)))
+            if m and path.is_file():
+                found.append((m.group(0), path))
+    return found
+
+
+def _version_key(version):
+    return tuple(int(p) for p in version.split("."))
+
+
+class DriverIndex:
+    """major 버전 → chromedriver 경로 인덱스 (index.json)"""
+
+    def __init__(self, cache_dir=CHROMEDRIVER_CACHE_DIR):
+        self.path = Path(cache_dir) / "index.json"
+        try:
+            self.data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.data = {}
+
+    def get(self, major):
+        entry = self.data.get(str(major))
+        if entry and Path(entry["path"]).is_file():
+            return entry
+        return None
+
+    def put(self, major, version, path):
+        self.data[str(major)] = {"version": version, "path": str(path)}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self.data, indent=2), encoding="utf-8")
+
+
+def resolve_chromedriver(offline=CHROMEDRIVER_OFFLINE):
+    """
+    반환: (chromedriver 경로 또는 None, info dict)
+    info: {"chrome": Chrome 버전, "driver": 드라이버 버전, "source": index/cache/download/selenium, "seconds": 소요 시간}
+    """
+    start = time.perf_counter()
+    info = {"chrome": detect_chrome_version(), "driver": None, "source": None, "path": None}
+    index = DriverIndex()
+
+    def done(path, version, source):
+        info.update(driver=version, source=source, path=str(path) if path else None,
+                    seconds=time.perf_counter() - start)
+        return (str(path) if path else None), info
+
+    if info["chrome"]:
+        major = _major(info["chrome"])
+
+        # 1) 인덱스
+        entry = index.get(major)
+        if entry:
+            return done(entry["path"], entry["version"], "index")
+
+        # 2) 로컬 캐시 스캔 (같은 major 중 최신)
+        same_major = [(v, p) for v, p in _scan_cached_drivers() if _major(v) == major]
+        if same_major:
+            version, path = max(same_major, key=lambda vp: _version_key(vp[0]))
+            index.put(major, version, path)
+            return done(path, version, "cache")
+
+    # 3) 오프라인이면 Selenium Manager / PATH 에 맡김
+    if offline:
+        return done(None, None, "selenium")
+
+    # 4) 다운로드 (webdriver-manager) 후 인덱스에 기록
+    from webdriver_manager.chrome import ChromeDriverManager
+
+    path = ChromeDriverManager().install()
+    m = _VERSION_RE.search(path)
+    version = m.group(0) if m else None
+    if info["chrome"]:
+        index.put(_major(info["chrome"]), version, path)
+    return done(path, version, "download")
@@ -0,0 +1,98 @@
+"""
+테스트 실행 시간 이력 / 긴 테스트 우선 정렬 헬퍼
+- 테스트별 실행 시간(setup + call + teardown)을 로컬 JSON 파일에 지수 이동 평균으로 기록
+- 다음 실행부터 이력을 보고 오래 걸리는 테스트를 먼저 배치 (LPT: Longest Processing Time first)
+    → 병렬 실행(xdist) 시 긴 테스트가 마지막에 한 워커에 몰려서 전체 시간이 늘어나는 것을 방지
+- 이력이 없는 테스트는 기록된 시간의 중앙값으로 추정
+"""
+import json
+import os
+import time
+from pathlib import Path
+
+DURATION_FILE = os.getenv("DURATION_FILE", ".test_durations.json")
+DURATION_ALPHA = float(os.getenv("DURATION_ALPHA", "0.5"))  # 새 측정값 반영 비율 (1이면 마지막 값만 사용)
+
+# 정렬 사용 여부: auto(기본) = 병렬 실행(xdist 워커)일 때만, 1 = 항상, 0 = 사용 안 함 (수집 순서 유지)
+DURATION_ORDER = os.getenv("DURATION_ORDER", "auto")
+
+
+def ordering_enabled():
+    if DURATION_ORDER == "auto":
+        return bool(os.getenv("PYTEST_XDIST_WORKER"))
+    return DURATION_ORDER == "1"
+
+
+class DurationHistory:
+    """
+    JSON 파일 구조
+    {"tests/chat_history/test_chat_history.py::TestX::test_y": {"seconds": 84.2, "runs": 3, "recorded_at": ..}}
+    """
+
+    def __init__(self, path=DURATION_FILE, alpha=DURATION_ALPHA):
+        self.path = Path(path)
+        self.alpha = alpha
+        try:
+            self.data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.data = {}
+        self._pending = {}   # 이번 세션에서 측정 중인 nodeid → 누적 시간
+        self._skipped = set()
+
+    def add(self, report):
+        """setup / call / teardown 단계별 리포트 시간을 누적 (setup 에서 skip 된 테스트는 제외)"""
+        if report.when == "setup" and report.skipped:
+            self._skipped.add(report.nodeid)
+        if report.nodeid in self._skipped:
+            return
+        self._pending[report.nodeid] = self._pending.get(report.nodeid, 0.0) + report.duration
+
+    def commit(self):
+        """이번 세션 측정값을 이력에 반영 (지수 이동 평균)"""
+        now = time.time()
+        for nodeid, seconds in self._pending.items():
+            entry = self.data.get(nodeid)
+            if entry:
+                seconds = self.alpha * seconds + (1 - self.alpha) * entry["seconds"]
+                runs = entry.get("runs", 1) + 1
+            else:
+                runs = 1
+            self.data[nodeid] = {"seconds": round(seconds, 3), "runs": runs, "recorded_at": now}
+        recorded = list(self._pending)
+        self._pending.clear()
+        self._skipped.clear()
+        return recorded
+
+    def save(self):
+        # 쓰는 도중 중단돼도 기존 파일이 깨지지 않도록 임시 파일 → 교체
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        tmp.write_text(json.dumps(self.data, ensure_ascii=False, indent=2, sort_keys=True), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+    def default_estimate(self):
+        known = sorted(entry["seconds"] for entry in self.data.values())
+        return known[len(known) // 2] if known else 0.0
+
+    def estimate(self, nodeid, default=None):
+        entry = self.data.get(nodeid)
+        if entry:
+            return entry["seconds"]
+        return self.default_estimate() if default is None else default
+
+    def order_longest_first(self, items):
+        """
+        items 를 예상 시간 내림차순으로 제자리 정렬
+        - 같은 시간이면 기존 수집 순서 유지 (모든 워커가 같은 순서를 만들어야 xdist 가 수집 결과를 받아줌)
+        """
+        default = self.default_estimate()
+        items.sort(key=lambda item: -self.estimate(item.nodeid, default))
+
+    def makespan(self, nodeids, workers):
+        """워커 수만큼 LPT 로 나눴을 때 예상 완료 시간(초)과 전체 합계"""
+        loads = [0.0] * max(1, workers)
+        default = self.default_estimate()
+        durations = sorted((self.estimate(n, default) for n in nodeids), reverse=True)
+        for seconds in durations:
+            i = loads.index(min(loads))
+            loads[i] += seconds
+        return max(loads), sum(durations)
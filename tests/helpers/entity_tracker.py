@@ -0,0 +1,187 @@
+"""
+테스트가 만든 대화 / 커스텀 에이전트 추적 + 세션 끝 일괄 정리
+- 기본은 API_ENABLED 를 따름 (스탠드인에서만 켜짐). 실제 서비스에서는 ENTITY_CLEANUP=1 로 따로 켤 수 있음
+    → 목록 조회(GET) / 삭제(DELETE)만 쓰므로 API_ENABLED=1 (생성용 api fixture)까지 켤 필요 없음
+    → API_CHATS_PATH / API_AGENTS_PATH 가 실제 경로와 다르면 아래처럼 경고 후 추적 중단
+- 로그인 직후 계정의 대화 / 에이전트 id 전체 목록을 API 로 기록하고, 테스트가 끝나면 다시 조회해서
+  새로 생긴 항목을 (종류, id, 계정, 테스트 nodeid) 태그와 함께 기록
+    → UI 로 만든 항목도 테스트 코드 수정 없이 추적됨
+    → 일부(최신 N 개)가 아니라 전체 목록을 비교하고, 생성 시각(created_at)이 테스트 시간 밖이면 제외
+      (목록이 밀려서 빠졌던 오래된 항목이나 같은 계정을 쓰는 다른 사람의 항목을 지우지 않도록)
+- 세션 끝에 계정별로 저장해 둔 쿠키로 HTTP DELETE 를 동시에 보내서 일괄 삭제 (브라우저 필요 없음)
+    - 쿠키가 만료됐으면(로그아웃 테스트 등) relogin 으로 새 쿠키를 받아서 삭제
+- 조회가 401 / 403 이면(테스트 중 로그아웃 등) 그 테스트만 추적하지 않음
+- API 가 없거나 경로가 다르면(그 밖의 조회 실패) 경고 1회 출력 후 추적 중단 → 테스트에는 영향 없음
+- 병렬 실행(xdist) 시 워커마다 자기 계정 항목을 정리하고, 결과는 workeroutput 으로 컨트롤러에 전달
+"""
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from src.config.settings import API_ENABLED, API_POOL_SIZE
+
+ENTITY_CLEANUP = os.getenv("ENTITY_CLEANUP", "1" if API_ENABLED else "0") == "1"
+ENTITY_CLOCK_SKEW = float(os.getenv("ENTITY_CLOCK_SKEW", "300"))   # 서버 / 로컬 시계 차이 허용(초)
+
+KINDS = ("chat", "agent")
+
+
+def _is_auth_error(error):
+    response = getattr(error, "response", None)
+    return getattr(response, "status_code", None) in (401, 403)
+
+
+def _created_at(item):
+    try:
+        return datetime.fromisoformat(item["created_at"].replace("Z", "+00:00")).timestamp()
+    except (KeyError, AttributeError, TypeError, ValueError):
+        return None
+
+
+class EntityTracker:
+
+    def __init__(self, workers=API_POOL_SIZE):
+        self.workers = workers
+        self.enabled = ENTITY_CLEANUP
+        self.entities = {}    # (종류, id) → {"account": .., "nodeid": ..}
+        self.cookies = {}     # 계정 → 마지막으로 인증에 성공한 쿠키 (세션 끝 정리용)
+
+    # -------------------- 추적 --------------------
+
+    def _items(self, api):
+        return {
+            "chat": {c["id"]: c for c in api.iter_chats()},
+            "agent": {a["id"]: a for a in api.list_agents()},
+        }
+
+    def snapshot(self, api, account):
+        """로그인 직후 호출 → 비교 기준 (추적 불가면 None)"""
+        if not self.enabled:
+            return None
+        started = time.time()
+        try:
+            items = self._items(api)
+        except Exception as e:
+            self._skip_or_disable(e)
+            return None
+        self.cookies[account] = api.export_cookies()
+        return {"started": started, "ids": {kind: set(items[kind]) for kind in KINDS}}
+
+    def track_new(self, api, before, account, nodeid):
+        """snapshot 이후 새로 생긴 항목 기록 → 기록한 개수"""
+        if not self.enabled or before is None:
+            return 0
+        try:
+            after = self._items(api)
+        except Exception as e:
+            self._skip_or_disable(e, nodeid)
+            return 0
+
+        self.cookies[account] = api.export_cookies()
+        earliest, latest = before["started"] - ENTITY_CLOCK_SKEW, time.time() + ENTITY_CLOCK_SKEW
+        count = 0
+        for kind in KINDS:
+            for entity_id, item in after[kind].items():
+                if entity_id in before["ids"][kind]:
+                    continue
+                created = _created_at(item)
+                if created is not None and not earliest <= created <= latest:
+                    continue
+                self.track(kind, entity_id, account, nodeid)
+                count += 1
+        return count
+
+    def track(self, kind, entity_id, account, nodeid=None):
+        """직접 기록 (API 로 만들고 테스트에서 지우지 않는 항목 등)"""
+        self.entities[(kind, entity_id)] = {"account": account, "nodeid": nodeid}
+
+    def _skip_or_disable(self, error, nodeid=None):
+        if _is_auth_error(error):
+            # 로그아웃 / 세션 만료 → 이 테스트만 건너뜀 (다음 테스트는 다시 로그인하므로 계속 추적)
+            if nodeid:
+                print(f"\n⚠️ [cleanup] 인증 만료로 생성 항목 추적 생략: {nodeid}")
+            return
+        self.enabled = False
+        print(f"\n⚠️ [cleanup] API 조회 실패 → 생성 항목 추적 중단: {error}")
+
+    # -------------------- 정리 --------------------
+
+    def _client(self, client_factory, account, relogin):
+        # 저장된 쿠키가 거부되면(로그아웃 등으로 세션 만료) 다시 로그인해서 받은 쿠키 사용
+        client = client_factory().use_cookies(self.cookies.get(account, []))
+        try:
+            client.list_chats(limit=1)
+            return client
+        except Exception as e:
+            if relogin is None or not _is_auth_error(e):
+                client.close()
+                return None
+        try:
+            return client.use_cookies(relogin(account))
+        except Exception as e:
+            print(f"\n⚠️ [cleanup] 재로그인 실패 ({account}): {e}")
+            client.close()
+            return None
+
+    def cleanup(self, client_factory, relogin=None):
+        """
+        기록된 항목을 계정별 쿠키로 동시에 삭제
+        client_factory: 새 ApiClient 를 만드는 함수 (계정마다 하나씩)
+        relogin: 계정 → 새 쿠키 리스트 (저장된 쿠키가 만료됐을 때만 호출)
+        반환: {"chat": 삭제 수, "agent": 삭제 수, "missing": 이미 없던 수, "failed": 실패 수, "seconds": 소요 시간}
+        """
+        stats = {"chat": 0, "agent": 0, "missing": 0, "failed": 0, "seconds": 0.0}
+        if not self.entities:
+            return stats
+
+        start = time.perf_counter()
+        accounts = {entity["account"] for entity in self.entities.values()}
+        clients = {account: self._client(client_factory, account, relogin) for account in accounts}
+
+        def delete(key):
+            kind, entity_id = key
+            client = clients.get(self.entities[key]["account"])
+            if client is None:
+                return kind, None
+            try:
+                if kind == "chat":
+                    return kind, client.delete_chat(entity_id)
+                return kind, client.delete_agent(entity_id)
+            except Exception:
+                return kind, None
+
+        try:
+            with ThreadPoolExecutor(max_workers=self.workers) as pool:
+                for kind, deleted in pool.map(delete, list(self.entities)):
+                    if deleted is None:
+                        stats["failed"] += 1
+                    elif deleted:
+                        stats[kind] += 1
+                    else:
+                        stats["missing"] += 1
+        finally:
+            for client in clients.values():
+                if client is not None:
+                    client.close()
+
+        self.entities.clear()
+        stats["seconds"] = time.perf_counter() - start
+        return stats
+
+
+def merge_stats(total, stats):
+    # 워커들은 동시에 정리하므로 소요 시간은 가장 오래 걸린 워커 기준
+    for key, value in stats.items():
+        if key == "seconds":
+            total[key] = max(total.get(key, 0.0), value)
+        else:
+            total[key] = total.get(key, 0) + value
+    return total
+
+
+def format_cleanup(stats):
+    return (
+        f"대화 {stats['chat']}개 / 에이전트 {stats['agent']}개 삭제"
+        f" (이미 없음 {stats['missing']}, 실패 {stats['failed']}) {stats['seconds']:.2f}s"
+    )
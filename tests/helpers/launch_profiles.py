@@ -0,0 +1,50 @@
+"""
+Chrome 실행 프로필 (page load 전략 + 실행 옵션)
+- fidelity (기본): 기존 동작 그대로 - 페이지 이동 시 load 이벤트(이미지 / 폰트 포함)까지 대기
+- fast: DOMContentLoaded 까지만 대기(eager) + 확장 / 백그라운드 네트워크 / 컴포넌트 업데이트 끔
+        + prefers-reduced-motion (CSS 애니메이션을 줄이는 앱이면 메뉴 / 모달 대기 단축)
+        → 요소는 어차피 명시적 대기(WebDriverWait)로 찾으므로 기능 테스트에는 영향 없음
+- 프로필 선택 순서
+    1) 마커: @pytest.mark.launch_profile("fidelity")   ← 리소스 로드 완료가 필요한 테스트
+    2) 환경변수 LAUNCH_PROFILE (기본 fidelity)
+- 브라우저 풀은 프로필별로 따로 재사용 (실행 옵션은 브라우저를 띄운 뒤 바꿀 수 없음)
+"""
+import os
+
+import pytest
+
+LAUNCH_PROFILE = os.getenv("LAUNCH_PROFILE", "fidelity")
+
+LAUNCH_PROFILES = {
+    "fidelity": {
+        "page_load_strategy": "normal",
+        "arguments": (),
+    },
+    "fast": {
+        "page_load_strategy": "eager",
+        "arguments": (
+            "--disable-extensions",
+            "--disable-background-networking",
+            "--disable-component-update",
+            "--force-prefers-reduced-motion",
+        ),
+    },
+}
+
+
+def resolve_launch_profile(item):
+    """테스트 item 에 적용할 실행 프로필 이름 - 마커 우선, 없으면 LAUNCH_PROFILE"""
+    marker = item.get_closest_marker("launch_profile")
+    name = marker.args[0] if marker and marker.args else LAUNCH_PROFILE
+    if name not in LAUNCH_PROFILES:
+        raise pytest.UsageError(f"알 수 없는 실행 프로필: {name} (사용 가능: {', '.join(LAUNCH_PROFILES)})")
+    return name
+
+
+def apply_launch_profile(opts, name):
+    """Chrome Options 에 프로필 적용 후 반환"""
+    profile = LAUNCH_PROFILES[name]
+    opts.page_load_strategy = profile["page_load_strategy"]
+    for argument in profile["arguments"]:
+        opts.add_argument(argument)
+    return opts
@@ -0,0 +1,83 @@
+"""
+네트워크 조건 에뮬레이션 헬퍼 (CDP Network.emulateNetworkConditions)
+- 이름 있는 프로필: offline / slow-3g / fast-3g / high-latency / custom
+    - slow-3g / fast-3g 는 Chrome DevTools 기본 프리셋과 같은 값
+    - custom: download_kbps / upload_kbps / latency_ms 직접 지정 (없으면 NETWORK_CUSTOM="다운,업,지연" 사용)
+- 적용 방법
+    1) 마커: @pytest.mark.network("slow-3g") / @pytest.mark.network("custom", download_kbps=1000, latency_ms=200)
+    2) fixture: network.apply("offline") ... network.reset()   ← 테스트 도중 조건 변경
+    3) 환경변수 NETWORK_PROFILE (기본 none) → 모든 테스트에 적용
+"""
+import os
+
+import pytest
+
+NETWORK_PROFILE = os.getenv("NETWORK_PROFILE", "none")
+NETWORK_CUSTOM = os.getenv("NETWORK_CUSTOM", "")   # "download_kbps,upload_kbps,latency_ms"
+
+# latency: ms, download / upload: bytes/s (-1 = 제한 없음)
+NETWORK_PROFILES = {
+    "none": {"offline": False, "latency": 0, "download": -1, "upload": -1},
+    "offline": {"offline": True, "latency": 0, "download": 0, "upload": 0},
+    "slow-3g": {"offline": False, "latency": 2000, "download": 50_000, "upload": 50_000},
+    "fast-3g": {"offline": False, "latency": 562.5, "download": 180_000, "upload": 84_375},
+    "high-latency": {"offline": False, "latency": 800, "download": -1, "upload": -1},
+}
+
+
+def _kbps(value):
+    return -1 if value is None or value < 0 else value * 1000 / 8
+
+
+def build_conditions(name, download_kbps=None, upload_kbps=None, latency_ms=None):
+    """프로필 이름(+ custom 값) → Network.emulateNetworkConditions 파라미터"""
+    if name == "custom":
+        if download_kbps is None and upload_kbps is None and latency_ms is None and NETWORK_CUSTOM:
+            download_kbps, upload_kbps, latency_ms = (float(v) for v in NETWORK_CUSTOM.split(","))
+        profile = {
+            "offline": False,
+            "latency": latency_ms or 0,
+            "download": _kbps(download_kbps),
+            "upload": _kbps(upload_kbps),
+        }
+    elif name in NETWORK_PROFILES:
+        profile = NETWORK_PROFILES[name]
+    else:
+        raise pytest.UsageError(
+            f"알 수 없는 네트워크 프로필: {name} (사용 가능: {', '.join(NETWORK_PROFILES)}, custom)"
+        )
+
+    return {
+        "offline": profile["offline"],
+        "latency": profile["latency"],
+        "downloadThroughput": profile["download"],
+        "uploadThroughput": profile["upload"],
+    }
+
+
+def resolve_network(item):
+    """테스트 item 에 적용할 (프로필 이름, custom 값 dict) - 마커 우선, 없으면 NETWORK_PROFILE"""
+    marker = item.get_closest_marker("network")
+    if marker and marker.args:
+        return marker.args[0], dict(marker.kwargs)
+    return NETWORK_PROFILE, {}
+
+
+class NetworkEmulator:
+    """드라이버 1개의 현재 탭에 네트워크 조건 적용 / 해제"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        self.profile = "none"
+
+    def apply(self, name, **custom):
+        conditions = build_conditions(name, **custom)
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.emulateNetworkConditions", conditions)
+        self.profile = name
+        print(f"[network] {name}: {conditions}")
+        return conditions
+
+    def reset(self):
+        self.driver.execute_cdp_cmd("Network.emulateNetworkConditions", build_conditions("none"))
+        self.profile = "none"
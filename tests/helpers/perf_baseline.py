@@ -0,0 +1,128 @@
+"""
+성능 측정 결과 저장 / 기준선(baseline) 비교 헬퍼
+- 측정값 리스트 → p50 / p90 / p99 / 평균 요약
+- 로컬 JSON 파일에 측정 이력과 기준선을 저장
+- 기준선 대비 백분위가 허용 비율(threshold) 이상 느려지면 회귀로 판단
+- 기록할 때마다 파일 잠금 안에서 최신 파일을 다시 읽고 병합 → 병렬 실행 워커끼리 이력 / 기준선을 덮어쓰지 않음
+"""
+import json
+import math
+import os
+import time
+from pathlib import Path
+
+from src.utils.file_lock import locked
+
+PERF_BASELINE_FILE = os.getenv("PERF_BASELINE_FILE", "perf_baseline.json")
+PERF_REGRESSION_THRESHOLD = float(os.getenv("PERF_REGRESSION_THRESHOLD", "0.2"))  # 0.2 = 20% 느려지면 실패
+PERF_UPDATE_BASELINE = os.getenv("PERF_UPDATE_BASELINE", "0") == "1"             # 1이면 이번 결과로 기준선 갱신
+PERF_HISTORY_LIMIT = 50                                                           # 측정 항목별 보관할 이력 수
+
+PERCENTILES = ("p50", "p90", "p99")
+
+
+def percentile(values, p):
+    """선형 보간 백분위 (p: 0~100)"""
+    if not values:
+        raise ValueError("측정값이 없습니다.")
+    ordered = sorted(values)
+    k = (len(ordered) - 1) * p / 100
+    lo, hi = math.floor(k), math.ceil(k)
+    if lo == hi:
+        return ordered[lo]
+    return ordered[lo] + (ordered[hi] - ordered[lo]) * (k - lo)
+
+
+def summarize(values):
+    return {
+        "n": len(values),
+        "mean": sum(values) / len(values),
+        "p50": percentile(values, 50),
+        "p90": percentile(values, 90),
+        "p99": percentile(values, 99),
+    }
+
+
+class PerfBaseline:
+    """
+    JSON 파일 구조
+    {
+      "baselines": {"chat.ttft": {"n": 5, "mean": .., "p50": .., "p90": .., "p99": .., "recorded_at": ..}},
+      "history":   {"chat.ttft": [{"recorded_at": .., "p50": .., ...}, ...]}
+    }
+    """
+
+    def __init__(self, path=PERF_BASELINE_FILE, threshold=PERF_REGRESSION_THRESHOLD, update=PERF_UPDATE_BASELINE):
+        self.path = Path(path)
+        self.threshold = threshold
+        self.update = update
+        self.data = self._read()
+
+    def _read(self):
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            data = {}
+        data.setdefault("baselines", {})
+        data.setdefault("history", {})
+        return data
+
+    def record(self, name, values):
+        """
+        측정값 저장 후 (요약, 회귀 메시지 리스트) 반환
+        - 기준선이 없으면 이번 결과가 기준선이 됨
+        """
+        summary = summarize(values)
+        summary["recorded_at"] = time.time()
+
+        with locked(self.path):
+            # 다른 워커가 그 사이 저장한 내용 위에 이번 결과만 더함
+            self.data = self._read()
+            baseline = self.data["baselines"].get(name)
+            regressions = []
+            if baseline:
+                for p in PERCENTILES:
+                    limit = baseline[p] * (1 + self.threshold)
+                    if summary[p] > limit:
+                        regressions.append(
+                            f"[{name}] {p} 회귀: {summary[p]:.3f}s > 기준 {baseline[p]:.3f}s (+{self.threshold:.0%} 허용)"
+                        )
+
+            history = self.data["history"].setdefault(name, [])
+            history.append(summary)
+            del history[:-PERF_HISTORY_LIMIT]
+
+            if baseline is None or self.update:
+                self.data["baselines"][name] = summary
+
+            self._write()
+        return summary, regressions
+
+    def _write(self):
+        # 쓰는 도중 중단돼도 기존 파일이 깨지지 않도록 임시 파일 → 교체 (호출 측에서 잠금)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self.data, ensure_ascii=False, indent=2), encoding="utf-8")
+        os.replace(tmp, self.path)
+
+
+def assert_no_regressions(perf_baseline, metrics):
+    """
+    측정 항목 전체를 먼저 기록한 뒤 회귀를 한 번에 검사
+    metrics: {"측정 이름": [측정값, ...]} → 앞 항목이 회귀여도 뒤 항목의 이력 / 기준선이 빠지지 않음
+    """
+    summaries, regressions = {}, []
+    for name, values in metrics.items():
+        summary, failed = perf_baseline.record(name, values)
+        print(
+            f"[성능] {name}: n={summary['n']} "
+            f"p50={summary['p50']:.3f}s p90={summary['p90']:.3f}s p99={summary['p99']:.3f}s"
+        )
+        summaries[name] = summary
+        regressions.extend(failed)
+    assert not regressions, "\n".join(regressions)
+    return summaries
+
+
+def assert_no_regression(perf_baseline, name, values):
+    """측정값을 기록하고 기준선 대비 회귀가 있으면 실패"""
+    return assert_no_regressions(perf_baseline, {name: values})[name]
@@ -0,0 +1,120 @@
+"""
+요청 차단 프로필 헬퍼 (CDP Network.setBlockedURLs)
+- 테스트 검증과 상관없는 분석/트래킹 스크립트, 웹폰트, 이미지 요청을 막아서 페이지 로드 시간 단축
+- 프로필 선택 순서
+    1) 마커: @pytest.mark.block_requests("lean") / @pytest.mark.block_requests("none")  ← 이미지가 필요한 UI 테스트는 none
+       추가 패턴: @pytest.mark.block_requests("third-party", "*cdn.example.com*")
+    2) 환경변수 REQUEST_BLOCKING (기본 none) + REQUEST_BLOCK_PATTERNS (쉼표 구분 추가 패턴)
+- 차단된 요청은 Chrome performance 로그(Network.loadingFailed, blockedReason=inspector)에서 집계
+  절감 bytes 는 리소스 종류별 평균 크기로 추정한 값
+"""
+import json
+import os
+from urllib.parse import urlsplit
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+
+REQUEST_BLOCKING = os.getenv("REQUEST_BLOCKING", "none")
+REQUEST_BLOCK_PATTERNS = [p.strip() for p in os.getenv("REQUEST_BLOCK_PATTERNS", "").split(",") if p.strip()]
+
+_THIRD_PARTY = (
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*", "*googleadservices.com*",
+    "*facebook.net*", "*connect.facebook.com*", "*hotjar.com*", "*clarity.ms*", "*segment.io*",
+    "*segment.com*", "*amplitude.com*", "*mixpanel.com*", "*sentry.io*", "*browser-intake-datadoghq*",
+    "*channel.io*", "*intercom.io*", "*beusable.net*", "*wcs.naver.net*", "*kakao.com/pixel*",
+)
+_FONTS = ("*fonts.googleapis.com*", "*fonts.gstatic.com*", "*.woff2*", "*.woff*", "*.ttf*", "*.otf*")
+_IMAGES = ("*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.avif*", "*.ico*")
+
+BLOCK_PROFILES = {
+    "none": (),
+    "third-party": _THIRD_PARTY,             # 분석 / 트래킹 / 채팅 위젯
+    "media": _FONTS + _IMAGES,               # 웹폰트 + 이미지 (아바타 포함)
+    "lean": _THIRD_PARTY + _FONTS + _IMAGES,
+}
+
+# 절감량 추정용 리소스 종류별 평균 크기 (bytes, CDP ResourceType 기준)
+_TYPICAL_BYTES = {
+    "Image": 30_000, "Font": 40_000, "Script": 60_000, "Stylesheet": 20_000, "Media": 200_000,
+    "XHR": 2_000, "Fetch": 2_000, "Ping": 300, "Other": 1_000,
+}
+
+
+def resolve_profile(item):
+    """테스트 item 에 적용할 (프로필 이름, URL 패턴 리스트)"""
+    marker = item.get_closest_marker("block_requests")
+    if marker and marker.args:
+        name, extra = marker.args[0], list(marker.args[1:])
+    else:
+        name, extra = REQUEST_BLOCKING, list(REQUEST_BLOCK_PATTERNS)
+
+    if name not in BLOCK_PROFILES:
+        raise pytest.UsageError(f"알 수 없는 요청 차단 프로필: {name} (사용 가능: {', '.join(BLOCK_PROFILES)})")
+    if name == "none":
+        return name, []
+    return name, list(BLOCK_PROFILES[name]) + extra
+
+
+class RequestBlocker:
+    """테스트 1개 동안 드라이버에 차단 패턴 적용 + 차단된 요청 집계"""
+
+    def __init__(self, driver, name, patterns):
+        self.driver = driver
+        self.name = name
+        self.patterns = patterns
+
+    def apply(self):
+        self._drain_log()   # 이전 테스트에서 남은 로그 버리기
+        self.driver.execute_cdp_cmd("Network.enable", {})
+        self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": self.patterns})
+
+    def collect(self):
+        """
+        차단된 요청 집계 후 패턴 해제
+        반환: {"profile": .., "requests": 건수, "bytes": 추정 절감 bytes, "by_type": {종류: 건수}, "by_host": {호스트: 건수}}
+        """
+        urls, blocked = {}, []
+        for entry in self._drain_log():
+            message = json.loads(entry["message"])["message"]
+            params = message.get("params", {})
+            if message.get("method") == "Network.requestWillBeSent":
+                urls[params["requestId"]] = params["request"]["url"]
+            elif message.get("method") == "Network.loadingFailed" and params.get("blockedReason") == "inspector":
+                blocked.append((params.get("type", "Other"), urls.get(params["requestId"])))
+
+        try:
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": []})
+        except WebDriverException:
+            pass
+
+        by_type, by_host = {}, {}
+        for resource_type, url in blocked:
+            by_type[resource_type] = by_type.get(resource_type, 0) + 1
+            host = urlsplit(url).hostname if url else None
+            by_host[host or "?"] = by_host.get(host or "?", 0) + 1
+        return {
+            "profile": self.name,
+            "requests": len(blocked),
+            "bytes": sum(_TYPICAL_BYTES.get(t, _TYPICAL_BYTES["Other"]) for t, _ in blocked),
+            "by_type": by_type,
+            "by_host": by_host,
+        }
+
+    def _drain_log(self):
+        # performance 로그는 드라이버 생성 시 goog:loggingPrefs 를 켠 경우에만 존재
+        if not getattr(self.driver, "_performance_log", False):
+            return []
+        try:
+            return self.driver.get_log("performance")
+        except WebDriverException:
+            return []
+
+
+def format_stats(stats):
+    types = ", ".join(f"{t} {n}" for t, n in sorted(stats["by_type"].items(), key=lambda kv: -kv[1]))
+    return (
+        f"{stats['profile']}: 차단 {stats['requests']}건"
+        + (f" ({types})" if types else "")
+        + f" ≈ {stats['bytes'] / 1024:.0f}KB 절감(추정)"
+    )
@@ -0,0 +1,122 @@
+"""
+브라우저 리소스 모니터 (RESOURCE_MONITOR=1 일 때만, psutil 필요)
+- driver fixture 가 빌려준 브라우저의 chromedriver + Chrome 프로세스 트리(렌더러 / GPU / 유틸리티 포함)의
+  RSS / CPU 를 백그라운드 스레드로 RESOURCE_INTERVAL 초마다 측정
+- 페이지 JS 힙(performance.memory.usedJSHeapSize)은 테스트 시작 / 종료 시점에 메인 스레드에서 측정
+  (모니터 스레드에서 WebDriver 명령을 보내면 테스트 명령과 섞이므로)
+- 테스트별 시작 / 종료 / 최대값과 증가량 기록 → 풀에서 재사용되는 브라우저라면 증가량이 누적되는 테스트 = 누수 의심
+- 최대 RSS 가 RESOURCE_BUDGET_MB 를 넘으면 예산 초과로 표시 (테스트 결과에는 영향 없음)
+"""
+import os
+import threading
+import time
+
+RESOURCE_MONITOR = os.getenv("RESOURCE_MONITOR", "0") == "1"
+RESOURCE_INTERVAL = float(os.getenv("RESOURCE_INTERVAL", "0.5"))
+RESOURCE_BUDGET_MB = float(os.getenv("RESOURCE_BUDGET_MB", "1500"))
+RESOURCE_TOP = int(os.getenv("RESOURCE_TOP", "10"))
+
+_MB = 1_048_576
+
+_HEAP_JS = "return window.performance && performance.memory ? performance.memory.usedJSHeapSize : null;"
+
+
+class ResourceMonitor:
+    """테스트 1개 동안 브라우저 1개의 프로세스 트리를 측정"""
+
+    def __init__(self, driver, interval=RESOURCE_INTERVAL, budget_mb=RESOURCE_BUDGET_MB):
+        # psutil 은 모니터를 켰을 때만 로드
+        import psutil
+
+        self._psutil = psutil
+        self.driver = driver
+        self.interval = interval
+        self.budget_mb = budget_mb
+        self._root = psutil.Process(driver.service.process.pid)   # chromedriver (Chrome 은 그 하위 프로세스)
+        self._procs = {}      # pid → Process (cpu_percent 는 같은 객체로 연속 호출해야 값이 나옴)
+        self._stop = threading.Event()
+        self._thread = None
+        self.samples = []     # [(rss bytes, cpu %, 프로세스 수)]
+
+    def _tree(self):
+        try:
+            procs = [self._root] + self._root.children(recursive=True)
+        except self._psutil.Error:
+            return []
+        alive = {}
+        for proc in procs:
+            alive[proc.pid] = self._procs.get(proc.pid, proc)
+        self._procs = alive
+        return list(alive.values())
+
+    def sample(self):
+        rss, cpu, count = 0, 0.0, 0
+        for proc in self._tree():
+            try:
+                rss += proc.memory_info().rss
+                cpu += proc.cpu_percent(None)
+                count += 1
+            except self._psutil.Error:
+                continue   # 측정 중 종료된 프로세스 (탭 / 렌더러)
+        self.samples.append((rss, cpu, count))
+        return rss, cpu, count
+
+    def _heap(self):
+        try:
+            return self.driver.execute_script(_HEAP_JS)
+        except Exception:
+            return None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.sample()
+
+    def start(self):
+        self.heap_start = self._heap()
+        self.sample()   # 시작값 + cpu_percent 기준점
+        self._thread = threading.Thread(target=self._run, name="resource-monitor", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        측정 종료 → {"rss_start_mb", "rss_end_mb", "rss_peak_mb", "rss_delta_mb", "cpu_peak", "cpu_avg",
+                     "processes_peak", "heap_start_mb", "heap_end_mb", "heap_delta_mb", "over_budget"}
+        """
+        self._stop.set()
+        self._thread.join()
+        self.sample()
+        heap_end = self._heap()
+
+        rss = [s[0] for s in self.samples]
+        cpu = [s[1] for s in self.samples[1:]] or [0.0]   # 첫 cpu_percent 는 기준점이라 항상 0
+        stats = {
+            "rss_start_mb": rss[0] / _MB,
+            "rss_end_mb": rss[-1] / _MB,
+            "rss_peak_mb": max(rss) / _MB,
+            "rss_delta_mb": (rss[-1] - rss[0]) / _MB,
+            "cpu_peak": max(cpu),
+            "cpu_avg": sum(cpu) / len(cpu),
+            "processes_peak": max(s[2] for s in self.samples),
+            "heap_start_mb": self.heap_start / _MB if self.heap_start is not None else None,
+            "heap_end_mb": heap_end / _MB if heap_end is not None else None,
+        }
+        stats["heap_delta_mb"] = (
+            stats["heap_end_mb"] - stats["heap_start_mb"]
+            if stats["heap_start_mb"] is not None and stats["heap_end_mb"] is not None else None
+        )
+        stats["over_budget"] = stats["rss_peak_mb"] > self.budget_mb
+        return stats
+
+
+def format_resources(stats):
+    heap = (
+        f" / JS 힙 {stats['heap_end_mb']:.0f}MB ({stats['heap_delta_mb']:+.0f})"
+        if stats.get("heap_delta_mb") is not None else ""
+    )
+    return (
+        f"RSS 최대 {stats['rss_peak_mb']:.0f}MB (시작 {stats['rss_start_mb']:.0f} → 종료 {stats['rss_end_mb']:.0f}, "
+        f"{stats['rss_delta_mb']:+.0f}) / CPU 최대 {stats['cpu_peak']:.0f}% 평균 {stats['cpu_avg']:.0f}% / "
+        f"프로세스 {stats['processes_peak']}개{heap}"
+        + (" ⚠️ 예산 초과" if stats["over_budget"] else "")
+    )
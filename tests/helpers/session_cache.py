@@ -0,0 +1,123 @@
+"""
+로그인 상태 캐시 헬퍼
+- 계정(AdminAccount)별로 최초 로그인 성공 후 쿠키 + localStorage 를 디스크에 저장
+- 이후 로그인은 저장된 상태를 주입하고 채팅 페이지로 바로 이동 (로그인 폼 생략)
+- 세션이 만료/거부되면 캐시를 지우고 False 반환 → 호출 측에서 로그인 폼으로 fallback
+"""
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from selenium.common.exceptions import TimeoutException, WebDriverException
+from src.utils.lazy_selenium import By, WebDriverWait
+
+# 캐시 사용 여부 / 저장 위치 / 유효 시간(초)
+LOGIN_CACHE_ENABLED = os.getenv("LOGIN_CACHE", "1") == "1"
+LOGIN_CACHE_DIR = os.getenv("LOGIN_CACHE_DIR", ".auth")
+LOGIN_CACHE_TTL = int(os.getenv("LOGIN_CACHE_TTL", "3600"))
+
+# Network.setCookies 가 받는 필드만 남긴다 (getAllCookies 결과에는 size/session 등이 섞여 있음)
+_COOKIE_KEYS = ("name", "value", "domain", "path", "secure", "httpOnly", "sameSite", "expires", "priority")
+
+# 채팅 화면이 실제로 렌더링됐는지 판단하는 요소
+_APP_READY = "textarea:not([aria-hidden='true']), [data-testid='virtuoso-item-list']"
+
+
+class LoginStateCache:
+    """계정별 로그인 상태(쿠키 + localStorage) 디스크 캐시"""
+
+    def __init__(self, cache_dir=LOGIN_CACHE_DIR, ttl=LOGIN_CACHE_TTL):
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+
+    def _path(self, account):
+        # 파일명에 이메일이 그대로 드러나지 않도록 해시 사용
+        key = hashlib.sha1(account.username.encode("utf-8")).hexdigest()[:12]
+        return self.cache_dir / f"{key}.json"
+
+    def load(self, account):
+        """유효한 캐시가 있으면 dict, 없거나 만료됐으면 None"""
+        path = self._path(account)
+        try:
+            state = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        if state.get("expires_at", 0) <= time.time():
+            self.invalidate(account)
+            return None
+        return state
+
+    def save(self, driver, account):
+        """현재 브라우저의 쿠키(전체 도메인) + 현재 origin 의 localStorage 저장"""
+        parts = urlsplit(driver.current_url)
+        cookies = driver.execute_cdp_cmd("Network.getAllCookies", {})["cookies"]
+        local_storage = driver.execute_script("return Object.assign({}, window.localStorage);")
+
+        now = time.time()
+        state = {
+            "saved_at": now,
+            "expires_at": now + self.ttl,
+            "origin": f"{parts.scheme}://{parts.netloc}",
+            "cookies": [
+                {k: c[k] for k in _COOKIE_KEYS if k in c and not (k == "expires" and c.get("session"))}
+                for c in cookies
+            ],
+            "local_storage": local_storage or {},
+        }
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._path(account).write_text(json.dumps(state, ensure_ascii=False), encoding="utf-8")
+        print(f"[로그인 캐시] 저장: {account.description}")
+
+    def invalidate(self, account):
+        try:
+            self._path(account).unlink()
+        except FileNotFoundError:
+            pass
+
+    def restore(self, driver, account, target_url, timeout=15):
+        """
+        캐시된 상태를 주입하고 target_url 로 이동
+        - 성공: True
+        - 캐시 없음 / 세션 거부(로그인 페이지로 리다이렉트): False (캐시 삭제)
+        """
+        state = self.load(account)
+        if not state:
+            return False
+
+        # 1) 쿠키 주입 (도메인 상관없이 한 번에)
+        driver.execute_cdp_cmd("Network.setCookies", {"cookies": state["cookies"]})
+
+        # 2) localStorage 는 페이지 스크립트보다 먼저 들어가야 하므로 새 문서 로드 직전에 주입
+        script = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {
+            "source": (
+                "if (location.origin === %s) {"
+                "  const s = %s;"
+                "  for (const k in s) { try { localStorage.setItem(k, s[k]); } catch (e) {} }"
+                "}" % (json.dumps(state["origin"]), json.dumps(state["local_storage"]))
+            )
+        })
+
+        try:
+            driver.get(target_url)
+            result = WebDriverWait(driver, timeout).until(
+                lambda d: "rejected" if "/accounts/signin" in d.current_url
+                else ("ok" if d.find_elements(By.CSS_SELECTOR, _APP_READY) else False)
+            )
+        except (TimeoutException, WebDriverException):
+            result = "rejected"
+        finally:
+            driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument", {"identifier": script["identifier"]})
+
+        if result != "ok":
+            print(f"⚠️ [로그인 캐시] 세션 거부됨 → 로그인 폼으로 진행: {account.description}")
+            self.invalidate(account)
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+            return False
+
+        print(f"✅ [로그인 캐시] 저장된 세션으로 로그인: {account.description}")
+        return True
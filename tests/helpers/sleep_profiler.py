@@ -0,0 +1,127 @@
+"""
+time.sleep 프로파일러 (pytest 플러그인)
+- 테스트 실행 중 프로젝트 코드에서 호출한 time.sleep 을 가로채 테스트별 / 호출 위치별 누적 시간 기록
+    - WebDriverWait 폴링처럼 라이브러리 내부의 sleep 은 조건 대기이므로 제외
+    - 프로젝트 헬퍼 안의 조건 폴링(스트리밍 응답 감시, 계정 임대 대기 등)도 같은 이유로 제외
+      → CONDITION_POLLS + SLEEP_PROFILE_EXCLUDE ("경로:함수" 쉼표 구분)
+    - 백그라운드 스레드(스탠드인 서버, 아티팩트 저장 등)의 sleep 도 제외
+- 병렬 실행(xdist) 시 워커 측정값은 teardown 리포트의 user_properties 로 컨트롤러에 전달되어 합산
+- 세션 끝에 고정 sleep 총합(분) + 상위 테스트 / 호출 위치 출력
+- time.sleep 을 프로세스 전체에서 교체하므로 SLEEP_PROFILE=1 일 때만 켬
+"""
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+SLEEP_PROFILE = os.getenv("SLEEP_PROFILE", "0") == "1"
+SLEEP_PROFILE_TOP = int(os.getenv("SLEEP_PROFILE_TOP", "10"))   # 리포트에 출력할 상위 개수
+
+# 짧은 간격으로 조건을 확인하며 기다리는 헬퍼 함수 (루트 기준 경로:함수) → 고정 sleep 이 아니므로 집계 제외
+CONDITION_POLLS = {
+    "src/pages/chat_page.py:send_message_stream",
+    "tests/helpers/account_lease.py:acquire",
+}
+CONDITION_POLLS |= {site for site in os.getenv("SLEEP_PROFILE_EXCLUDE", "").split(",") if site}
+
+_PROPERTY = "sleep_profile"
+
+
+def _format_seconds(seconds):
+    minutes, seconds = divmod(seconds, 60)
+    return f"{int(minutes)}분 {seconds:.1f}초" if minutes else f"{seconds:.1f}초"
+
+
+class SleepProfiler:
+    """
+    install() 로 time.sleep 을 교체하고 pytest 플러그인으로 등록해서 사용
+        profiler = SleepProfiler(config.rootpath)
+        profiler.install()
+        config.pluginmanager.register(profiler)
+    """
+
+    def __init__(self, root, top=SLEEP_PROFILE_TOP, exclude=CONDITION_POLLS):
+        self.root = os.path.abspath(root)
+        self.top = top
+        self.exclude = {site.replace("/", os.sep) for site in exclude}
+        self._real_sleep = None
+        self._thread = None
+        self._current = None   # 실행 중인 테스트의 호출 위치 → [횟수, 초]
+        self.by_test = {}      # nodeid → 초
+        self.by_site = {}      # 호출 위치 → [횟수, 초]
+
+    def install(self):
+        self._real_sleep = time.sleep
+        self._thread = threading.current_thread()
+        time.sleep = self._sleep
+
+    def uninstall(self):
+        if self._real_sleep is not None:
+            time.sleep = self._real_sleep
+            self._real_sleep = None
+
+    def _sleep(self, seconds):
+        start = time.perf_counter()
+        try:
+            self._real_sleep(seconds)
+        finally:
+            if self._current is not None and threading.current_thread() is self._thread:
+                site = self._call_site(sys._getframe(1))
+                if site:
+                    entry = self._current.setdefault(site, [0, 0.0])
+                    entry[0] += 1
+                    entry[1] += time.perf_counter() - start
+
+    def _call_site(self, frame):
+        # 프로젝트 밖(site-packages 등) / 조건 폴링 헬퍼에서 호출된 sleep 은 None
+        path = os.path.abspath(frame.f_code.co_filename)
+        if not path.startswith(self.root + os.sep) or f"{os.sep}site-packages{os.sep}" in path:
+            return None
+        relpath = os.path.relpath(path, self.root)
+        if f"{relpath}:{frame.f_code.co_name}" in self.exclude:
+            return None
+        return f"{relpath}:{frame.f_lineno} ({frame.f_code.co_name})"
+
+    # -------------------- pytest 훅 --------------------
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem):
+        self._current = {}
+        yield
+        self._current = None
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_makereport(self, item, call):
+        # teardown 리포트가 만들어지기 직전에 이 테스트의 측정값을 실어 보냄
+        if call.when == "teardown" and self._current:
+            item.user_properties.append((_PROPERTY, dict(self._current)))
+
+    def pytest_runtest_logreport(self, report):
+        if report.when != "teardown":
+            return
+        for name, sites in report.user_properties:
+            if name != _PROPERTY:
+                continue
+            for site, (count, seconds) in sites.items():
+                entry = self.by_site.setdefault(site, [0, 0.0])
+                entry[0] += count
+                entry[1] += seconds
+                self.by_test[report.nodeid] = self.by_test.get(report.nodeid, 0.0) + seconds
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.by_test:
+            return
+        write = terminalreporter.write_line
+        total = sum(self.by_test.values())
+        calls = sum(count for count, _ in self.by_site.values())
+        write(f"[sleep] 고정 sleep 합계 {_format_seconds(total)} (테스트 {len(self.by_test)}개 / 호출 {calls}회)")
+
+        write(f"[sleep] 테스트별 상위 {self.top}")
+        for nodeid, seconds in sorted(self.by_test.items(), key=lambda kv: kv[1], reverse=True)[:self.top]:
+            write(f"  {seconds:8.1f}s  {nodeid}")
+
+        write(f"[sleep] 호출 위치별 상위 {self.top}")
+        for site, (count, seconds) in sorted(self.by_site.items(), key=lambda kv: kv[1][1], reverse=True)[:self.top]:
+            write(f"  {seconds:8.1f}s  {count:4d}회  {site}")
@@ -0,0 +1,171 @@
+# 채팅 성능 벤치마크
+# - BENCH_RUNS 회 반복 측정 → p50 / p90 / p99 를 perf_baseline.json 기준선과 비교
+# - 기본 실행에서는 제외 → pytest tests/performance --benchmark (또는 -m benchmark)
+# - 기준선 갱신: PERF_UPDATE_BASELINE=1 pytest tests/performance --benchmark
+
+# 표준 라이브러리
+import os
+import time
+
+# 서드파티 라이브러리
+import pytest
+from src.utils.lazy_selenium import By, Keys
+
+# 로컬/프로젝트 모듈
+from src.api.seeding import seed_chats, delete_chats, clear_seeded, SEED_KEYWORD
+from src.pages.base_page import BasePage
+from src.pages.chat_page import chat_basic
+from tests.helpers.perf_baseline import assert_no_regression, assert_no_regressions
+
+BENCH_RUNS = int(os.getenv("BENCH_RUNS", "5"))
+
+BENCH_PROMPTS = [
+    "자기소개를 부탁해",
+    "오늘 날씨에 어울리는 점심 메뉴를 추천해줘",
+    "파이썬 리스트와 튜플의 차이를 알려줘",
+]
+
+SEARCH_KEYWORD = "테스트 새 대화"
+
+# 네트워크 프로필별 벤치마크 대상 (쉼표 구분, tests/helpers/network_profiles.py 참고)
+NETWORK_BENCH_PROFILES = os.getenv("NETWORK_BENCH_PROFILES", "fast-3g,slow-3g,high-latency").split(",")
+
+# 사이드바 규모별 벤치마크: API 로 미리 만들 대화 수 (쉼표 구분, 기본은 작은 규모만 - 예: SCALE_SIZES=10,100,1000,5000)
+SCALE_SIZES = [int(n) for n in os.getenv("SCALE_SIZES", "10,100").split(",")]
+SCALE_PREFIX = "[scale]"
+
+
+def _measure_chat(chat, runs):
+    ttfts, totals = [], []
+    for i in range(runs):
+        prompt = BENCH_PROMPTS[i % len(BENCH_PROMPTS)]
+        _, latency = chat.send_message_stream(prompt)
+        assert latency.complete, f"스트리밍이 완료되지 않았습니다: {latency}"
+        ttfts.append(latency.ttft)
+        totals.append(latency.total)
+    return ttfts, totals
+
+
+def _measure_sidebar(driver, page, runs):
+    durations = []
+    for _ in range(runs):
+        driver.refresh()
+        start = time.perf_counter()
+        page.get_chat_list()
+        durations.append(time.perf_counter() - start)
+    return durations
+
+
+def _measure_harvest(driver, page, runs):
+    # 가상 목록을 끝까지 스크롤하며 항목 수집 (iter_chat_list) → (소요 시간 리스트, 마지막 수집 개수)
+    durations, count = [], 0
+    for _ in range(runs):
+        driver.refresh()
+        start = time.perf_counter()
+        count = sum(1 for _ in page.iter_chat_list())
+        durations.append(time.perf_counter() - start)
+    return durations, count
+
+
+def _measure_search(page, runs, keyword=SEARCH_KEYWORD):
+    durations = []
+    for _ in range(runs):
+        page.wait_for_clickable((By.XPATH, "//span[text()='검색']")).click()
+        search_input = page.wait_for_element((By.CSS_SELECTOR, "input[cmdk-input]"))
+        search_input.clear()
+
+        start = time.perf_counter()
+        search_input.send_keys(keyword)
+        page.wait_for_element((By.CSS_SELECTOR, "[cmdk-item]"))
+        durations.append(time.perf_counter() - start)
+
+        # 검색창 닫기
+        search_input.send_keys(Keys.ESCAPE)
+    return durations
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+def test_chat_response_latency_benchmark(driver, login, perf_baseline):
+    # 채팅 응답: 첫 글자까지(TTFT) / 스트리밍 완료까지(total)
+    chat = chat_basic(driver)
+    chat.open_chat(login)
+
+    ttfts, totals = _measure_chat(chat, BENCH_RUNS)
+
+    assert_no_regressions(perf_baseline, {"chat.ttft": ttfts, "chat.total": totals})
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+def test_sidebar_load_benchmark(driver, login, perf_baseline):
+    # 사이드바 대화 목록: 새로고침 → get_chat_list 완료까지
+    driver = login()
+    page = BasePage(driver)
+
+    durations = _measure_sidebar(driver, page, BENCH_RUNS)
+
+    assert_no_regression(perf_baseline, "sidebar.load", durations)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+def test_search_response_benchmark(driver, login, perf_baseline):
+    # 대화 검색: 키워드 입력 → 검색 결과 표시까지
+    driver = login()
+    page = BasePage(driver)
+
+    durations = _measure_search(page, BENCH_RUNS)
+
+    assert_no_regression(perf_baseline, "search.response", durations)
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+@pytest.mark.parametrize("profile", NETWORK_BENCH_PROFILES)
+def test_network_profile_benchmark(driver, login, network, perf_baseline, profile):
+    # 네트워크 프로필별 사이드바 로드 / 검색 응답 / 채팅 응답 (로그인은 정상 네트워크에서)
+    chat = chat_basic(driver)
+    chat.open_chat(login)
+    page = BasePage(driver)
+
+    network.apply(profile)
+
+    load = _measure_sidebar(driver, page, BENCH_RUNS)
+    search = _measure_search(page, BENCH_RUNS)
+    ttfts, totals = _measure_chat(chat, BENCH_RUNS)
+
+    assert_no_regressions(perf_baseline, {
+        f"sidebar.load[{profile}]": load,
+        f"search.response[{profile}]": search,
+        f"chat.ttft[{profile}]": ttfts,
+        f"chat.total[{profile}]": totals,
+    })
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+@pytest.mark.parametrize("size", SCALE_SIZES)
+def test_sidebar_scale_benchmark(driver, login, api, perf_baseline, size):
+    # 대화 수별 사이드바 로드 / 스크롤 수집 / 검색 응답 → 기준선 파일에 [n=대화 수] 별로 기록 (규모별 곡선)
+    driver = login()
+    page = BasePage(driver)
+
+    clear_seeded(api, SCALE_PREFIX)   # 이전 실행이 중간에 끊겨서 남은 데이터 정리
+    seeded = seed_chats(api, size, prefix=SCALE_PREFIX)
+    try:
+        total = api.list_chats(limit=1)[1]
+        print(f"[scale] n={size} (계정 전체 대화 {total}개)")
+
+        load = _measure_sidebar(driver, page, BENCH_RUNS)
+        harvest, harvested = _measure_harvest(driver, page, BENCH_RUNS)
+        search = _measure_search(page, BENCH_RUNS, SEED_KEYWORD)
+    finally:
+        delete_chats(api, [chat["id"] for chat in seeded])
+
+    assert harvested >= size, f"스크롤 수집 항목 수가 생성한 대화 수보다 적음: {harvested} < {size}"
+    assert_no_regressions(perf_baseline, {
+        f"sidebar.load[n={size}]": load,
+        f"sidebar.harvest[n={size}]": harvest,
+        f"search.response[n={size}]": search,
+    })
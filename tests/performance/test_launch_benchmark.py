@@ -0,0 +1,43 @@
+# Chrome 실행 프로필 벤치마크
+# - 프로필별 콜드 스타트(chromedriver + Chrome 실행) / 첫 페이지 이동 시간을 BENCH_RUNS 회 측정
+# - 풀을 거치지 않고 매번 새 브라우저를 띄움 → 기준선: launch.cold_start[프로필] / launch.first_nav[프로필]
+
+# 표준 라이브러리
+import os
+import time
+
+# 서드파티 라이브러리
+import pytest
+
+# 로컬/프로젝트 모듈
+from src.config.settings import SIGNIN_URL
+from tests.helpers.launch_profiles import LAUNCH_PROFILES
+from tests.helpers.perf_baseline import assert_no_regressions
+
+BENCH_RUNS = int(os.getenv("BENCH_RUNS", "5"))
+
+# 측정할 실행 프로필 (쉼표 구분, 기본: 전체)
+LAUNCH_BENCH_PROFILES = os.getenv("LAUNCH_BENCH_PROFILES", ",".join(LAUNCH_PROFILES)).split(",")
+
+
+@pytest.mark.performance
+@pytest.mark.benchmark
+@pytest.mark.parametrize("profile", LAUNCH_BENCH_PROFILES)
+def test_launch_profile_benchmark(new_chrome, perf_baseline, profile):
+    cold_starts, first_navs = [], []
+    for _ in range(BENCH_RUNS):
+        start = time.perf_counter()
+        browser = new_chrome(profile)
+        cold_starts.append(time.perf_counter() - start)
+        try:
+            # page load 전략에 따라 load(fidelity) / DOMContentLoaded(fast) 까지 대기 후 반환
+            start = time.perf_counter()
+            browser.get(SIGNIN_URL)
+            first_navs.append(time.perf_counter() - start)
+        finally:
+            browser.quit()
+
+    assert_no_regressions(perf_baseline, {
+        f"launch.cold_start[{profile}]": cold_starts,
+        f"launch.first_nav[{profile}]": first_navs,
+    })
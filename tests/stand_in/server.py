@@ -0,0 +1,352 @@
+"""
+AI Helpy Chat 로컬 스탠드인 서버
+- 실제 서비스와 같은 셀렉터(virtuoso-item-list, div[role="article"], cmdk-item, textarea, 크레딧 버튼 등)를 가진
+  페이지를 제공해서 네트워크 없이 빠르고 결정적으로 page object 를 실행/측정할 수 있게 한다.
+- 가짜 로그인(/accounts/signin/me), 채팅/에이전트 API(/api/...), 스트리밍 응답(지연 시간 설정 가능) 포함
+
+실행:
+    python -m tests.stand_in.server --port 8765
+    BASE_URL=http://127.0.0.1:8765/ai-helpy-chat pytest tests
+
+(BASE_URL 이 localhost 이고 서버가 떠 있지 않으면 conftest 가 세션 동안 자동으로 띄운다)
+"""
+import argparse
+import itertools
+import json
+import os
+import secrets
+import threading
+import time
+from datetime import datetime, timezone
+from http import HTTPStatus
+from http.cookies import SimpleCookie
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, quote, urlsplit
+
+STATIC_DIR = Path(__file__).resolve().parent / "static"
+
+# 스트리밍 응답 지연 (초)
+FIRST_TOKEN_DELAY = float(os.getenv("STAND_IN_FIRST_TOKEN_DELAY", "0.3"))
+STREAM_DELAY = float(os.getenv("STAND_IN_STREAM_DELAY", "0.05"))
+
+SESSION_COOKIE = "stand_in_session"
+APP_PREFIX = "/ai-helpy-chat"
+
+
+def _now_iso():
+    return datetime.now(timezone.utc).isoformat()
+
+
+class StandInState:
+    """계정별 인메모리 데이터 (서버 재시작 시 초기화)"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.sessions = {}      # 세션 토큰 → username
+        self.users = {}         # username → {"chats": {id: chat}, "agents": {id: agent}}
+        self._ids = itertools.count(1)
+
+    def next_id(self):
+        return str(next(self._ids))
+
+    def user(self, username):
+        with self.lock:
+            return self.users.setdefault(username, {"chats": {}, "agents": {}})
+
+    def login(self, username):
+        token = secrets.token_hex(16)
+        with self.lock:
+            self.sessions[token] = username
+        self.user(username)
+        return token
+
+    def logout(self, token):
+        with self.lock:
+            self.sessions.pop(token, None)
+
+
+def _reply_for(content):
+    """사용자 메시지에 대한 결정적(항상 같은) 응답 텍스트"""
+    return (
+        f"반갑습니다! 저는 스탠드인 Helpy 입니다. '{content}' 에 대한 테스트용 응답을 드릴게요. "
+        "이 응답은 로컬 서버가 일정한 간격으로 나누어 스트리밍합니다."
+    )
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "HelpyStandIn/1.0"
+
+    # ------------------------------------------------------------------ 공통
+
+    @property
+    def state(self):
+        return self.server.state
+
+    def log_message(self, fmt, *args):
+        if self.server.verbose:
+            super().log_message(fmt, *args)
+
+    def _session_token(self):
+        cookie = SimpleCookie(self.headers.get("Cookie", ""))
+        morsel = cookie.get(SESSION_COOKIE)
+        return morsel.value if morsel else None
+
+    def _username(self):
+        return self.state.sessions.get(self._session_token())
+
+    def parse_request(self):
+        self._body_pending = True
+        return super().parse_request()
+
+    def _read_raw_body(self):
+        # 요청마다 본문은 한 번만 읽음 (keep-alive 연결이라 안 읽고 남기면 다음 요청이 깨짐)
+        if not self._body_pending:
+            return b""
+        self._body_pending = False
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send(self, status, body=b"", content_type="text/html; charset=utf-8", headers=None):
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        self._read_raw_body()   # 401 / 404 처럼 본문을 읽기 전에 응답하는 경우 남은 본문 버림
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        for k, v in (headers or {}).items():
+            self.send_header(k, v)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _json(self, data, status=HTTPStatus.OK):
+        self._send(status, json.dumps(data, ensure_ascii=False), "application/json; charset=utf-8")
+
+    def _redirect(self, location, headers=None):
+        self._send(HTTPStatus.FOUND, b"", headers={"Location": location, **(headers or {})})
+
+    def _read_body(self):
+        raw = self._read_raw_body()
+        ctype = self.headers.get("Content-Type", "")
+        if "application/json" in ctype:
+            return json.loads(raw or b"{}")
+        return {k: v[0] for k, v in parse_qs(raw.decode("utf-8")).items()}
+
+    def _static(self, name):
+        return (STATIC_DIR / name).read_text(encoding="utf-8")
+
+    # ------------------------------------------------------------------ 라우팅
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        path, query = parts.path, parse_qs(parts.query)
+
+        if path == "/accounts/signin/me":
+            return self._send(HTTPStatus.OK, self._static("signin.html"))
+        if path.startswith("/api/"):
+            return self._api("GET", path, query)
+        if path == APP_PREFIX or path.startswith(APP_PREFIX + "/") or path.startswith("/admin/"):
+            if not self._username():
+                return self._redirect(f"/accounts/signin/me?continue_to={quote(self.path, safe='')}")
+            return self._send(HTTPStatus.OK, self._static("app.html"))
+        if path == "/":
+            return self._redirect(APP_PREFIX)
+        return self._send(HTTPStatus.NOT_FOUND, "not found", "text/plain; charset=utf-8")
+
+    def do_POST(self):
+        path = urlsplit(self.path).path
+        if path == "/accounts/signin":
+            return self._signin()
+        if path == "/accounts/signout":
+            self.state.logout(self._session_token())
+            return self._redirect(
+                f"/accounts/signin/me?continue_to={quote(APP_PREFIX, safe='')}",
+                {"Set-Cookie": f"{SESSION_COOKIE}=; Path=/; Max-Age=0"},
+            )
+        if path.startswith("/api/"):
+            return self._api("POST", path, {})
+        return self._send(HTTPStatus.NOT_FOUND, "not found", "text/plain; charset=utf-8")
+
+    def do_PATCH(self):
+        self._api("PATCH", urlsplit(self.path).path, {})
+
+    def do_DELETE(self):
+        self._api("DELETE", urlsplit(self.path).path, {})
+
+    # ------------------------------------------------------------------ 로그인
+
+    def _signin(self):
+        form = self._read_body()
+        username = (form.get("username") or "").strip()
+        password = form.get("password") or ""
+        continue_to = form.get("continue_to") or APP_PREFIX
+
+        if not username or not password:
+            return self._redirect(f"/accounts/signin/me?error=1&continue_to={quote(continue_to, safe='')}")
+
+        # 다른 호스트로의 리다이렉트는 막고 경로만 사용
+        target = urlsplit(continue_to)
+        location = target.path or APP_PREFIX
+        if target.query:
+            location += "?" + target.query
+
+        token = self.state.login(username)
+        self._redirect(location, {"Set-Cookie": f"{SESSION_COOKIE}={token}; Path=/; HttpOnly; SameSite=Lax"})
+
+    # ------------------------------------------------------------------ API
+
+    def _api(self, method, path, query):
+        username = self._username()
+        if not username:
+            return self._json({"error": "unauthorized"}, HTTPStatus.UNAUTHORIZED)
+        user = self.state.user(username)
+        segments = [s for s in path.split("/") if s][1:]   # /api/ 제거
+
+        if segments == ["me"] and method == "GET":
+            return self._json({"username": username, "credit": 12345})
+
+        if segments and segments[0] == "chats":
+            return self._chats_api(method, segments[1:], query, user)
+        if segments and segments[0] == "agents":
+            return self._agents_api(method, segments[1:], user)
+        return self._json({"error": "not found"}, HTTPStatus.NOT_FOUND)
+
+    def _chats_api(self, method, rest, query, user):
+        chats = user["chats"]
+
+        # GET /api/chats?q=&offset=&limit=
+        if not rest and method == "GET":
+            keyword = (query.get("q") or [""])[0].strip()
+            offset = int((query.get("offset") or ["0"])[0])
+            limit = int((query.get("limit") or ["50"])[0])
+            with self.state.lock:
+                items = sorted(chats.values(), key=lambda c: c["created_at"], reverse=True)
+            if keyword:
+                items = [c for c in items if keyword in c["title"]]
+            page = [{k: c[k] for k in ("id", "title", "created_at")} for c in items[offset:offset + limit]]
+            return self._json({"items": page, "total": len(items)})
+
+        # POST /api/chats {title, created_at?}
+        if not rest and method == "POST":
+            body = self._read_body()
+            chat = {
+                "id": self.state.next_id(),
+                "title": (body.get("title") or "새 대화")[:100],
+                "created_at": body.get("created_at") or _now_iso(),
+                "messages": [],
+            }
+            with self.state.lock:
+                chats[chat["id"]] = chat
+            return self._json({k: chat[k] for k in ("id", "title", "created_at")}, HTTPStatus.CREATED)
+
+        chat = chats.get(rest[0]) if rest else None
+        if chat is None:
+            return self._json({"error": "chat not found"}, HTTPStatus.NOT_FOUND)
+
+        if len(rest) == 1 and method == "GET":
+            return self._json(chat)
+        if len(rest) == 1 and method == "PATCH":
+            body = self._read_body()
+            chat["title"] = (body.get("title") or chat["title"])[:100]
+            return self._json({k: chat[k] for k in ("id", "title", "created_at")})
+        if len(rest) == 1 and method == "DELETE":
+            with self.state.lock:
+                chats.pop(chat["id"], None)
+            return self._send(HTTPStatus.NO_CONTENT, b"", "text/plain")
+
+        # POST /api/chats/<id>/messages {content} → 응답을 chunked 스트리밍
+        if rest[1:] == ["messages"] and method == "POST":
+            content = self._read_body().get("content", "")
+            chat["messages"].append({"role": "user", "content": content})
+            return self._stream_reply(chat, _reply_for(content))
+
+        return self._json({"error": "not found"}, HTTPStatus.NOT_FOUND)
+
+    def _agents_api(self, method, rest, user):
+        agents = user["agents"]
+        if not rest and method == "GET":
+            return self._json({"items": list(agents.values())})
+        if not rest and method == "POST":
+            body = self._read_body()
+            agent = {"id": self.state.next_id(), "name": body.get("name") or "새 에이전트", "created_at": _now_iso()}
+            agents[agent["id"]] = agent
+            return self._json(agent, HTTPStatus.CREATED)
+        if len(rest) == 1 and method == "DELETE":
+            if agents.pop(rest[0], None) is None:
+                return self._json({"error": "agent not found"}, HTTPStatus.NOT_FOUND)
+            return self._send(HTTPStatus.NO_CONTENT, b"", "text/plain")
+        return self._json({"error": "not found"}, HTTPStatus.NOT_FOUND)
+
+    def _stream_reply(self, chat, text):
+        self._read_raw_body()
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+
+        time.sleep(self.server.first_token_delay)
+        sent = []
+        for word in text.split(" "):
+            piece = (" " if sent else "") + word
+            data = piece.encode("utf-8")
+            self.wfile.write(f"{len(data):X}\r\n".encode() + data + b"\r\n")
+            self.wfile.flush()
+            sent.append(piece)
+            time.sleep(self.server.stream_delay)
+        self.wfile.write(b"0\r\n\r\n")
+
+        chat["messages"].append({"role": "assistant", "content": "".join(sent)})
+
+
+class StandInServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, address, first_token_delay=FIRST_TOKEN_DELAY, stream_delay=STREAM_DELAY, verbose=False):
+        super().__init__(address, StandInHandler)
+        self.state = StandInState()
+        self.first_token_delay = first_token_delay
+        self.stream_delay = stream_delay
+        self.verbose = verbose
+
+
+def start_server(host="127.0.0.1", port=8765, **kwargs):
+    """백그라운드 스레드로 서버 시작 → (server, thread) 반환. 종료: server.shutdown()"""
+    server = StandInServer((host, port), **kwargs)
+    thread = threading.Thread(target=server.serve_forever, name="stand-in-server", daemon=True)
+    thread.start()
+    return server, thread
+
+
+def main():
+    parser = argparse.ArgumentParser(description="AI Helpy Chat 로컬 스탠드인 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--first-token-delay", type=float, default=FIRST_TOKEN_DELAY, help="첫 글자까지 지연(초)")
+    parser.add_argument("--stream-delay", type=float, default=STREAM_DELAY, help="스트리밍 조각 간 지연(초)")
+    parser.add_argument("-v", "--verbose", action="store_true", help="요청 로그 출력")
+    args = parser.parse_args()
+
+    server = StandInServer(
+        (args.host, args.port),
+        first_token_delay=args.first_token_delay,
+        stream_delay=args.stream_delay,
+        verbose=args.verbose,
+    )
+    print(f"스탠드인 서버 실행: http://{args.host}:{args.port}{APP_PREFIX}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
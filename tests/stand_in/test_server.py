@@ -0,0 +1,54 @@
+"""
+스탠드인 서버 자체 테스트 (브라우저 필요 없음)
+"""
+import socket
+
+import pytest
+import requests
+
+from tests.stand_in.server import APP_PREFIX, start_server
+
+
+@pytest.fixture
+def _auto_artifacts_on_fail():
+    # conftest 의 실패 캡처는 브라우저가 필요하므로 이 모듈에서는 끔
+    yield
+
+
+@pytest.fixture(scope="module")
+def server_url():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    server, _ = start_server("127.0.0.1", port)
+    yield f"http://127.0.0.1:{port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_keep_alive_after_unauthorized_post(server_url):
+    # 본문을 읽기 전에 401 로 응답해도 같은 연결의 다음 요청이 깨지지 않아야 함
+    with requests.Session() as session:
+        res = session.post(f"{server_url}/api/chats", json={"title": "x" * 200})
+        assert res.status_code == 401
+
+        res = session.get(f"{server_url}/api/me")
+        assert res.status_code == 401
+        assert res.json() == {"error": "unauthorized"}
+
+
+def test_keep_alive_after_chat_not_found(server_url):
+    with requests.Session() as session:
+        res = session.post(
+            f"{server_url}/accounts/signin",
+            data={"username": "qa@stand-in.local", "password": "pw", "continue_to": APP_PREFIX},
+            allow_redirects=False,
+        )
+        assert res.status_code == 302
+
+        res = session.post(f"{server_url}/api/chats/999999/messages", json={"content": "안녕하세요"})
+        assert res.status_code == 404
+
+        res = session.get(f"{server_url}/api/me")
+        assert res.status_code == 200
+        assert res.json()["username"] == "qa@stand-in.local"